@@ -7,3 +7,5 @@ from .protocols import Protocols
 from .zwave_network_analyzer import ZwaveNetLyzer
 from .feature_extractor import FeatureExtractor
 from .config_loader import ConfigLoader
+from .api import extract_features, extract_feature_matrix
+from .feature_matrix import FeatureMatrix
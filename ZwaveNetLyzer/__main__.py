@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
 import argparse
+import logging
+import sys
 from .zwave_network_analyzer import ZwaveNetLyzer
 
 def args_parser() -> argparse.ArgumentParser:
@@ -19,6 +21,7 @@ def args_parser() -> argparse.ArgumentParser:
 def main() -> None:
     """The main function of the program."""
     parsed_args = args_parser().parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     config_file_address = "./ZwaveNetLyzer/config.json" if parsed_args.config_file is None else parsed_args.config_file
     zwave_network_analyzer = ZwaveNetLyzer(config_file_address)
     zwave_network_analyzer.run()
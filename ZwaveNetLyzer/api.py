@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+import warnings
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Sequence, Union
+
+from .config_loader import ZwaveConfigLoader
+from .feature_extractor import FeatureExtractor
+from .feature_matrix import FeatureMatrix
+from .flow_capturer import ZwaveFlowCapturer
+from .flow_capturer.csv_packet_reader import ZNIFFER_COLUMNS
+
+
+def iterate_raw_packets(rows: Iterable, columns: Sequence[str] = None) -> Iterator[dict]:
+    """
+    Converts rows of any supported shape into the raw packet dictionaries read from Zniffer CSV files.
+
+    Args:
+        rows (Iterable): Row dictionaries keyed by the Zniffer column names, row tuples or lists
+            whose values follow 'columns', or columnar batches, i.e. dictionaries that map each
+            column name to a sequence of values. The shapes can be mixed.
+        columns (Sequence[str]): The column names of row tuples. Defaults to ZNIFFER_COLUMNS.
+
+    Yields:
+        dict: A raw packet for each row.
+    """
+    columns = list(columns) if columns is not None else ZNIFFER_COLUMNS
+    for row in rows:
+        if isinstance(row, dict):
+            first_value = next(iter(row.values()), None)
+            if first_value is not None and not isinstance(first_value, str) and hasattr(first_value, "__len__"):
+                batch_columns = list(row.keys())
+                for values in zip(*row.values()):
+                    yield with_api_type(dict(zip(batch_columns, values)))
+            else:
+                yield with_api_type(row)
+        else:
+            yield with_api_type(dict(zip(columns, row)))
+
+
+def with_api_type(raw_packet: dict) -> dict:
+    """Marks a raw packet without an ApiType column as a Zniffer packet."""
+    if "ApiType" in raw_packet:
+        return raw_packet
+    return {**raw_packet, "ApiType": "Zniffer"}
+
+
+def extract_features(rows: Iterable, columns: Sequence[str] = None, batch_size: int = 1000,
+                     progress_callback: Callable[[int, int], None] = None, output: str = "records",
+                     dtype: str = "float64", **options) -> Iterator[Union[dict, FeatureMatrix]]:
+    """
+    Captures the flows of the given rows and yields their feature records as soon as the flows end.
+    With output="matrix", the flows that end within each batch of rows are yielded together as a
+    FeatureMatrix instead, with unformatted numeric values.
+
+    Nothing is read from or written to files, and progress is reported through the
+    'ZwaveNetLyzer' loggers and 'progress_callback' rather than printed. The records are the
+    rows that the command line writes to its output file, in the same order.
+
+    If 'snapshot_interval_packets' or 'snapshot_interval_seconds' is set, the snapshots of the
+    open flows taken within each batch of rows are yielded before the flows that end in it. They
+    have a "snapshot_timestamp" and the "snapshot" termination reason, and are only available
+    with output="records".
+
+    Args:
+        rows (Iterable): The rows of a Zniffer capture, in timestamp order. See 'iterate_raw_packets'
+            for the supported shapes.
+        columns (Sequence[str]): The column names of row tuples. Defaults to ZNIFFER_COLUMNS.
+        batch_size (int): The number of rows read between two extractions of the finished flows.
+        progress_callback (Callable[[int, int], None]): Called with the numbers of processed packets
+            and created flows every 'read_packets_count_value_log_info' packets.
+        output (str): "records" to yield a dictionary per flow, "matrix" to yield FeatureMatrix objects.
+        dtype (str): The float type of the numeric matrix in the "matrix" output, "float64" or "float32".
+        **options: Any attribute of ZwaveConfigLoader, e.g. zwave_activity_timeout=300 or
+            features_ignore_list=["duration"].
+
+    Yields:
+        dict or FeatureMatrix: The features of each flow, or of the flows of a batch.
+
+    Raises:
+        TypeError: If an option is not a configuration attribute.
+    """
+    if output not in ("records", "matrix"):
+        raise Exception(f"Unknown output: {output}. Please use 'records' or 'matrix'.")
+    zwave_config = ZwaveConfigLoader(**options)
+    if output == "matrix" and (zwave_config.snapshot_interval_packets or zwave_config.snapshot_interval_seconds):
+        raise Exception("Snapshots of open flows are only available with output='records'.")
+    flow_capturer = ZwaveFlowCapturer(zwave_config=zwave_config)
+    flow_capturer.progress_callback = progress_callback
+    if zwave_config.flow_state_input_file is not None:
+        flow_capturer.load_state(zwave_config.flow_state_input_file)
+
+    def extract_finished_flows() -> Iterator[Union[dict, FeatureMatrix]]:
+        if output == "matrix":
+            if flow_capturer.finished_flows:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    yield FeatureExtractor.execute_matrix(flows=flow_capturer.finished_flows,
+                                                          features_ignore_list=zwave_config.features_ignore_list,
+                                                          label=zwave_config.label,
+                                                          feature_families=zwave_config.feature_families,
+                                                          dtype=dtype)
+                flow_capturer.finished_flows = []
+            return
+        flow_snapshotter = flow_capturer.flow_snapshotter
+        if flow_snapshotter is not None:
+            for protocol in flow_snapshotter.snapshots.keys():
+                yield from flow_snapshotter.snapshots[protocol]
+            flow_snapshotter.snapshots = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            data = FeatureExtractor.execute(flows=flow_capturer.finished_flows,
+                                            floating_point_unit=zwave_config.floating_point_unit,
+                                            features_ignore_list=zwave_config.features_ignore_list,
+                                            label=zwave_config.label,
+                                            feature_families=zwave_config.feature_families)
+        flow_capturer.finished_flows = []
+        for protocol in data.keys():
+            yield from data[protocol]
+
+    raw_packets = iterate_raw_packets(rows, columns)
+    while True:
+        batch = list(islice(raw_packets, batch_size))
+        if not batch:
+            break
+        flow_capturer.process_packets(batch, flush_ongoing_flows=False)
+        yield from extract_finished_flows()
+    flow_capturer.finish_capture()
+    yield from extract_finished_flows()
+
+
+def extract_feature_matrix(rows: Iterable, columns: Sequence[str] = None, batch_size: int = 10000,
+                           progress_callback: Callable[[int, int], None] = None, dtype: str = "float64",
+                           **options) -> FeatureMatrix:
+    """
+    Captures the flows of the given rows and returns the features of every flow as one FeatureMatrix.
+
+    Args:
+        rows (Iterable): The rows of a Zniffer capture, in timestamp order.
+        columns (Sequence[str]): The column names of row tuples. Defaults to ZNIFFER_COLUMNS.
+        batch_size (int): The number of rows read between two extractions of the finished flows.
+        progress_callback (Callable[[int, int], None]): See 'extract_features'.
+        dtype (str): The float type of the numeric matrix, "float64" or "float32".
+        **options: Any attribute of ZwaveConfigLoader.
+
+    Returns:
+        FeatureMatrix: The features of every flow, in the order of the CSV output.
+    """
+    matrices = list(extract_features(rows, columns=columns, batch_size=batch_size,
+                                     progress_callback=progress_callback, output="matrix", dtype=dtype, **options))
+    if not matrices:
+        return FeatureExtractor.execute_matrix(flows=[], features_ignore_list=options.get("features_ignore_list", []),
+                                               feature_families=options.get("feature_families"), dtype=dtype)
+    return FeatureMatrix.concatenate(matrices)
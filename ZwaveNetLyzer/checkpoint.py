@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+
+
+class Checkpoint:
+    """
+    Saves and restores the progress of a long-running extraction.
+
+    A checkpoint records the input file and byte offset to continue reading from, the
+    serialized open flow table of the flow capturer and the size of the output file at
+    that moment, so that a restarted run can truncate the output and carry on exactly
+    where the checkpoint was taken.
+
+    Attributes:
+        checkpoint_file_address (str): The file the checkpoint is kept in.
+    """
+
+    def __init__(self, checkpoint_file_address: str):
+        self.checkpoint_file_address = checkpoint_file_address
+
+    def exists(self) -> bool:
+        """Checks whether a checkpoint has been saved."""
+        return os.path.isfile(self.checkpoint_file_address)
+
+    def load(self) -> dict:
+        """
+        Loads the saved checkpoint.
+
+        Returns:
+            dict: The saved checkpoint.
+        """
+        with open(self.checkpoint_file_address, 'rb') as checkpoint_file:
+            return pickle.load(checkpoint_file)
+
+    def save(self, checkpoint: dict) -> None:
+        """
+        Saves the checkpoint. It is written to a temporary file first, so a crash while saving
+        leaves the previous checkpoint intact.
+
+        Args:
+            checkpoint (dict): The checkpoint to save.
+        """
+        temporary_file_address = f"{self.checkpoint_file_address}.tmp"
+        with open(temporary_file_address, 'wb') as checkpoint_file:
+            pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file_address, self.checkpoint_file_address)
+
+    def remove(self) -> None:
+        """Removes the checkpoint once the extraction has finished."""
+        if self.exists():
+            os.remove(self.checkpoint_file_address)
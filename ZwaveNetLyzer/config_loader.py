@@ -1,24 +1,144 @@
 #!/usr/bin/env python3
 
+import glob
 import json
+import logging
+import os
+from typing import List
+
+logger = logging.getLogger(__name__)
 
 class ConfigLoader:
 
     """
-    This class loads the configuration from a JSON file.
+    This class loads the configuration from a JSON file and/or keyword options.
 
     Attributes:
     -----------
     config_file_address : str
-        The address of the configuration file.
-    input_file_address : str
-        The address of the pcap file.
+        The address of the configuration file. If None, only the default values
+        and the keyword options are used.
+    input_file_address : str or list
+        The address of the input file. It can also be a directory, a glob pattern
+        (e.g. "captures/*.csv") or a list of any of these.
     output_file_path : str
         The address of the output CSV file.
+    output_mode : str
+        How to write the results of several input files: "combined" writes every
+        flow to output_file_address, "per_file" writes one output file per input file.
+    input_files_mode : str
+        How several input files relate to each other. "independent" treats each
+        file as a separate capture. "stitch" reads the files in order as one capture,
+        so flows that cross a file boundary are not cut in two. "merge" reads the
+        files of several sniffers that listened at the same time as one capture,
+        merging their rows in timestamp order and tagging each packet with the index
+        of its file.
+    number_of_workers : int
+        The number of worker processes used to analyze independent input files.
+    flow_state_input_file : str
+        A flow table saved by a previous run whose open flows continue in this run.
+    flow_state_output_file : str
+        If given, the flows that are still open at the end of the input are saved to
+        this file instead of being finished, so that a later run can continue them.
+    max_packets_per_flow : int
+        The maximum number of packets of a flow. When a flow reaches it, the flow ends
+        and the next packet starts a new flow with the same key. 0 means no limit.
+    max_ongoing_flows : int
+        The maximum number of flows kept open at the same time. 0 means no limit.
+    max_flow_table_bytes : int
+        The approximate memory budget, in bytes, of the open flows, checked against an
+        estimate of their size (see the README). 0 means no limit.
+    flow_eviction_policy : str
+        Which flow to evict when the flow table is full: "lru" (least recently
+        updated) or "oldest" (earliest created). Other values are an error.
+    checkpoint_file : str
+        If given, the progress of the run is saved to this file every checkpoint_interval
+        packets, and a restarted run resumes from it.
+    checkpoint_interval : int
+        The number of packets read between two checkpoints.
+    flow_store_output_file : str
+        If given, the assembled flows are saved to this file so that their features
+        can be extracted again later without reading the input.
+    flow_store_input_file : str or list
+        A flow store, or a list of flow stores, saved by flow_store_output_file. If
+        given, the features of its flows are extracted and the input files are not read.
+    filter_home_ids : list
+        If given, only the packets of these HomeId values are analyzed. This and the
+        other filters are checked on the raw rows, before packets are created.
+    filter_node_ids : list
+        If given, only the packets whose Source or Destination is one of these
+        node ids are analyzed.
+    filter_start_time : str
+        If given, the packets before this "YYYY-MM-DD HH:MM:SS.ffffff" timestamp
+        (or a prefix of it, e.g. "2024-01-01 10:00") are skipped.
+    filter_end_time : str
+        If given, the packets from this timestamp on are skipped.
+    filter_channels : list
+        If given, only the packets of these channels are analyzed.
+    filter_frame_types : list
+        If given, only the packets with these frame types (the Data column, e.g.
+        "SINGLECAST") are analyzed.
+    max_packet_lateness : float
+        If greater than 0, packets are held for up to this many seconds and released
+        in timestamp order, so that packets of an input that is slightly out of order
+        are put back in order. Packets that arrive later than that are dropped.
+    duplicate_window : float
+        If greater than 0, a packet with the same HomeId, source, destination and
+        hex data as a packet kept at most this many seconds before or after it is
+        dropped, as a copy of the same frame captured by another sniffer.
+    window_mode : str
+        If given, the features of every flow are emitted for each time window instead
+        of once when the flow ends, and the flow timeouts and limits do not apply.
+        "tumbling" emits a row per flow with packets in each window of window_size
+        seconds. "sliding" emits, every window_slide seconds, a row per flow with
+        packets in the last window_size seconds.
+    window_size : float
+        The length of a window in seconds.
+    window_slide : float
+        The time between two sliding windows in seconds, at most window_size.
+    snapshot_interval_packets : int
+        If greater than 0, a snapshot of the features of each open flow is taken every
+        this many packets of the flow. The snapshots are computed from running counts,
+        sums and value counts of each flow, so they cost time proportional to the new
+        packets, and only the features that can be computed that way are included.
+    snapshot_interval_seconds : float
+        If greater than 0, a snapshot of each open flow is taken when a packet arrives
+        at least this many seconds after its first packet or its previous snapshot.
+    snapshot_output_file : str
+        The CSV file the snapshots are written to by the command line.
+    statistics_mode : str
+        "exact", or "approximate" to compute the medians and the modes of the speeds,
+        RSSI values, lengths and time deltas of the snapshots of open flows from
+        sketches of sketch_size values, so that their running statistics stay bounded
+        however long the flow is. They are exact for series of up to sketch_size values;
+        see the README for the error bounds beyond that. The features of finished flows
+        are always exact.
+    sketch_size : int
+        The size of the quantile and heavy hitters sketches of the approximate
+        statistics mode. The error shrinks in proportion to 1 / sketch_size.
+    flow_sampling_rate : float
+        The fraction of flows to analyze, between 0 and 1. A flow is kept if a hash of
+        its HomeId and its two node ids, in either direction, falls under the rate, so
+        every flow between the same two nodes is kept or skipped together and the same
+        flows are kept in every run. 1 analyzes every flow.
+    flow_sampling_seed : int
+        Changes which flows flow_sampling_rate keeps.
+    packet_sampling_interval : int
+        If N is greater than 1, only one in N packets of the capture is analyzed, and
+        the counts, sums and rates of packets and bytes of each flow are multiplied by
+        N to estimate those of the full capture.
+    sweep : list
+        A parameter sweep: a list of dictionaries of options, e.g.
+        [{"zwave_activity_timeout": 300}, {"zwave_activity_timeout": 600}]. The input is
+        parsed once and its flows are assembled and extracted once per dictionary, with
+        one output file per dictionary.
     floating_point_unit : str
         The unit for floating point values.
     features_ignore_list : list
         The list of features to be ignored.
+    feature_families : list
+        The feature families to extract, among "header_related", "len_related",
+        "rate_related" and "time_related". None extracts every family.
     label : str
         The label for the output file.
     read_packets_count_value_log_info : int
@@ -27,16 +147,52 @@ class ConfigLoader:
         The maximum number of rows for the output file.
     """
 
-    def __init__(self, config_file_address: str):
+    def __init__(self, config_file_address: str = None, **options):
         self.config_file_address = config_file_address
         self.input_file_address: str = None
         self.output_file_address: str = "./"
+        self.output_mode: str = "combined"
+        self.input_files_mode: str = "independent"
+        self.number_of_workers: int = 1
+        self.flow_state_input_file: str = None
+        self.flow_state_output_file: str = None
+        self.max_packets_per_flow: int = 0
+        self.max_ongoing_flows: int = 0
+        self.max_flow_table_bytes: int = 0
+        self.flow_eviction_policy: str = "lru"
+        self.checkpoint_file: str = None
+        self.checkpoint_interval: int = 100000
+        self.flow_store_output_file: str = None
+        self.flow_store_input_file: str = None
+        self.filter_home_ids: list = None
+        self.filter_node_ids: list = None
+        self.filter_start_time: str = None
+        self.filter_end_time: str = None
+        self.filter_channels: list = None
+        self.filter_frame_types: list = None
+        self.max_packet_lateness: float = 0
+        self.duplicate_window: float = 0
+        self.window_mode: str = None
+        self.window_size: float = 60
+        self.window_slide: float = 10
+        self.snapshot_interval_packets: int = 0
+        self.snapshot_interval_seconds: float = 0
+        self.snapshot_output_file: str = None
+        self.statistics_mode: str = "exact"
+        self.sketch_size: int = 200
+        self.flow_sampling_rate: float = 1.0
+        self.flow_sampling_seed: int = 0
+        self.packet_sampling_interval: int = 1
+        self.sweep: list = None
         self.floating_point_unit: str = ".4f"
         self.features_ignore_list: list = []
+        self.feature_families: list = None
         self.label = "Unknown"
         self.read_packets_count_value_log_info = 10000
         self.max_rows_number = 800000
-        self.read_config_file()
+        if config_file_address is not None:
+            self.read_config_file()
+        self.set_options(**options)
 
     def read_config_file(self) -> None:
         """
@@ -46,15 +202,129 @@ class ConfigLoader:
             with open(self.config_file_address) as config_file:
                 for key, value in json.loads(config_file.read()).items():
                     setattr(self, key, value)
-                if self.input_file_address is None:
+                if self.input_file_address is None and self.flow_store_input_file is None:
                     raise Exception("Please specify the 'input_file_address' in the config file.")
         except Exception as error:
-            print(f"Error reading {self.config_file_address}: {str(error)}. "\
+            logger.warning(f"Error reading {self.config_file_address}: {str(error)}. "\
                     "Default values will be used.")
 
+    def set_options(self, **options) -> None:
+        """
+        Sets configuration attributes from keyword options, which take precedence over the
+        configuration file.
+
+        Raises:
+            TypeError: If an option is not a configuration attribute.
+        """
+        for key, value in options.items():
+            if not hasattr(self, key):
+                raise TypeError(f"Unknown configuration option: {key}")
+            setattr(self, key, value)
+
+    def get_sweep_output_file_address(self, sweep_options: dict) -> str:
+        """
+        Gets the output file address of one configuration of a parameter sweep, by appending
+        its options to 'output_file_address', e.g. "output_zwave_activity_timeout-300.csv".
+
+        Args:
+            sweep_options (dict): The options of the configuration.
+
+        Returns:
+            str: The address of the output file.
+        """
+        output_root, output_extension = os.path.splitext(self.output_file_address)
+        suffix = "_".join(f"{key}-{value}" for key, value in sweep_options.items())
+        return f"{output_root}_{suffix}{output_extension or '.csv'}"
+
+    def get_input_files(self) -> List[str]:
+        """
+        Expands 'input_file_address' into the list of input files to analyze.
+
+        Directories are expanded to the CSV files they contain and glob patterns to the
+        files they match, both in sorted order so that hourly-rotated captures keep their
+        chronological order.
+
+        Returns:
+            List[str]: The addresses of the input files.
+        """
+        addresses = self.input_file_address
+        if addresses is None:
+            return []
+        if isinstance(addresses, str):
+            addresses = [addresses]
+
+        input_files = []
+        for address in addresses:
+            if os.path.isdir(address):
+                input_files.extend(sorted(glob.glob(os.path.join(address, "*.csv"))))
+            elif glob.has_magic(address):
+                input_files.extend(sorted(path for path in glob.glob(address) if os.path.isfile(path)))
+            else:
+                input_files.append(address)
+        return input_files
+
+    def get_input_names(self, input_files: List[str] = None) -> List[str]:
+        """
+        Gets a name for each input file that tells it apart from the others, to name the files
+        written for it. The name is the path of the file relative to the deepest directory that
+        contains every input file, without its extension and with "_" between the directories,
+        e.g. "home1_00" and "home2_00" for "captures/home1/00.csv" and "captures/home2/00.csv",
+        or just "00" when the files are in the same directory.
+
+        Args:
+            input_files (List[str]): The addresses of the input files. Defaults to get_input_files().
+
+        Returns:
+            List[str]: The name of each input file, in the same order.
+
+        Raises:
+            Exception: If two input files get the same name, e.g. when a file is given twice.
+        """
+        if input_files is None:
+            input_files = self.get_input_files()
+        if len(input_files) == 0:
+            return []
+        input_paths = [os.path.abspath(input_file) for input_file in input_files]
+        input_root = os.path.commonpath([os.path.dirname(input_path) for input_path in input_paths])
+        input_names = [os.path.splitext(os.path.relpath(input_path, input_root))[0].replace(os.sep, "_")
+                       for input_path in input_paths]
+        if len(set(input_names)) != len(input_names):
+            duplicate_names = sorted({input_name for input_name in input_names if input_names.count(input_name) > 1})
+            raise Exception(f"Several input files are named {', '.join(duplicate_names)}, so their output files "
+                            "would overwrite each other. Please give each input file once.")
+        return input_names
+
+    def get_output_file_address(self, input_file_address: str = None, input_name: str = None) -> str:
+        """
+        Gets the output file address for the given input file.
+
+        In the "combined" output mode every input file shares 'output_file_address'. In the
+        "per_file" mode the name of the input file is appended to it, or it is used as the
+        output directory if it is one.
+
+        Args:
+            input_file_address (str): The address of the input file.
+            input_name (str): The name of the input file given by get_input_names. Defaults to
+                its name among the configured input files.
+
+        Returns:
+            str: The address of the output file.
+        """
+        if self.output_mode != "per_file" or input_file_address is None:
+            return self.output_file_address
+        if input_name is None:
+            input_files = self.get_input_files()
+            if input_file_address not in input_files:
+                input_files = [input_file_address]
+            input_name = self.get_input_names(input_files)[input_files.index(input_file_address)]
+        if os.path.isdir(self.output_file_address):
+            return os.path.join(self.output_file_address, f"{input_name}.csv")
+        output_root, output_extension = os.path.splitext(self.output_file_address)
+        return f"{output_root}_{input_name}{output_extension or '.csv'}"
+
 
 class ZwaveConfigLoader(ConfigLoader):
-    def __init__(self, zwave_config_file_address: str):
+    def __init__(self, zwave_config_file_address: str = None, **options):
         """
             This class loads the Zwave configuration from a JSON file.
 
@@ -68,4 +338,4 @@ class ZwaveConfigLoader(ConfigLoader):
         """
         self.max_zwave_flow_duration: int = 1200
         self.zwave_activity_timeout: int = 600
-        super().__init__(zwave_config_file_address)
+        super().__init__(zwave_config_file_address, **options)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import math
+import warnings
+from typing import Callable, Dict, List, Tuple
+
+from .config_loader import ZwaveConfigLoader
+from .feature_extractor import FeatureExtractor
+from .flow_capturer import Flow, ZwaveFlowCapturer
+from .zwave_network_analyzer import write_data
+
+
+ENGINES: Dict[str, Callable] = {
+    "reference": FeatureExtractor.execute,
+}
+
+KEY_COLUMNS = ["flow_id", "timestamp", "protocol"]
+
+
+def register_engine(name: str, engine: Callable) -> None:
+    """
+    Registers an extraction engine so that it can be compared with the reference one.
+
+    Args:
+        name (str): The name of the engine.
+        engine (Callable): A function with the signature of FeatureExtractor.execute.
+    """
+    ENGINES[name] = engine
+
+
+class DifferentialReport:
+    """
+    The differences between the rows extracted by a reference and a candidate engine.
+
+    Attributes:
+        candidate_name (str): The name of the compared engine.
+        rows_compared (int): The number of rows compared.
+        row_count_difference (int): The number of candidate rows minus the number of reference rows.
+        key_mismatches (int): The number of rows whose flow_id, timestamp or protocol differ.
+        missing_columns (List[str]): The reference columns that the candidate does not have.
+        extra_columns (List[str]): The candidate columns that the reference does not have.
+        mismatches (Dict[str, int]): The number of mismatching values of each column.
+        max_differences (Dict[str, float]): The largest absolute difference of each numeric column.
+        examples (Dict[str, list]): The first mismatching (row, reference, candidate) values of each column.
+    """
+
+    MAX_EXAMPLES = 3
+
+    def __init__(self, candidate_name: str):
+        self.candidate_name = candidate_name
+        self.rows_compared = 0
+        self.row_count_difference = 0
+        self.key_mismatches = 0
+        self.missing_columns: List[str] = []
+        self.extra_columns: List[str] = []
+        self.mismatches: Dict[str, int] = {}
+        self.max_differences: Dict[str, float] = {}
+        self.examples: Dict[str, list] = {}
+
+    def add_mismatch(self, column: str, row_index: int, reference, candidate, difference: float = None) -> None:
+        self.mismatches[column] = self.mismatches.get(column, 0) + 1
+        if difference is not None:
+            self.max_differences[column] = max(self.max_differences.get(column, 0.0), difference)
+        column_examples = self.examples.setdefault(column, [])
+        if len(column_examples) < self.MAX_EXAMPLES:
+            column_examples.append((row_index, reference, candidate))
+
+    def is_equal(self) -> bool:
+        """Checks whether the candidate reproduced the reference within the tolerances."""
+        return self.row_count_difference == 0 and self.key_mismatches == 0 and not self.missing_columns \
+            and not self.extra_columns and not self.mismatches
+
+    def summary(self) -> str:
+        """Gets a human-readable description of the differences."""
+        if self.is_equal():
+            return f">> {self.candidate_name}: {self.rows_compared} rows match the reference."
+        lines = [f">> {self.candidate_name}: differences in {self.rows_compared} compared rows"]
+        if self.row_count_difference != 0:
+            lines.append(f"   row count differs by {self.row_count_difference:+d}")
+        if self.key_mismatches != 0:
+            lines.append(f"   {self.key_mismatches} rows have a different flow_id, timestamp or protocol")
+        if self.missing_columns:
+            lines.append(f"   missing columns: {', '.join(self.missing_columns)}")
+        if self.extra_columns:
+            lines.append(f"   extra columns: {', '.join(self.extra_columns)}")
+        for column, count in sorted(self.mismatches.items(), key=lambda item: -item[1]):
+            max_difference = f", max difference {self.max_differences[column]:.6g}" \
+                if column in self.max_differences else ""
+            examples = "; ".join(f"row {row}: {reference!r} != {candidate!r}"
+                                 for row, reference, candidate in self.examples[column])
+            lines.append(f"   {column}: {count} mismatches{max_difference} ({examples})")
+        return "\n".join(lines)
+
+
+def values_match(reference, candidate, relative_tolerance: float, absolute_tolerance: float) -> Tuple[bool, float]:
+    """
+    Compares two extracted values. Values that both parse as numbers are compared within the
+    tolerances, with NaN equal to NaN; any other values are compared as strings.
+
+    Returns:
+        Tuple[bool, float]: Whether the values match, and their absolute difference if both are numbers.
+    """
+    reference, candidate = str(reference), str(candidate)
+    if reference == candidate:
+        return True, None
+    try:
+        reference_number, candidate_number = float(reference), float(candidate)
+    except ValueError:
+        return False, None
+    if math.isnan(reference_number) or math.isnan(candidate_number):
+        return math.isnan(reference_number) and math.isnan(candidate_number), None
+    if math.isinf(reference_number) or math.isinf(candidate_number):
+        return reference_number == candidate_number, None
+    difference = abs(reference_number - candidate_number)
+    return math.isclose(reference_number, candidate_number, rel_tol=relative_tolerance,
+                        abs_tol=absolute_tolerance), difference
+
+
+def compare_rows(reference_rows: List[dict], candidate_rows: List[dict], candidate_name: str = "candidate",
+                 relative_tolerance: float = 0.0, absolute_tolerance: float = 0.0,
+                 column_tolerances: Dict[str, Tuple[float, float]] = None) -> DifferentialReport:
+    """
+    Compares the rows of a candidate engine with the rows of the reference engine, in order.
+
+    Args:
+        reference_rows (List[dict]): The reference rows.
+        candidate_rows (List[dict]): The candidate rows.
+        candidate_name (str): The name of the candidate engine in the report.
+        relative_tolerance (float): The accepted relative difference of numeric values.
+        absolute_tolerance (float): The accepted absolute difference of numeric values.
+        column_tolerances (Dict[str, Tuple[float, float]]): The (relative, absolute) tolerances of
+            specific columns, overriding the default ones.
+
+    Returns:
+        DifferentialReport: The differences between the rows.
+    """
+    column_tolerances = column_tolerances or {}
+    report = DifferentialReport(candidate_name)
+    report.row_count_difference = len(candidate_rows) - len(reference_rows)
+    reference_columns = list(reference_rows[0].keys()) if reference_rows else []
+    candidate_columns = list(candidate_rows[0].keys()) if candidate_rows else []
+    if reference_rows and candidate_rows:
+        report.missing_columns = [column for column in reference_columns if column not in candidate_columns]
+        report.extra_columns = [column for column in candidate_columns if column not in reference_columns]
+    compared_columns = [column for column in reference_columns if column in candidate_columns]
+
+    for row_index, (reference_row, candidate_row) in enumerate(zip(reference_rows, candidate_rows)):
+        report.rows_compared += 1
+        if any(str(reference_row.get(column)) != str(candidate_row.get(column)) for column in KEY_COLUMNS):
+            report.key_mismatches += 1
+        for column in compared_columns:
+            relative, absolute = column_tolerances.get(column, (relative_tolerance, absolute_tolerance))
+            match, difference = values_match(reference_row[column], candidate_row[column], relative, absolute)
+            if not match:
+                report.add_mismatch(column, row_index, reference_row[column], candidate_row[column], difference)
+    return report
+
+
+def extract_rows(engine: Callable, flows: List[Flow], zwave_config: ZwaveConfigLoader) -> List[dict]:
+    """Runs an extraction engine on the flows and gathers the rows of every protocol."""
+    data = engine(flows=flows, floating_point_unit=zwave_config.floating_point_unit,
+                  features_ignore_list=zwave_config.features_ignore_list, label=zwave_config.label,
+                  feature_families=zwave_config.feature_families)
+    return [row for protocol in data.keys() for row in data[protocol]]
+
+
+def read_golden_file(golden_file_address: str) -> List[dict]:
+    """Reads the rows of a golden output file written by write_data."""
+    with open(golden_file_address, newline='') as golden_file:
+        return list(csv.DictReader(golden_file))
+
+
+def args_parser() -> argparse.ArgumentParser:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: An ArgumentParser object.
+    """
+    parser = argparse.ArgumentParser(prog='ZwaveNetLyzer-differential',
+                                     description='Compare the features extracted by the reference engine with '
+                                                 'other extraction engines or with a golden output file.')
+    parser.add_argument('-c', '--config-file', required=True, help='Json config file address.')
+    parser.add_argument('-e', '--engine', action='append', choices=sorted(ENGINES.keys()),
+                        help='Engine to compare with the reference. Can be repeated. Defaults to every engine.')
+    parser.add_argument('-g', '--golden-file',
+                        help='Golden output file. The reference engine is compared with it, or it is written '
+                             'with --update-golden.')
+    parser.add_argument('--update-golden', action='store_true',
+                        help='Write the output of the reference engine to the golden file.')
+    parser.add_argument('--rtol', type=float, default=0.0, help='Accepted relative difference of numeric values.')
+    parser.add_argument('--atol', type=float, default=0.0, help='Accepted absolute difference of numeric values.')
+    parser.add_argument('--column-tolerance', action='append', metavar='COLUMN=RTOL,ATOL',
+                        help='Tolerances of a specific column. Can be repeated.')
+    return parser
+
+
+def main() -> None:
+    """Runs the reference engine and compares the other engines, or a golden file, with it."""
+    warnings.filterwarnings("ignore")
+    parsed_args = args_parser().parse_args()
+    column_tolerances = {}
+    for item in parsed_args.column_tolerance or []:
+        column, tolerances = item.split("=")
+        relative, absolute = tolerances.split(",")
+        column_tolerances[column] = (float(relative), float(absolute))
+
+    zwave_config = ZwaveConfigLoader(parsed_args.config_file)
+    flows = ZwaveFlowCapturer(zwave_config=zwave_config).capture()
+    reference_rows = extract_rows(ENGINES["reference"], flows, zwave_config)
+
+    if parsed_args.update_golden:
+        if parsed_args.golden_file is None:
+            raise Exception("Please specify the golden file to update with --golden-file.")
+        write_data({"golden": reference_rows}, parsed_args.golden_file)
+        print(f">> {len(reference_rows)} reference rows written to {parsed_args.golden_file}")
+        return
+
+    reports = []
+    if parsed_args.golden_file is not None:
+        reports.append(compare_rows(read_golden_file(parsed_args.golden_file), reference_rows, "reference vs golden file",
+                                    parsed_args.rtol, parsed_args.atol, column_tolerances))
+    engine_names = parsed_args.engine or [name for name in ENGINES.keys() if name != "reference"]
+    for name in engine_names:
+        reports.append(compare_rows(reference_rows, extract_rows(ENGINES[name], flows, zwave_config), name,
+                                    parsed_args.rtol, parsed_args.atol, column_tolerances))
+
+    for report in reports:
+        print(report.summary())
+    if not all(report.is_equal() for report in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
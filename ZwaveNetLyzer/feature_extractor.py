@@ -1,433 +1,474 @@
 #!/usr/bin/env python3
 
-from typing import List
-from .features.zwave import *
+import importlib
+from typing import Dict, List
+from .features import Feature
+from .feature_matrix import FeatureMatrix
 from .protocols import Protocols
 from .flow_capturer import Flow
 
 
 class FeatureExtractor:
-    """A class to extract related features for each protocol from a given list of flows."""
+    """
+    A class to extract related features for each protocol from a given list of flows.
+
+    The features of each protocol are listed in output column order as (family, class name)
+    pairs, where the family is the module of features.zwave that defines the class. Feature
+    modules are imported only when one of their features is extracted.
+    """
+
+    FEATURES = {
+        Protocols.Zwave: [
+            ("header_related", "ZwaveFlowHomeID"),
+            ("header_related", "ZwaveFlowSrcID"),
+            ("header_related", "ZwaveFlowDstID"),
+            ("time_related", "Duration"),
+            ("rate_related", "PacketsCount"),
+            ("header_related", "AverageSpeed"),
+            ("header_related", "MedianSpeed"),
+            ("header_related", "ModeSpeed"),
+            ("header_related", "StdDevSpeed"),
+            ("header_related", "MinSpeed"),
+            ("header_related", "MaxSpeed"),
+            ("header_related", "SpeedRange"),
+            ("header_related", "SpeedVariance"),
+            ("header_related", "CoeffVariationSpeed"),
+            ("header_related", "SpeedSkewness"),
+            ("header_related", "FwdAverageSpeed"),
+            ("header_related", "FwdMedianSpeed"),
+            ("header_related", "FwdModeSpeed"),
+            ("header_related", "FwdStdDevSpeed"),
+            ("header_related", "FwdMinSpeed"),
+            ("header_related", "FwdMaxSpeed"),
+            ("header_related", "FwdSpeedRange"),
+            ("header_related", "FwdSpeedVariance"),
+            ("header_related", "FwdCoeffVariationSpeed"),
+            ("header_related", "FwdSpeedSkewness"),
+            ("header_related", "BwdAverageSpeed"),
+            ("header_related", "BwdMedianSpeed"),
+            ("header_related", "BwdModeSpeed"),
+            ("header_related", "BwdStdDevSpeed"),
+            ("header_related", "BwdMinSpeed"),
+            ("header_related", "BwdMaxSpeed"),
+            ("header_related", "BwdSpeedRange"),
+            ("header_related", "BwdSpeedVariance"),
+            ("header_related", "BwdCoeffVariationSpeed"),
+            ("header_related", "BwdSpeedSkewness"),
+            ("header_related", "CountEachPacketClass"),
+            ("header_related", "ProportionEachPacketClass"),
+            ("header_related", "ProportionEachApplicationType"),
+            ("header_related", "FwdCountEachPacketClass"),
+            ("header_related", "FwdProportionEachPacketClass"),
+            ("header_related", "FwdProportionEachApplicationType"),
+            ("header_related", "BwdCountEachPacketClass"),
+            ("header_related", "BwdProportionEachPacketClass"),
+            ("header_related", "BwdProportionEachApplicationType"),
+            ("header_related", "AverageRSSI"),
+            ("header_related", "MedianRSSI"),
+            ("header_related", "ModeRSSI"),
+            ("header_related", "StdDevRSSI"),
+            ("header_related", "MinRSSI"),
+            ("header_related", "MaxRSSI"),
+            ("header_related", "RSSIRange"),
+            ("header_related", "RSSIVariance"),
+            ("header_related", "CoeffVariationSpeed"),
+            ("header_related", "RSSISkewness"),
+            ("header_related", "RSSIKurtosis"),
+            ("header_related", "FwdAverageRSSI"),
+            ("header_related", "FwdMedianRSSI"),
+            ("header_related", "FwdModeRSSI"),
+            ("header_related", "FwdStdDevRSSI"),
+            ("header_related", "FwdMinRSSI"),
+            ("header_related", "FwdMaxRSSI"),
+            ("header_related", "FwdRSSIRange"),
+            ("header_related", "FwdRSSIVariance"),
+            ("header_related", "FwdCoeffVariationSpeed"),
+            ("header_related", "FwdRSSISkewness"),
+            ("header_related", "FwdRSSIKurtosis"),
+            ("header_related", "BwdAverageRSSI"),
+            ("header_related", "BwdMedianRSSI"),
+            ("header_related", "BwdModeRSSI"),
+            ("header_related", "BwdStdDevRSSI"),
+            ("header_related", "BwdMinRSSI"),
+            ("header_related", "BwdMaxRSSI"),
+            ("header_related", "BwdRSSIRange"),
+            ("header_related", "BwdRSSIVariance"),
+            ("header_related", "BwdCoeffVariationSpeed"),
+            ("header_related", "BwdRSSISkewness"),
+            ("header_related", "BwdRSSIKurtosis"),
+            ("header_related", "TotalAcknowledgments"),
+            ("header_related", "ProportionAcknowledgedPackets"),
+            ("header_related", "TotalCRCErrors"),
+            ("header_related", "ProportionCRCErrors"),
+            ("header_related", "TotalSubstitutedPackets"),
+            ("header_related", "ProportionSubstitutedPackets"),
+            ("header_related", "CountPacketsWithUnknownHeaders"),
+            ("header_related", "ProportionUnknownHeaderPackets"),
+            ("header_related", "CountWakeupBeams"),
+            ("header_related", "ProportionWakeupBeamPackets"),
+            ("header_related", "UniqueHexPatternsCount"),
+            ("header_related", "FrequencyOfTopHexPatterns"),
+            ("header_related", "EntropyOfHexData"),
+            ("header_related", "HexDataPatternLengthVariability"),
+            ("header_related", "CrossCorrelationSpeedRSSI"),
+            ("header_related", "TimeSeriesAnalysisPacketIntervals"),
+            ("header_related", "PercentagePacketsPerChannel"),
+            ("header_related", "PercentageHighSpeedTransmissions"),
+            ("header_related", "TotalLowSignalPackets"),
+            ("header_related", "PercentageLowSignalPackets"),
+            ("header_related", "AverageChannelUsage"),
+            ("header_related", "MostCommonChannel"),
+            ("header_related", "LeastCommonChannel"),
+            ("header_related", "ChannelTransitionCount"),
+            ("header_related", "ChannelStability"),
+            ("header_related", "EntropyOfChannelUsage"),
+            ("header_related", "CommonDataPatterns"),
+            ("header_related", "UniqueDataEntries"),
+            ("header_related", "ClassDistribution"),
+            ("header_related", "MostCommonClass"),
+            ("header_related", "LeastCommonClass"),
+            ("header_related", "ApplicationUsageFrequency"),
+            ("header_related", "MostCommonApplication"),
+            ("header_related", "UniqueApplicationCount"),
+            ("header_related", "HeaderPatternConsistency"),
+            ("header_related", "HeaderComplexity"),
+            ("header_related", "PayloadToHeaderRatio"),
+            ("header_related", "IncrementalDataChange"),
+            ("header_related", "HeaderEntropy"),
+            ("header_related", "TemporalStabilityOfClassType"),
+            ("header_related", "TemporalStabilityOfApplicationType"),
+            ("header_related", "DataFieldEntropy"),
+            ("header_related", "PayloadEntropy"),
+            ("header_related", "CountOfSingleCastPackets"),
+            ("header_related", "ProportionOfSingleCastPackets"),
+            ("header_related", "CountOfACKPackets"),
+            ("header_related", "ProportionOfACKPackets"),
+            ("header_related", "CountOfMulticastPackets"),
+            ("header_related", "ProportionOfMulticastPackets"),
+            ("header_related", "CountOfBroadcastPackets"),
+            ("header_related", "ProportionOfBroadcastPackets"),
+            ("header_related", "CountOfExplorerAutoInclusionPackets"),
+            ("header_related", "ProportionOfExplorerAutoInclusionPackets"),
+            ("header_related", "FwdTotalAcknowledgments"),
+            ("header_related", "FwdProportionAcknowledgedPackets"),
+            ("header_related", "FwdTotalCRCErrors"),
+            ("header_related", "FwdProportionCRCErrors"),
+            ("header_related", "FwdTotalSubstitutedPackets"),
+            ("header_related", "FwdProportionSubstitutedPackets"),
+            ("header_related", "FwdCountPacketsWithUnknownHeaders"),
+            ("header_related", "FwdProportionUnknownHeaderPackets"),
+            ("header_related", "FwdCountWakeupBeams"),
+            ("header_related", "FwdProportionWakeupBeamPackets"),
+            ("header_related", "FwdUniqueHexPatternsCount"),
+            ("header_related", "FwdFrequencyOfTopHexPatterns"),
+            ("header_related", "FwdEntropyOfHexData"),
+            ("header_related", "FwdHexDataPatternLengthVariability"),
+            ("header_related", "FwdCrossCorrelationSpeedRSSI"),
+            ("header_related", "FwdTimeSeriesAnalysisPacketIntervals"),
+            ("header_related", "FwdPercentagePacketsPerChannel"),
+            ("header_related", "FwdPercentageHighSpeedTransmissions"),
+            ("header_related", "FwdTotalLowSignalPackets"),
+            ("header_related", "FwdPercentageLowSignalPackets"),
+            ("header_related", "FwdAverageChannelUsage"),
+            ("header_related", "FwdMostCommonChannel"),
+            ("header_related", "FwdLeastCommonChannel"),
+            ("header_related", "FwdChannelTransitionCount"),
+            ("header_related", "FwdChannelStability"),
+            ("header_related", "FwdEntropyOfChannelUsage"),
+            ("header_related", "FwdCommonDataPatterns"),
+            ("header_related", "FwdUniqueDataEntries"),
+            ("header_related", "FwdClassDistribution"),
+            ("header_related", "FwdMostCommonClass"),
+            ("header_related", "FwdLeastCommonClass"),
+            ("header_related", "FwdApplicationUsageFrequency"),
+            ("header_related", "FwdMostCommonApplication"),
+            ("header_related", "FwdUniqueApplicationCount"),
+            ("header_related", "FwdHeaderPatternConsistency"),
+            ("header_related", "FwdHeaderComplexity"),
+            ("header_related", "FwdPayloadToHeaderRatio"),
+            ("header_related", "FwdIncrementalDataChange"),
+            ("header_related", "FwdHeaderEntropy"),
+            ("header_related", "FwdTemporalStabilityOfClassType"),
+            ("header_related", "FwdTemporalStabilityOfApplicationType"),
+            ("header_related", "FwdDataFieldEntropy"),
+            ("header_related", "FwdPayloadEntropy"),
+            ("header_related", "FwdCountOfSingleCastPackets"),
+            ("header_related", "FwdProportionOfSingleCastPackets"),
+            ("header_related", "FwdCountOfACKPackets"),
+            ("header_related", "FwdProportionOfACKPackets"),
+            ("header_related", "FwdCountOfMulticastPackets"),
+            ("header_related", "FwdProportionOfMulticastPackets"),
+            ("header_related", "FwdCountOfBroadcastPackets"),
+            ("header_related", "FwdProportionOfBroadcastPackets"),
+            ("header_related", "FwdCountOfExplorerAutoInclusionPackets"),
+            ("header_related", "FwdProportionOfExplorerAutoInclusionPackets"),
+            ("header_related", "BwdTotalAcknowledgments"),
+            ("header_related", "BwdProportionAcknowledgedPackets"),
+            ("header_related", "BwdTotalCRCErrors"),
+            ("header_related", "BwdProportionCRCErrors"),
+            ("header_related", "BwdTotalSubstitutedPackets"),
+            ("header_related", "BwdProportionSubstitutedPackets"),
+            ("header_related", "BwdCountPacketsWithUnknownHeaders"),
+            ("header_related", "BwdProportionUnknownHeaderPackets"),
+            ("header_related", "BwdCountWakeupBeams"),
+            ("header_related", "BwdProportionWakeupBeamPackets"),
+            ("header_related", "BwdUniqueHexPatternsCount"),
+            ("header_related", "BwdFrequencyOfTopHexPatterns"),
+            ("header_related", "BwdEntropyOfHexData"),
+            ("header_related", "BwdHexDataPatternLengthVariability"),
+            ("header_related", "BwdCrossCorrelationSpeedRSSI"),
+            ("header_related", "BwdTimeSeriesAnalysisPacketIntervals"),
+            ("header_related", "BwdPercentagePacketsPerChannel"),
+            ("header_related", "BwdPercentageHighSpeedTransmissions"),
+            ("header_related", "BwdTotalLowSignalPackets"),
+            ("header_related", "BwdPercentageLowSignalPackets"),
+            ("header_related", "BwdAverageChannelUsage"),
+            ("header_related", "BwdMostCommonChannel"),
+            ("header_related", "BwdLeastCommonChannel"),
+            ("header_related", "BwdChannelTransitionCount"),
+            ("header_related", "BwdChannelStability"),
+            ("header_related", "BwdEntropyOfChannelUsage"),
+            ("header_related", "BwdCommonDataPatterns"),
+            ("header_related", "BwdUniqueDataEntries"),
+            ("header_related", "BwdClassDistribution"),
+            ("header_related", "BwdMostCommonClass"),
+            ("header_related", "BwdLeastCommonClass"),
+            ("header_related", "BwdApplicationUsageFrequency"),
+            ("header_related", "BwdMostCommonApplication"),
+            ("header_related", "BwdUniqueApplicationCount"),
+            ("header_related", "BwdHeaderPatternConsistency"),
+            ("header_related", "BwdHeaderComplexity"),
+            ("header_related", "BwdPayloadToHeaderRatio"),
+            ("header_related", "BwdIncrementalDataChange"),
+            ("header_related", "BwdHeaderEntropy"),
+            ("header_related", "BwdTemporalStabilityOfClassType"),
+            ("header_related", "BwdTemporalStabilityOfApplicationType"),
+            ("header_related", "BwdDataFieldEntropy"),
+            ("header_related", "BwdPayloadEntropy"),
+            ("header_related", "BwdCountOfSingleCastPackets"),
+            ("header_related", "BwdProportionOfSingleCastPackets"),
+            ("header_related", "BwdCountOfACKPackets"),
+            ("header_related", "BwdProportionOfACKPackets"),
+            ("header_related", "BwdCountOfMulticastPackets"),
+            ("header_related", "BwdProportionOfMulticastPackets"),
+            ("header_related", "BwdCountOfBroadcastPackets"),
+            ("header_related", "BwdProportionOfBroadcastPackets"),
+            ("header_related", "BwdCountOfExplorerAutoInclusionPackets"),
+            ("header_related", "BwdProportionOfExplorerAutoInclusionPackets"),
+            ("len_related", "TotalHeaderBytes"),
+            ("len_related", "MaxHeaderBytes"),
+            ("len_related", "MinHeaderBytes"),
+            ("len_related", "MeanHeaderBytes"),
+            ("len_related", "ModeHeaderBytes"),
+            ("len_related", "VarianceHeaderBytes"),
+            ("len_related", "StandardDeviationHeaderBytes"),
+            ("len_related", "MedianHeaderBytes"),
+            ("len_related", "SkewnessHeaderBytes"),
+            ("len_related", "CoefficientOfVariationHeaderBytes"),
+            ("len_related", "MaxPayloadBytes"),
+            ("len_related", "TotalPayloadBytes"),
+            ("len_related", "MinPayloadBytes"),
+            ("len_related", "MeanPayloadBytes"),
+            ("len_related", "ModePayloadBytes"),
+            ("len_related", "VariancePayloadBytes"),
+            ("len_related", "StandardDeviationPayloadBytes"),
+            ("len_related", "MedianPayloadBytes"),
+            ("len_related", "SkewnessPayloadBytes"),
+            ("len_related", "CoefficientOfVariationPayloadBytes"),
+            ("len_related", "TotalPacketLen"),
+            ("len_related", "MaxPacketLen"),
+            ("len_related", "MinPacketLen"),
+            ("len_related", "MeanPacketLen"),
+            ("len_related", "ModePacketLen"),
+            ("len_related", "VariancePacketLen"),
+            ("len_related", "StandardDeviationPacketLen"),
+            ("len_related", "MedianPacketLen"),
+            ("len_related", "SkewnessPacketLen"),
+            ("len_related", "CoefficientOfVariationPacketLen"),
+            ("len_related", "TotalDataFieldSize"),
+            ("len_related", "MaxDataFieldSize"),
+            ("len_related", "MinDataFieldSize"),
+            ("len_related", "MeanDataFieldSize"),
+            ("len_related", "ModeDataFieldSize"),
+            ("len_related", "VarianceDataFieldSize"),
+            ("len_related", "StdDataFieldSize"),
+            ("len_related", "SkewnessDataFieldSize"),
+            ("len_related", "CoefficientOfVariationDataFieldSize"),
+            ("len_related", "MedianDataFieldSize"),
+            ("len_related", "FwdTotalHeaderBytes"),
+            ("len_related", "FwdMaxHeaderBytes"),
+            ("len_related", "FwdMinHeaderBytes"),
+            ("len_related", "FwdMeanHeaderBytes"),
+            ("len_related", "FwdModeHeaderBytes"),
+            ("len_related", "FwdVarianceHeaderBytes"),
+            ("len_related", "FwdStandardDeviationHeaderBytes"),
+            ("len_related", "FwdMedianHeaderBytes"),
+            ("len_related", "FwdSkewnessHeaderBytes"),
+            ("len_related", "FwdCoefficientOfVariationHeaderBytes"),
+            ("len_related", "FwdMaxPayloadBytes"),
+            ("len_related", "FwdTotalPayloadBytes"),
+            ("len_related", "FwdMinPayloadBytes"),
+            ("len_related", "FwdMeanPayloadBytes"),
+            ("len_related", "FwdModePayloadBytes"),
+            ("len_related", "FwdVariancePayloadBytes"),
+            ("len_related", "FwdStandardDeviationPayloadBytes"),
+            ("len_related", "FwdMedianPayloadBytes"),
+            ("len_related", "FwdSkewnessPayloadBytes"),
+            ("len_related", "FwdCoefficientOfVariationPayloadBytes"),
+            ("len_related", "FwdTotalPacketLen"),
+            ("len_related", "FwdMaxPacketLen"),
+            ("len_related", "FwdMinPacketLen"),
+            ("len_related", "FwdMeanPacketLen"),
+            ("len_related", "FwdModePacketLen"),
+            ("len_related", "FwdVariancePacketLen"),
+            ("len_related", "FwdStandardDeviationPacketLen"),
+            ("len_related", "FwdMedianPacketLen"),
+            ("len_related", "FwdSkewnessPacketLen"),
+            ("len_related", "FwdCoefficientOfVariationPacketLen"),
+            ("len_related", "FwdTotalDataFieldSize"),
+            ("len_related", "FwdMaxDataFieldSize"),
+            ("len_related", "FwdMinDataFieldSize"),
+            ("len_related", "FwdMeanDataFieldSize"),
+            ("len_related", "FwdModeDataFieldSize"),
+            ("len_related", "FwdVarianceDataFieldSize"),
+            ("len_related", "FwdStdDataFieldSize"),
+            ("len_related", "FwdSkewnessDataFieldSize"),
+            ("len_related", "FwdCoefficientOfVariationDataFieldSize"),
+            ("len_related", "FwdMedianDataFieldSize"),
+            ("len_related", "BwdTotalHeaderBytes"),
+            ("len_related", "BwdMaxHeaderBytes"),
+            ("len_related", "BwdMinHeaderBytes"),
+            ("len_related", "BwdMeanHeaderBytes"),
+            ("len_related", "BwdModeHeaderBytes"),
+            ("len_related", "BwdVarianceHeaderBytes"),
+            ("len_related", "BwdStandardDeviationHeaderBytes"),
+            ("len_related", "BwdMedianHeaderBytes"),
+            ("len_related", "BwdSkewnessHeaderBytes"),
+            ("len_related", "BwdCoefficientOfVariationHeaderBytes"),
+            ("len_related", "BwdMaxPayloadBytes"),
+            ("len_related", "BwdTotalPayloadBytes"),
+            ("len_related", "BwdMinPayloadBytes"),
+            ("len_related", "BwdMeanPayloadBytes"),
+            ("len_related", "BwdModePayloadBytes"),
+            ("len_related", "BwdVariancePayloadBytes"),
+            ("len_related", "BwdStandardDeviationPayloadBytes"),
+            ("len_related", "BwdMedianPayloadBytes"),
+            ("len_related", "BwdSkewnessPayloadBytes"),
+            ("len_related", "BwdCoefficientOfVariationPayloadBytes"),
+            ("len_related", "BwdTotalPacketLen"),
+            ("len_related", "BwdMaxPacketLen"),
+            ("len_related", "BwdMinPacketLen"),
+            ("len_related", "BwdMeanPacketLen"),
+            ("len_related", "BwdModePacketLen"),
+            ("len_related", "BwdVariancePacketLen"),
+            ("len_related", "BwdStandardDeviationPacketLen"),
+            ("len_related", "BwdMedianPacketLen"),
+            ("len_related", "BwdSkewnessPacketLen"),
+            ("len_related", "BwdCoefficientOfVariationPacketLen"),
+            ("len_related", "BwdTotalDataFieldSize"),
+            ("len_related", "BwdMaxDataFieldSize"),
+            ("len_related", "BwdMinDataFieldSize"),
+            ("len_related", "BwdMeanDataFieldSize"),
+            ("len_related", "BwdModeDataFieldSize"),
+            ("len_related", "BwdVarianceDataFieldSize"),
+            ("len_related", "BwdStdDataFieldSize"),
+            ("len_related", "BwdSkewnessDataFieldSize"),
+            ("len_related", "BwdCoefficientOfVariationDataFieldSize"),
+            ("len_related", "BwdMedianDataFieldSize"),
+            ("rate_related", "HeaderBytesRate"),
+            ("rate_related", "PayloadBytesRate"),
+            ("rate_related", "PacketLenRate"),
+            ("rate_related", "PacketsRate"),
+            ("rate_related", "FwdPacketsCount"),
+            ("rate_related", "FwdHeaderBytesRate"),
+            ("rate_related", "FwdPayloadBytesRate"),
+            ("rate_related", "FwdPacketLenRate"),
+            ("rate_related", "FwdPacketsRate"),
+            ("rate_related", "BwdPacketsCount"),
+            ("rate_related", "BwdHeaderBytesRate"),
+            ("rate_related", "BwdPayloadBytesRate"),
+            ("rate_related", "BwdPacketLenRate"),
+            ("rate_related", "BwdPacketsRate"),
+            ("time_related", "MaxPacketsTimeDelta"),
+            ("time_related", "MinPacketsTimeDelta"),
+            ("time_related", "MeanPacketsTimeDelta"),
+            ("time_related", "ModePacketsTimeDelta"),
+            ("time_related", "VariancePacketsTimeDelta"),
+            ("time_related", "StandardDeviationPacketsTimeDelta"),
+            ("time_related", "MedianPacketsTimeDelta"),
+            ("time_related", "SkewnessPacketsTimeDelta"),
+            ("time_related", "CoefficientOfVariationPacketsTimeDelta"),
+            ("time_related", "FwdMaxPacketsTimeDelta"),
+            ("time_related", "FwdMinPacketsTimeDelta"),
+            ("time_related", "FwdMeanPacketsTimeDelta"),
+            ("time_related", "FwdModePacketsTimeDelta"),
+            ("time_related", "FwdVariancePacketsTimeDelta"),
+            ("time_related", "FwdStandardDeviationPacketsTimeDelta"),
+            ("time_related", "FwdMedianPacketsTimeDelta"),
+            ("time_related", "FwdSkewnessPacketsTimeDelta"),
+            ("time_related", "FwdCoefficientOfVariationPacketsTimeDelta"),
+            ("time_related", "BwdMaxPacketsTimeDelta"),
+            ("time_related", "BwdMinPacketsTimeDelta"),
+            ("time_related", "BwdMeanPacketsTimeDelta"),
+            ("time_related", "BwdModePacketsTimeDelta"),
+            ("time_related", "BwdVariancePacketsTimeDelta"),
+            ("time_related", "BwdStandardDeviationPacketsTimeDelta"),
+            ("time_related", "BwdMedianPacketsTimeDelta"),
+            ("time_related", "BwdSkewnessPacketsTimeDelta"),
+            ("time_related", "BwdCoefficientOfVariationPacketsTimeDelta"),
+            ("header_related", "TerminationReason"),
+        ],
+    }
+
+    # The (module, class name) of the incremental state of an open flow of each protocol, see 'execute_snapshot'.
+    FLOW_SNAPSHOTS = {
+        Protocols.Zwave: ("incremental", "ZwaveFlowSnapshot"),
+    }
+
+    @staticmethod
+    def load_features(feature_families: List[str] = None, features_ignore_list: List = []) -> Dict[Protocols, List[Feature]]:
+        """
+        Import the selected feature families and create their features.
+
+        Args:
+            feature_families: The names of the feature families to extract, e.g. "time_related". None selects every family.
+            features_ignore_list: A list of feature names to ignore during extraction.
+
+        Returns:
+            The features to extract for each protocol, in output column order.
+        """
+        features = {}
+        for protocol, feature_classes in FeatureExtractor.FEATURES.items():
+            features[protocol] = []
+            for family, class_name in feature_classes:
+                if feature_families is not None and family not in feature_families:
+                    continue
+                module = importlib.import_module(f"{__package__}.features.{protocol.name.lower()}.{family}")
+                feature = getattr(module, class_name)()
+                if feature.name not in features_ignore_list:
+                    features[protocol].append(feature)
+        return features
 
     @staticmethod
     def execute(flows: List[Flow], floating_point_unit: str, features_ignore_list: List = [],
-                label: str = "") -> List:
+                label: str = "", feature_families: List[str] = None) -> List:
         """
         Extract features from a list of flows.
 
+        The count features of flows assembled from one in N packets are multiplied by N.
+
         Args:
             flows: A list of Flow objects to extract features from.
             floating_point_unit: A string indicating the unit to use for floating-point features.
             features_ignore_list: A list of feature names to ignore during extraction.
             label: A string label to assign to all extracted features.
+            feature_families: The names of the feature families to extract. None extracts every family.
 
         Returns:
             A list of dictionaries representing the extracted features, one for each Flow object in `flows`.
         """
 
-        features = {
-            Protocols.Zwave: [
-                ZwaveFlowHomeID(),
-                ZwaveFlowSrcID(),
-                ZwaveFlowDstID(),
-                Duration(),
-                PacketsCount(),
-                AverageSpeed(),
-                MedianSpeed(),
-                ModeSpeed(),
-                StdDevSpeed(),
-                MinSpeed(),
-                MaxSpeed(),
-                SpeedRange(),
-                SpeedVariance(),
-                CoeffVariationSpeed(),
-                SpeedSkewness(),
-                FwdAverageSpeed(),
-                FwdMedianSpeed(),
-                FwdModeSpeed(),
-                FwdStdDevSpeed(),
-                FwdMinSpeed(),
-                FwdMaxSpeed(),
-                FwdSpeedRange(),
-                FwdSpeedVariance(),
-                FwdCoeffVariationSpeed(),
-                FwdSpeedSkewness(),
-                BwdAverageSpeed(),
-                BwdMedianSpeed(),
-                BwdModeSpeed(),
-                BwdStdDevSpeed(),
-                BwdMinSpeed(),
-                BwdMaxSpeed(),
-                BwdSpeedRange(),
-                BwdSpeedVariance(),
-                BwdCoeffVariationSpeed(),
-                BwdSpeedSkewness(),
-                CountEachPacketClass(),
-                ProportionEachPacketClass(),
-                ProportionEachApplicationType(),
-                FwdCountEachPacketClass(),
-                FwdProportionEachPacketClass(),
-                FwdProportionEachApplicationType(),
-                BwdCountEachPacketClass(),
-                BwdProportionEachPacketClass(),
-                BwdProportionEachApplicationType(),
-                AverageRSSI(),
-                MedianRSSI(),
-                ModeRSSI(),
-                StdDevRSSI(),
-                MinRSSI(),
-                MaxRSSI(),
-                RSSIRange(),
-                RSSIVariance(),
-                CoeffVariationSpeed(),
-                RSSISkewness(),
-                RSSIKurtosis(),
-                FwdAverageRSSI(),
-                FwdMedianRSSI(),
-                FwdModeRSSI(),
-                FwdStdDevRSSI(),
-                FwdMinRSSI(),
-                FwdMaxRSSI(),
-                FwdRSSIRange(),
-                FwdRSSIVariance(),
-                FwdCoeffVariationSpeed(),
-                FwdRSSISkewness(),
-                FwdRSSIKurtosis(),
-                BwdAverageRSSI(),
-                BwdMedianRSSI(),
-                BwdModeRSSI(),
-                BwdStdDevRSSI(),
-                BwdMinRSSI(),
-                BwdMaxRSSI(),
-                BwdRSSIRange(),
-                BwdRSSIVariance(),
-                BwdCoeffVariationSpeed(),
-                BwdRSSISkewness(),
-                BwdRSSIKurtosis(),
-                TotalAcknowledgments(),
-                ProportionAcknowledgedPackets(),
-                TotalCRCErrors(),
-                ProportionCRCErrors(),
-                TotalSubstitutedPackets(),
-                ProportionSubstitutedPackets(),
-                CountPacketsWithUnknownHeaders(),
-                ProportionUnknownHeaderPackets(),
-                CountWakeupBeams(),
-                ProportionWakeupBeamPackets(),
-                UniqueHexPatternsCount(),
-                FrequencyOfTopHexPatterns(),
-                EntropyOfHexData(),
-                HexDataPatternLengthVariability(),
-                CrossCorrelationSpeedRSSI(),
-                TimeSeriesAnalysisPacketIntervals(),
-                PercentagePacketsPerChannel(),
-                PercentageHighSpeedTransmissions(),
-                TotalLowSignalPackets(),
-                PercentageLowSignalPackets(),
-                AverageChannelUsage(),
-                MostCommonChannel(),
-                LeastCommonChannel(),
-                ChannelTransitionCount(),
-                ChannelStability(),
-                EntropyOfChannelUsage(),
-                CommonDataPatterns(),
-                UniqueDataEntries(),
-                ClassDistribution(),
-                MostCommonClass(),
-                LeastCommonClass(),
-                ApplicationUsageFrequency(),
-                MostCommonApplication(),
-                UniqueApplicationCount(),
-                HeaderPatternConsistency(),
-                HeaderComplexity(),
-                PayloadToHeaderRatio(),
-                IncrementalDataChange(),
-                HeaderEntropy(),
-                TemporalStabilityOfClassType(),
-                TemporalStabilityOfApplicationType(),
-                DataFieldEntropy(),
-                PayloadEntropy(),
-                CountOfSingleCastPackets(),
-                ProportionOfSingleCastPackets(),
-                CountOfACKPackets(),
-                ProportionOfACKPackets(),
-                CountOfMulticastPackets(),
-                ProportionOfMulticastPackets(),
-                CountOfBroadcastPackets(),
-                ProportionOfBroadcastPackets(),
-                CountOfExplorerAutoInclusionPackets(),
-                ProportionOfExplorerAutoInclusionPackets(),
-                FwdTotalAcknowledgments(),
-                FwdProportionAcknowledgedPackets(),
-                FwdTotalCRCErrors(),
-                FwdProportionCRCErrors(),
-                FwdTotalSubstitutedPackets(),
-                FwdProportionSubstitutedPackets(),
-                FwdCountPacketsWithUnknownHeaders(),
-                FwdProportionUnknownHeaderPackets(),
-                FwdCountWakeupBeams(),
-                FwdProportionWakeupBeamPackets(),
-                FwdUniqueHexPatternsCount(),
-                FwdFrequencyOfTopHexPatterns(),
-                FwdEntropyOfHexData(),
-                FwdHexDataPatternLengthVariability(),
-                FwdCrossCorrelationSpeedRSSI(),
-                FwdTimeSeriesAnalysisPacketIntervals(),
-                FwdPercentagePacketsPerChannel(),
-                FwdPercentageHighSpeedTransmissions(),
-                FwdTotalLowSignalPackets(),
-                FwdPercentageLowSignalPackets(),
-                FwdAverageChannelUsage(),
-                FwdMostCommonChannel(),
-                FwdLeastCommonChannel(),
-                FwdChannelTransitionCount(),
-                FwdChannelStability(),
-                FwdEntropyOfChannelUsage(),
-                FwdCommonDataPatterns(),
-                FwdUniqueDataEntries(),
-                FwdClassDistribution(),
-                FwdMostCommonClass(),
-                FwdLeastCommonClass(),
-                FwdApplicationUsageFrequency(),
-                FwdMostCommonApplication(),
-                FwdUniqueApplicationCount(),
-                FwdHeaderPatternConsistency(),
-                FwdHeaderComplexity(),
-                FwdPayloadToHeaderRatio(),
-                FwdIncrementalDataChange(),
-                FwdHeaderEntropy(),
-                FwdTemporalStabilityOfClassType(),
-                FwdTemporalStabilityOfApplicationType(),
-                FwdDataFieldEntropy(),
-                FwdPayloadEntropy(),
-                FwdCountOfSingleCastPackets(),
-                FwdProportionOfSingleCastPackets(),
-                FwdCountOfACKPackets(),
-                FwdProportionOfACKPackets(),
-                FwdCountOfMulticastPackets(),
-                FwdProportionOfMulticastPackets(),
-                FwdCountOfBroadcastPackets(),
-                FwdProportionOfBroadcastPackets(),
-                FwdCountOfExplorerAutoInclusionPackets(),
-                FwdProportionOfExplorerAutoInclusionPackets(),
-                BwdTotalAcknowledgments(),
-                BwdProportionAcknowledgedPackets(),
-                BwdTotalCRCErrors(),
-                BwdProportionCRCErrors(),
-                BwdTotalSubstitutedPackets(),
-                BwdProportionSubstitutedPackets(),
-                BwdCountPacketsWithUnknownHeaders(),
-                BwdProportionUnknownHeaderPackets(),
-                BwdCountWakeupBeams(),
-                BwdProportionWakeupBeamPackets(),
-                BwdUniqueHexPatternsCount(),
-                BwdFrequencyOfTopHexPatterns(),
-                BwdEntropyOfHexData(), 
-                BwdHexDataPatternLengthVariability(),
-                BwdCrossCorrelationSpeedRSSI(),
-                BwdTimeSeriesAnalysisPacketIntervals(),
-                BwdPercentagePacketsPerChannel(),
-                BwdPercentageHighSpeedTransmissions(),
-                BwdTotalLowSignalPackets(),
-                BwdPercentageLowSignalPackets(),
-                BwdAverageChannelUsage(),
-                BwdMostCommonChannel(),
-                BwdLeastCommonChannel(),
-                BwdChannelTransitionCount(),
-                BwdChannelStability(),
-                BwdEntropyOfChannelUsage(),
-                BwdCommonDataPatterns(),
-                BwdUniqueDataEntries(),
-                BwdClassDistribution(),
-                BwdMostCommonClass(),
-                BwdLeastCommonClass(),
-                BwdApplicationUsageFrequency(),
-                BwdMostCommonApplication(),
-                BwdUniqueApplicationCount(),
-                BwdHeaderPatternConsistency(),
-                BwdHeaderComplexity(),
-                BwdPayloadToHeaderRatio(),
-                BwdIncrementalDataChange(),
-                BwdHeaderEntropy(),
-                BwdTemporalStabilityOfClassType(),
-                BwdTemporalStabilityOfApplicationType(),
-                BwdDataFieldEntropy(),
-                BwdPayloadEntropy(),
-                BwdCountOfSingleCastPackets(),
-                BwdProportionOfSingleCastPackets(),
-                BwdCountOfACKPackets(),
-                BwdProportionOfACKPackets(),
-                BwdCountOfMulticastPackets(),
-                BwdProportionOfMulticastPackets(),
-                BwdCountOfBroadcastPackets(),
-                BwdProportionOfBroadcastPackets(),
-                BwdCountOfExplorerAutoInclusionPackets(),
-                BwdProportionOfExplorerAutoInclusionPackets(),
-                TotalHeaderBytes(),
-                MaxHeaderBytes(),
-                MinHeaderBytes(),
-                MeanHeaderBytes(),
-                ModeHeaderBytes(),
-                VarianceHeaderBytes(),
-                StandardDeviationHeaderBytes(),
-                MedianHeaderBytes(),
-                SkewnessHeaderBytes(),
-                CoefficientOfVariationHeaderBytes(),
-                MaxPayloadBytes(),
-                TotalPayloadBytes(),
-                MinPayloadBytes(),
-                MeanPayloadBytes(),
-                ModePayloadBytes(),
-                VariancePayloadBytes(),
-                StandardDeviationPayloadBytes(),
-                MedianPayloadBytes(),
-                SkewnessPayloadBytes(),
-                CoefficientOfVariationPayloadBytes(),
-                TotalPacketLen(),
-                MaxPacketLen(),
-                MinPacketLen(),
-                MeanPacketLen(),
-                ModePacketLen(),
-                VariancePacketLen(),
-                StandardDeviationPacketLen(),
-                MedianPacketLen(),
-                SkewnessPacketLen(),
-                CoefficientOfVariationPacketLen(),
-                TotalDataFieldSize(),
-                MaxDataFieldSize(),
-                MinDataFieldSize(),
-                MeanDataFieldSize(),
-                ModeDataFieldSize(),
-                VarianceDataFieldSize(),
-                StdDataFieldSize(),
-                SkewnessDataFieldSize(),
-                CoefficientOfVariationDataFieldSize(),
-                MedianDataFieldSize(),
-                FwdTotalHeaderBytes(),
-                FwdMaxHeaderBytes(),
-                FwdMinHeaderBytes(),
-                FwdMeanHeaderBytes(),
-                FwdModeHeaderBytes(),
-                FwdVarianceHeaderBytes(),
-                FwdStandardDeviationHeaderBytes(),
-                FwdMedianHeaderBytes(),
-                FwdSkewnessHeaderBytes(),
-                FwdCoefficientOfVariationHeaderBytes(),
-                FwdMaxPayloadBytes(),
-                FwdTotalPayloadBytes(),
-                FwdMinPayloadBytes(),
-                FwdMeanPayloadBytes(),
-                FwdModePayloadBytes(),
-                FwdVariancePayloadBytes(),
-                FwdStandardDeviationPayloadBytes(),
-                FwdMedianPayloadBytes(),
-                FwdSkewnessPayloadBytes(),
-                FwdCoefficientOfVariationPayloadBytes(),
-                FwdTotalPacketLen(),
-                FwdMaxPacketLen(),
-                FwdMinPacketLen(),
-                FwdMeanPacketLen(),
-                FwdModePacketLen(),
-                FwdVariancePacketLen(),
-                FwdStandardDeviationPacketLen(),
-                FwdMedianPacketLen(),
-                FwdSkewnessPacketLen(),
-                FwdCoefficientOfVariationPacketLen(),
-                FwdTotalDataFieldSize(),
-                FwdMaxDataFieldSize(),
-                FwdMinDataFieldSize(),
-                FwdMeanDataFieldSize(),
-                FwdModeDataFieldSize(),
-                FwdVarianceDataFieldSize(),
-                FwdStdDataFieldSize(),
-                FwdSkewnessDataFieldSize(),
-                FwdCoefficientOfVariationDataFieldSize(),
-                FwdMedianDataFieldSize(),
-                BwdTotalHeaderBytes(),
-                BwdMaxHeaderBytes(),
-                BwdMinHeaderBytes(),
-                BwdMeanHeaderBytes(),
-                BwdModeHeaderBytes(),
-                BwdVarianceHeaderBytes(),
-                BwdStandardDeviationHeaderBytes(),
-                BwdMedianHeaderBytes(),
-                BwdSkewnessHeaderBytes(),
-                BwdCoefficientOfVariationHeaderBytes(),
-                BwdMaxPayloadBytes(),
-                BwdTotalPayloadBytes(),
-                BwdMinPayloadBytes(),
-                BwdMeanPayloadBytes(),
-                BwdModePayloadBytes(),
-                BwdVariancePayloadBytes(),
-                BwdStandardDeviationPayloadBytes(),
-                BwdMedianPayloadBytes(),
-                BwdSkewnessPayloadBytes(),
-                BwdCoefficientOfVariationPayloadBytes(),
-                BwdTotalPacketLen(),
-                BwdMaxPacketLen(),
-                BwdMinPacketLen(),
-                BwdMeanPacketLen(),
-                BwdModePacketLen(),
-                BwdVariancePacketLen(),
-                BwdStandardDeviationPacketLen(),
-                BwdMedianPacketLen(),
-                BwdSkewnessPacketLen(),
-                BwdCoefficientOfVariationPacketLen(),
-                BwdTotalDataFieldSize(),
-                BwdMaxDataFieldSize(),
-                BwdMinDataFieldSize(),
-                BwdMeanDataFieldSize(),
-                BwdModeDataFieldSize(),
-                BwdVarianceDataFieldSize(),
-                BwdStdDataFieldSize(),
-                BwdSkewnessDataFieldSize(),
-                BwdCoefficientOfVariationDataFieldSize(),
-                BwdMedianDataFieldSize(),
-                HeaderBytesRate(),
-                PayloadBytesRate(),
-                PacketLenRate(),
-                PacketsRate(),
-                FwdPacketsCount(),
-                FwdHeaderBytesRate(),
-                FwdPayloadBytesRate(),
-                FwdPacketLenRate(),
-                FwdPacketsRate(),
-                BwdPacketsCount(),
-                BwdHeaderBytesRate(),
-                BwdPayloadBytesRate(),
-                BwdPacketLenRate(),
-                BwdPacketsRate(),
-                MaxPacketsTimeDelta(),
-                MinPacketsTimeDelta(),
-                MeanPacketsTimeDelta(),
-                ModePacketsTimeDelta(),
-                VariancePacketsTimeDelta(),
-                StandardDeviationPacketsTimeDelta(),
-                MedianPacketsTimeDelta(),
-                SkewnessPacketsTimeDelta(),
-                CoefficientOfVariationPacketsTimeDelta(),
-                FwdMaxPacketsTimeDelta(),
-                FwdMinPacketsTimeDelta(),
-                FwdMeanPacketsTimeDelta(),
-                FwdModePacketsTimeDelta(),
-                FwdVariancePacketsTimeDelta(),
-                FwdStandardDeviationPacketsTimeDelta(),
-                FwdMedianPacketsTimeDelta(),
-                FwdSkewnessPacketsTimeDelta(),
-                FwdCoefficientOfVariationPacketsTimeDelta(),
-                BwdMaxPacketsTimeDelta(),
-                BwdMinPacketsTimeDelta(),
-                BwdMeanPacketsTimeDelta(),
-                BwdModePacketsTimeDelta(),
-                BwdVariancePacketsTimeDelta(),
-                BwdStandardDeviationPacketsTimeDelta(),
-                BwdMedianPacketsTimeDelta(),
-                BwdSkewnessPacketsTimeDelta(),
-                BwdCoefficientOfVariationPacketsTimeDelta(),
-
-            ],
-        }
-
+        features = FeatureExtractor.load_features(feature_families, features_ignore_list)
         extracted_data = {
             Protocols.Zwave: [],
         }
@@ -439,12 +480,143 @@ class FeatureExtractor:
                 "protocol": str(flow.get_protocol())
             }
 
+            packet_sampling_interval = flow.get_packet_sampling_interval()
             for feature in features[flow.get_protocol()]:
-                if feature.name in features_ignore_list:
-                    continue
                 feature.set_floating_point_unit(floating_point_unit)
-                features_of_flow[feature.name] = feature.extract(flow)
+                features_of_flow[feature.name] = FeatureExtractor.extract_feature(feature, flow)
+                if feature.is_count and packet_sampling_interval != 1:
+                    features_of_flow[feature.name] *= packet_sampling_interval
             features_of_flow["label"] = label
             extracted_data[flow.get_protocol()].append(features_of_flow)
 
         return extracted_data
+
+    @staticmethod
+    def extract_feature(feature: Feature, flow: Flow):
+        """
+        Extract a feature of a flow, from the incremental statistics of the flow if it has some that
+        cover the feature (see Flow.get_statistics).
+        """
+        flow_statistics = flow.get_statistics()
+        if flow_statistics is not None and flow_statistics.is_incremental(feature.name):
+            return flow_statistics.extract(feature, flow)
+        return feature.extract(flow)
+
+    @staticmethod
+    def load_flow_snapshot_class(protocol: Protocols) -> type:
+        """Import the class of the incremental state of the open flows of a protocol."""
+        module_name, class_name = FeatureExtractor.FLOW_SNAPSHOTS[protocol]
+        module = importlib.import_module(f"{__package__}.features.{protocol.name.lower()}.{module_name}")
+        return getattr(module, class_name)
+
+    @staticmethod
+    def load_snapshot_features(feature_families: List[str] = None,
+                               features_ignore_list: List = []) -> Dict[Protocols, List[Feature]]:
+        """
+        Create the features that snapshots of open flows extract: the features of 'load_features'
+        whose snapshot value costs time that does not grow with the flow.
+
+        Args:
+            feature_families: The names of the feature families to extract. None selects every family.
+            features_ignore_list: A list of feature names to ignore during extraction.
+
+        Returns:
+            The snapshot features of each protocol, in output column order.
+        """
+        features = FeatureExtractor.load_features(feature_families, features_ignore_list)
+        for protocol in features:
+            flow_snapshot_class = FeatureExtractor.load_flow_snapshot_class(protocol)
+            features[protocol] = [feature for feature in features[protocol]
+                                  if flow_snapshot_class.is_incremental(feature.name)]
+        return features
+
+    @staticmethod
+    def execute_snapshot(flow: Flow, flow_snapshot, features: List[Feature], label: str = "") -> dict:
+        """
+        Extract the features of an open flow from its incremental state.
+
+        The state is first updated with the packets that the flow received since the previous
+        snapshot, so the snapshots of a flow cost time proportional to its packets in total rather
+        than to its packets at each snapshot. The values are those that 'execute' would extract if the
+        flow ended now, up to float rounding, with the "snapshot" termination reason.
+
+        Args:
+            flow: The open flow.
+            flow_snapshot: The incremental state of the flow, created by the class of 'load_flow_snapshot_class'.
+            features: The features of 'load_snapshot_features' for the protocol of the flow, with their
+                floating point unit set.
+            label: A string label to assign to the snapshot.
+
+        Returns:
+            A dictionary of the snapshot, with the time of the last packet of the flow in "snapshot_timestamp".
+        """
+        flow_snapshot.update(flow)
+        features_of_flow = {
+            "flow_id": str(flow),
+            "timestamp": str(flow.get_timestamp()),
+            "protocol": str(flow.get_protocol()),
+            "snapshot_timestamp": str(flow.get_packets()[-1].get_timestamp()),
+        }
+        packet_sampling_interval = flow.get_packet_sampling_interval()
+        for feature in features:
+            features_of_flow[feature.name] = flow_snapshot.extract(feature, flow)
+            if feature.is_count and packet_sampling_interval != 1:
+                features_of_flow[feature.name] *= packet_sampling_interval
+        features_of_flow["label"] = label
+        return features_of_flow
+
+    @staticmethod
+    def execute_matrix(flows: List[Flow], features_ignore_list: List = [], label: str = "",
+                       feature_families: List[str] = None, protocol: Protocols = Protocols.Zwave,
+                       dtype: str = "float64") -> FeatureMatrix:
+        """
+        Extract features from a list of flows of one protocol into NumPy arrays.
+
+        The numeric features are written unformatted straight into a preallocated float matrix,
+        without building a dictionary per flow.
+
+        Args:
+            flows: A list of Flow objects of the given protocol to extract features from.
+            features_ignore_list: A list of feature names to ignore during extraction.
+            label: A string label to assign to all extracted features.
+            feature_families: The names of the feature families to extract. None extracts every family.
+            protocol: The protocol of the flows.
+            dtype: The float type of the numeric matrix, "float64" or "float32".
+
+        Returns:
+            A FeatureMatrix with one row for each Flow object in `flows`.
+        """
+        import numpy
+        features_by_name = {}
+        for feature in FeatureExtractor.load_features(feature_families, features_ignore_list)[protocol]:
+            # As in the records of 'execute', a repeated name keeps its first column and its last feature.
+            features_by_name[feature.name] = feature
+            feature.set_floating_point_unit(None)
+        features = list(features_by_name.values())
+        numeric_features = [feature for feature in features if feature.is_numeric]
+        string_features = [feature for feature in features if not feature.is_numeric]
+        column_order = ["flow_id", "timestamp", "protocol"] + [feature.name for feature in features] + ["label"]
+        string_columns = ["flow_id", "timestamp", "protocol"] + [feature.name for feature in string_features] \
+            + ["label"]
+
+        count_columns = [column for column, feature in enumerate(numeric_features) if feature.is_count]
+        values = numpy.empty((len(flows), len(numeric_features)), dtype=dtype)
+        string_values = numpy.empty((len(flows), len(string_columns)), dtype=object)
+        for row, flow in enumerate(flows):
+            flow_values = values[row]
+            for column, feature in enumerate(numeric_features):
+                value = FeatureExtractor.extract_feature(feature, flow)
+                flow_values[column] = numpy.nan if value is None else value
+            if flow.get_packet_sampling_interval() != 1:
+                flow_values[count_columns] *= flow.get_packet_sampling_interval()
+            flow_strings = string_values[row]
+            flow_strings[0] = str(flow)
+            flow_strings[1] = str(flow.get_timestamp())
+            flow_strings[2] = str(flow.get_protocol())
+            for column, feature in enumerate(string_features, start=3):
+                flow_strings[column] = feature.extract(flow)
+            flow_strings[-1] = label
+
+        return FeatureMatrix(values=values, columns=[feature.name for feature in numeric_features],
+                             string_values=string_values, string_columns=string_columns,
+                             column_order=column_order)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+from typing import List
+
+
+class FeatureMatrix:
+    """
+    The features of a list of flows as NumPy arrays instead of one dictionary per flow.
+
+    Numeric features are stored unformatted in a contiguous 2D float array with one row per flow,
+    and the other columns (flow_id, timestamp, protocol, identifiers, class names, dictionaries of
+    counts and label) in a 2D object array with the same rows. Missing numeric values are NaN.
+
+    Attributes:
+        values (numpy.ndarray): The numeric features, of shape (number of flows, len(columns)).
+        columns (List[str]): The names of the numeric columns.
+        string_values (numpy.ndarray): The other features, of shape (number of flows, len(string_columns)).
+        string_columns (List[str]): The names of the other columns.
+        column_order (List[str]): Every column, in the order of the CSV output.
+    """
+
+    def __init__(self, values, columns: List[str], string_values, string_columns: List[str],
+                 column_order: List[str]):
+        self.values = values
+        self.columns = columns
+        self.string_values = string_values
+        self.string_columns = string_columns
+        self.column_order = column_order
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    @staticmethod
+    def concatenate(matrices: List["FeatureMatrix"]) -> "FeatureMatrix":
+        """
+        Stacks the rows of feature matrices that have the same columns.
+
+        Args:
+            matrices (List[FeatureMatrix]): The matrices to stack, at least one.
+
+        Returns:
+            FeatureMatrix: A matrix with the rows of every matrix, in order.
+        """
+        import numpy
+        if len(matrices) == 1:
+            return matrices[0]
+        first = matrices[0]
+        return FeatureMatrix(values=numpy.concatenate([matrix.values for matrix in matrices]),
+                             columns=first.columns,
+                             string_values=numpy.concatenate([matrix.string_values for matrix in matrices]),
+                             string_columns=first.string_columns,
+                             column_order=first.column_order)
+
+    def to_dataframe(self):
+        """
+        Builds a pandas DataFrame with the columns in the order of the CSV output. The numeric
+        columns share the memory of 'values' where pandas allows it.
+
+        Returns:
+            pandas.DataFrame: The features of each flow.
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise Exception("pandas is required to build a DataFrame. Please install it with 'pip install pandas'.")
+        dataframe = pandas.DataFrame(self.values, columns=self.columns, copy=False)
+        string_positions = {name: index for index, name in enumerate(self.string_columns)}
+        for position, name in enumerate(self.column_order):
+            if name in string_positions:
+                dataframe.insert(position, name, self.string_values[:, string_positions[name]])
+        return dataframe
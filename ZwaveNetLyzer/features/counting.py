@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import math
+from collections import Counter
+from typing import List, Mapping, Tuple, Union
+
+# Series longer than this are counted to find their middle values; shorter ones are faster to sort.
+MIN_COUNTED_MEDIAN_LENGTH = 256
+
+
+def first_mode(value_counts: Mapping) -> Union[int, float]:
+    """
+    Gets the most common value like max(set(values), key=values.count), i.e. the first most common
+    value in the iteration order of the set, in time linear in the number of values.
+
+    Args:
+        value_counts (Mapping): How many times each value was seen, in the order they were first seen,
+            e.g. a Counter of the values. The set of its keys then has the iteration order of a set of the values.
+
+    Returns:
+        int or float: The mode.
+    """
+    # iter() makes the set add the keys one by one, as a set of the values would, instead of
+    # presizing its table for a dictionary, which could change its iteration order.
+    return max(set(iter(value_counts)), key=value_counts.__getitem__)
+
+
+def smallest_mode(value_counts: Mapping) -> Union[int, float]:
+    """
+    Gets the smallest of the most common values, like scipy.stats.mode, in time linear in the number of values.
+
+    Args:
+        value_counts (Mapping): How many times each value was seen, e.g. a Counter of the values.
+
+    Returns:
+        int or float: The mode, or nan if there are no values, like scipy.stats.mode.
+    """
+    if not value_counts:
+        return math.nan
+    highest_count = max(value_counts.values())
+    return min(value for value, count in value_counts.items() if count == highest_count)
+
+
+def order_statistic(value_counts: Mapping, index: int) -> Union[int, float]:
+    """
+    Gets a value by its position in sorted order, from the counts of the values, in time linear in
+    the number of distinct values plus the sort of the distinct values.
+
+    Args:
+        value_counts (Mapping): How many times each value was seen.
+        index (int): The position, from 0 to the number of values - 1.
+
+    Returns:
+        int or float: The value.
+    """
+    position = 0
+    for value in sorted(value_counts):
+        position += value_counts[value]
+        if index < position:
+            return value
+    raise IndexError("order statistic index out of range")
+
+
+def middle_values(values: List[Union[int, float]]) -> Tuple[Union[int, float], Union[int, float]]:
+    """
+    Gets the two middle values of a series in sorted order, which are the same value if its length
+    is odd. Long series of few distinct values, such as speeds, RSSI values and lengths in bytes,
+    are counted rather than sorted.
+
+    Args:
+        values (List): The values of the series, which must not be empty.
+
+    Returns:
+        Tuple: The values at positions (length - 1) // 2 and length // 2 in sorted order.
+    """
+    if len(values) <= MIN_COUNTED_MEDIAN_LENGTH:
+        sorted_values = sorted(values)
+        middle = len(sorted_values) // 2
+        return sorted_values[~middle], sorted_values[middle]
+    value_counts = Counter(values)
+    return order_statistic(value_counts, (len(values) - 1) // 2), order_statistic(value_counts, len(values) // 2)
+
+
+def median(values: List[Union[int, float]]) -> Union[int, float]:
+    """Gets the median like statistics.median, i.e. the middle value or the mean of the two middle values."""
+    lower, upper = middle_values(values)
+    return upper if len(values) % 2 else (lower + upper) / 2
@@ -6,10 +6,21 @@ from ..flow_capturer import Flow
 from ..protocols import Protocols
 
 class Feature(ABC):
-    """Abstract base class for feature extraction."""
+    """
+    Abstract base class for feature extraction.
+
+    Features whose values are not numbers (identifiers, class names, dictionaries of counts)
+    set 'is_numeric' to False, so that they are kept out of numeric feature matrices.
+
+    Features that count or sum packets or bytes, or divide such a total by the duration, set
+    'is_count' to True, so that they are multiplied by the packet sampling interval of flows
+    assembled from one in N packets.
+    """
     name: str
     protocol: Protocols
     floating_point_unit: str
+    is_numeric: bool = True
+    is_count: bool = False
 
     @abstractmethod
     def extract(self, flow: Flow) -> Union[float, int, str]:
@@ -26,5 +37,11 @@ class Feature(ABC):
         pass
 
     def set_floating_point_unit(self, floating_point_unit: str) -> None:
-        """Sets the floating point unit for the feature."""
+        """Sets the floating point unit for the feature. None keeps the values unformatted."""
         self.floating_point_unit = floating_point_unit
+
+    def format_value(self, value: float) -> Union[float, str]:
+        """Formats a floating point value with the floating point unit, unless the unit is None."""
+        if self.floating_point_unit is None:
+            return value
+        return format(value, self.floating_point_unit)
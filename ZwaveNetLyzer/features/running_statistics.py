@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+import math
+from collections import Counter
+from fractions import Fraction
+from typing import Union
+from . import counting
+from .sketches import HeavyHittersSketch, QuantileSketch
+
+
+class RunningStatistics:
+    """
+    Summary statistics of a series of values that grows one value at a time, so that the statistics
+    of a growing flow cost the values added since they were last read rather than the whole series.
+
+    The count, the power sums up to the fourth, the minimum, the maximum and the number of times each
+    value was seen are kept. Integral values are summed as Python integers, so the sums are exact, and
+    the mean, the variances and the central moments, times a power of the count, are integers
+    computed from them that are only rounded once, by a division to float. The median and the modes are computed from the value counts, so they cost
+    the number of distinct values, which is small for speeds, RSSI values, lengths and time deltas in
+    microseconds.
+
+    With a 'sketch_size', the value counts are replaced by the SketchedStatistics of the series, so
+    the memory is bounded however many distinct values the series has, and the median and the modes
+    are approximate beyond 'sketch_size' values.
+
+    Attributes:
+        unit (int): The values are divided by it when they are read, e.g. 10**6 for time deltas that
+            are added in microseconds and read in seconds.
+        count (int): The number of values.
+        minimum: The smallest value, or None if there are no values.
+        maximum: The largest value, or None if there are no values.
+        value_counts (Counter): How many times each value was seen, in the order they were first seen,
+            or None with a sketch size.
+        sketches (SketchedStatistics): The sketches of the series with a sketch size, or None.
+    """
+
+    def __init__(self, unit: int = 1, sketch_size: int = None):
+        self.unit = unit
+        self.count = 0
+        self.power_sums = [0, 0, 0, 0]
+        self.minimum = None
+        self.maximum = None
+        self.value_counts = Counter() if sketch_size is None else None
+        self.sketches = SketchedStatistics(unit, sketch_size) if sketch_size is not None else None
+
+    def add(self, value: Union[int, float]) -> None:
+        """
+        Adds a value to the series.
+
+        Args:
+            value (int or float): The value. Floats are summed exactly too, as integers if they are integral.
+        """
+        self.count += 1
+        if self.value_counts is not None:
+            self.value_counts[value] += 1
+        else:
+            self.sketches.add(value)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        exact_value = value if isinstance(value, int) else \
+            int(value) if value.is_integer() else Fraction(value)
+        power = exact_value
+        for index in range(4):
+            self.power_sums[index] += power
+            power *= exact_value
+
+    def merge(self, running_statistics: "RunningStatistics") -> None:
+        """
+        Adds the values of another series, as if they were added one by one after the values of this one.
+
+        Args:
+            running_statistics (RunningStatistics): The statistics of the other series, with the same
+                unit and without a sketch size. They are not changed.
+        """
+        if self.value_counts is None or running_statistics.value_counts is None:
+            raise Exception("Only the statistics of series without a sketch size can be merged.")
+        if running_statistics.count == 0:
+            return
+        self.count += running_statistics.count
+        self.value_counts.update(running_statistics.value_counts)
+        if self.minimum is None or running_statistics.minimum < self.minimum:
+            self.minimum = running_statistics.minimum
+        if self.maximum is None or running_statistics.maximum > self.maximum:
+            self.maximum = running_statistics.maximum
+        self.power_sums = [power_sum + other_power_sum for power_sum, other_power_sum
+                           in zip(self.power_sums, running_statistics.power_sums)]
+
+    def read(self, value: Union[int, float]) -> Union[int, float]:
+        """Converts a value of the series to the unit it is read in."""
+        return value / self.unit if self.unit != 1 else value
+
+    def total(self) -> Union[int, float]:
+        """Gets the sum of the values."""
+        return self.read(self.power_sums[0])
+
+    def mean(self) -> float:
+        """Gets the mean of the values, which must not be empty."""
+        return float(self.power_sums[0] / (self.count * self.unit))
+
+    def pvariance(self) -> float:
+        """Gets the population variance of the values."""
+        return float(self.__scaled_central_moment(2) / (self.count * self.unit) ** 2)
+
+    def variance(self) -> float:
+        """Gets the sample variance of the values, which must have at least two values."""
+        return float(self.__scaled_central_moment(2) / (self.count * (self.count - 1) * self.unit ** 2))
+
+    def pstdev(self) -> float:
+        """Gets the population standard deviation of the values."""
+        return math.sqrt(self.pvariance())
+
+    def skewness(self) -> float:
+        """Gets the biased skewness of the values, like scipy.stats.skew, which is nan for constant values."""
+        second_moment = self.__scaled_central_moment(2)
+        if second_moment == 0:
+            return math.nan
+        return float(self.__scaled_central_moment(3) / self.count ** 3) / float(second_moment / self.count ** 2) ** 1.5
+
+    def kurtosis(self) -> float:
+        """Gets the biased Fisher kurtosis of the values, like scipy.stats.kurtosis, which is nan for constant values."""
+        second_moment = self.__scaled_central_moment(2)
+        if second_moment == 0:
+            return math.nan
+        return float(self.__scaled_central_moment(4) / self.count ** 4) / float(second_moment / self.count ** 2) ** 2 - 3
+
+    def variation(self) -> float:
+        """Gets the population standard deviation divided by the mean, like scipy.stats.variation."""
+        if self.power_sums[0] == 0:
+            return math.nan if self.__scaled_central_moment(2) == 0 else math.inf
+        return self.pstdev() / self.mean()
+
+    def order_statistic(self, index: int) -> Union[int, float]:
+        """
+        Gets a value of the series by its position in sorted order.
+
+        Args:
+            index (int): The position, from 0 to count - 1.
+
+        Returns:
+            int or float: The value, in the unit it is read in.
+        """
+        if self.value_counts is None:
+            return self.sketches.order_statistic(index)
+        return self.read(counting.order_statistic(self.value_counts, index))
+
+    def median(self) -> Union[int, float]:
+        """Gets the median of the values like statistics.median, i.e. the middle value or the mean of the two middle values."""
+        middle = self.count // 2
+        if self.count % 2:
+            return self.order_statistic(middle)
+        return (self.order_statistic(middle - 1) + self.order_statistic(middle)) / 2
+
+    def first_mode(self) -> Union[int, float]:
+        """
+        Gets the most common value like max(set(values), key=values.count), which returns the first
+        most common value in the iteration order of the set. The set is built from the distinct
+        values in the order they were first seen, which gives it the same order as a set of the values.
+        """
+        if self.value_counts is None:
+            return self.sketches.first_mode()
+        return self.read(counting.first_mode(self.value_counts))
+
+    def smallest_mode(self) -> Union[int, float]:
+        """Gets the smallest of the most common values, like scipy.stats.mode."""
+        if self.value_counts is None:
+            return self.sketches.smallest_mode()
+        return self.read(counting.smallest_mode(self.value_counts))
+
+    def __scaled_central_moment(self, order: int) -> Union[int, Fraction]:
+        # count ** order times the central moment is the sum of (count * x - S1) ** order divided by
+        # count, whose binomial expansion over the power sums S1 to S4 has integer terms.
+        count, total = self.count, self.power_sums[0]
+        return (-total) ** order + sum(math.comb(order, power) * count ** (power - 1) * self.power_sums[power - 1]
+                                       * (-total) ** (order - power) for power in range(1, order + 1))
+
+
+class SketchedStatistics:
+    """
+    The median and the modes of a series of values, from a QuantileSketch and a HeavyHittersSketch
+    of 'sketch_size' values, without the other statistics of RunningStatistics.
+
+    Attributes:
+        unit (int): The values are divided by it when they are read, see RunningStatistics.
+        quantile_sketch (QuantileSketch): The sketch of the median.
+        heavy_hitters (HeavyHittersSketch): The sketch of the modes.
+    """
+
+    def __init__(self, unit: int = 1, sketch_size: int = 200):
+        self.unit = unit
+        self.quantile_sketch = QuantileSketch(sketch_size)
+        self.heavy_hitters = HeavyHittersSketch(sketch_size)
+
+    @property
+    def count(self) -> int:
+        """The number of values."""
+        return self.quantile_sketch.count
+
+    def add(self, value: Union[int, float]) -> None:
+        """Adds a value to the series."""
+        self.quantile_sketch.update(value)
+        self.heavy_hitters.update(value)
+
+    def read(self, value: Union[int, float]) -> Union[int, float]:
+        """Converts a value of the series to the unit it is read in."""
+        return value / self.unit if self.unit != 1 else value
+
+    def order_statistic(self, index: int) -> Union[int, float]:
+        """Gets a value of the series by its position in sorted order, exact up to 'sketch_size' values."""
+        return self.read(self.quantile_sketch.get_value_at_rank(index))
+
+    def median(self) -> Union[int, float]:
+        """Gets the median of the values like statistics.median, from the quantile sketch."""
+        middle = self.count // 2
+        if self.count % 2:
+            return self.order_statistic(middle)
+        return (self.order_statistic(middle - 1) + self.order_statistic(middle)) / 2
+
+    def first_mode(self) -> Union[int, float]:
+        """Gets the first most common value like RunningStatistics.first_mode, from the heavy hitters sketch."""
+        return self.read(counting.first_mode(self.heavy_hitters.counts))
+
+    def smallest_mode(self) -> Union[int, float]:
+        """Gets the smallest of the most common values like scipy.stats.mode, from the heavy hitters sketch."""
+        return self.read(counting.smallest_mode(self.heavy_hitters.counts))
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import math
+import random
+from typing import Dict, List, Union
+
+
+class QuantileSketch:
+    """
+    A KLL quantile sketch: the values of a series are kept in compactors, one per level, where a
+    value of level h stands for 2 ** h values of the series. When the compactors are full, the
+    lowest full one is sorted and every other value, from a random offset, moves up a level.
+
+    The capacities of the compactors shrink by 2/3 from the top level down, so the sketch keeps
+    about 3 * size values plus the number of levels, whatever the length of the series. The series
+    is kept exactly up to 'size' values. Beyond that, the value returned for a rank is within about
+    1.7% of the series length of it for size=200, with 99% confidence, and the error shrinks in
+    proportion to 1 / size. The offsets are drawn from a generator with a fixed seed, so the same
+    series gives the same sketch in every run.
+
+    Attributes:
+        size (int): The capacity of the top compactor, k in the KLL paper.
+        count (int): The number of values of the series.
+    """
+
+    CAPACITY_RATIO = 2 / 3
+    MIN_CAPACITY = 2
+
+    def __init__(self, size: int = 200, seed: int = 0):
+        if size < self.MIN_CAPACITY:
+            raise Exception(f"Invalid sketch size: {size}. It must be {self.MIN_CAPACITY} or more.")
+        self.size = size
+        self.count = 0
+        self.__seed = seed
+        self.__random: random.Random = None
+        self.__compactors: List[list] = [[]]
+        self.__capacities: List[int] = [size]
+        self.__retained = 0
+
+    def update(self, value: Union[int, float]) -> None:
+        """Adds a value of the series."""
+        self.__compactors[0].append(value)
+        self.count += 1
+        self.__retained += 1
+        if self.__retained > sum(self.__capacities):
+            self.__compress()
+
+    def __compress(self) -> None:
+        for level, compactor in enumerate(self.__compactors):
+            if len(compactor) < self.__capacities[level]:
+                continue
+            if level + 1 == len(self.__compactors):
+                self.__compactors.append([])
+                height = len(self.__compactors)
+                self.__capacities = [max(math.ceil(self.size * self.CAPACITY_RATIO ** (height - level - 1)),
+                                         self.MIN_CAPACITY) for level in range(height)]
+            if self.__random is None:
+                self.__random = random.Random(self.__seed)
+            compactor.sort()
+            # An odd value out stays at its level, so that the weights of the series are kept.
+            kept_value = [compactor.pop()] if len(compactor) % 2 else []
+            promoted_values = compactor[self.__random.randrange(2)::2]
+            self.__compactors[level + 1].extend(promoted_values)
+            self.__compactors[level] = kept_value
+            self.__retained -= len(compactor) - len(promoted_values)
+            return
+
+    def get_value_at_rank(self, rank: int) -> Union[int, float]:
+        """
+        Gets the value of the series at a position in sorted order.
+
+        Args:
+            rank (int): The position, from 0 to count - 1.
+
+        Returns:
+            int or float: The value, exact if the series has at most 'size' values.
+        """
+        weighted_values = sorted((value, 1 << level) for level, compactor in enumerate(self.__compactors)
+                                 for value in compactor)
+        position = 0
+        for value, weight in weighted_values:
+            position += weight
+            if rank < position:
+                return value
+        raise IndexError("quantile sketch rank out of range")
+
+
+class HeavyHittersSketch:
+    """
+    A Misra-Gries heavy hitters sketch: the counts of at most 'size' values of a series. When a
+    new value arrives and every counter is used, every count is decreased by one and the values
+    whose count falls to zero are dropped, which costs O(1) time per value on average.
+
+    The counts are exact while the series has at most 'size' distinct values. Otherwise a count is
+    at most count / (size + 1) lower than the true one, every value seen more often than that is
+    kept, and the most common kept value is a mode up to that error.
+
+    Attributes:
+        size (int): The number of counters.
+        count (int): The number of values of the series.
+        counts (Dict): The counts of the kept values, in the order they were added.
+    """
+
+    def __init__(self, size: int = 200):
+        if size < 1:
+            raise Exception(f"Invalid sketch size: {size}. It must be 1 or more.")
+        self.size = size
+        self.count = 0
+        self.counts: Dict = {}
+
+    def update(self, value: Union[int, float]) -> None:
+        """Adds a value of the series."""
+        self.count += 1
+        counts = self.counts
+        if value in counts:
+            counts[value] += 1
+        elif len(counts) < self.size:
+            counts[value] = 1
+        else:
+            self.counts = {kept_value: count - 1 for kept_value, count in counts.items() if count > 1} \
+                or {value: 0}  # Every kept value was seen once, so any of them is a mode up to the error.
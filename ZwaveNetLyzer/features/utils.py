@@ -1,13 +1,40 @@
 #!/usr/bin/env python3
 
+import importlib
 from typing import List
 from ..flow_capturer.packet import Packet
 
+
+class LazyModule:
+    """
+    A stand-in for a module that is imported the first time one of its attributes is used.
+
+    Heavy dependencies such as scipy and numpy take longer to import than most runs of the
+    command line need, e.g. for --help or for features that do not use them.
+
+    Attributes:
+        module_name (str): The name of the module to import.
+    """
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self.__module = None
+
+    def __getattr__(self, attribute_name: str):
+        if self.__module is None:
+            self.__module = importlib.import_module(self.module_name)
+        return getattr(self.__module, attribute_name)
+
+
 def packets_delta_time_calculation(packets: List[Packet]):
     packets_time = [packet.get_timestamp() for packet in packets]
     if len(packets_time) <= 1:
         return [-1]
-    sorted_packets_time = sorted(packets_time)
     packets_time_delta = [(pkt - pkt_prev).total_seconds() for pkt_prev, pkt in
-                            zip(sorted_packets_time[:-1], sorted_packets_time[1:])]
+                            zip(packets_time[:-1], packets_time[1:])]
+    # The packets of a flow are in timestamp order unless the input was not; sort only then.
+    if min(packets_time_delta) < 0:
+        sorted_packets_time = sorted(packets_time)
+        packets_time_delta = [(pkt - pkt_prev).total_seconds() for pkt_prev, pkt in
+                                zip(sorted_packets_time[:-1], sorted_packets_time[1:])]
     return packets_time_delta
@@ -1,6 +1,14 @@
 #!/usr/bin/python3
 
-from .len_related import *
-from .rate_related import *
-from .time_related import *
-from .header_related import *
\ No newline at end of file
+import importlib
+
+FEATURE_FAMILIES = ["len_related", "rate_related", "time_related", "header_related"]
+
+
+def __getattr__(name: str):
+    """Imports the feature families on first use instead of when the package is imported."""
+    for family in FEATURE_FAMILIES:
+        module = importlib.import_module(f"{__name__}.{family}")
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,19 +2,24 @@
 
 import math
 from statistics import pstdev, variance, mean
-from scipy.stats import skew, kurtosis
 from math import log2
-from numpy import corrcoef
 from collections import Counter
 from itertools import groupby
 from ...flow_capturer.flows import ZwaveFlow
+from ...flow_capturer.packets import ZwavePacket
 from ..feature import Feature
+from .. import counting
+from ..utils import LazyModule
 from ...protocols import Protocols
 
+stats = LazyModule("scipy.stats")
+numpy = LazyModule("numpy")
+
 
 class ZwaveFlowHomeID(Feature):
     protocol = Protocols.Zwave
     name = "home_id"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         return zwave_flow.get_home_id()
 
@@ -22,6 +27,7 @@ class ZwaveFlowHomeID(Feature):
 class ZwaveFlowSrcID(Feature):
     protocol = Protocols.Zwave
     name = "src_id"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         return zwave_flow.get_src_id()
 
@@ -29,10 +35,19 @@ class ZwaveFlowSrcID(Feature):
 class ZwaveFlowDstID(Feature):
     protocol = Protocols.Zwave
     name = "dst_id"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         return zwave_flow.get_dst_id()
 
 
+class TerminationReason(Feature):
+    protocol = Protocols.Zwave
+    name = "termination_reason"
+    is_numeric = False
+    def extract(self, zwave_flow: ZwaveFlow) -> str:
+        return zwave_flow.get_termination_reason()
+
+
 class AverageSpeed(Feature):
     protocol = Protocols.Zwave
     name = "average_speed"
@@ -45,9 +60,11 @@ class MedianSpeed(Feature):
     protocol = Protocols.Zwave
     name = "median_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        speeds = sorted([packet.get_speed() for packet in zwave_flow.get_packets()])
-        mid = len(speeds) // 2
-        return (speeds[mid] + speeds[~mid]) / 2 if speeds else 0
+        speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
+        if not speeds:
+            return 0
+        lower, upper = counting.middle_values(speeds)
+        return (lower + upper) / 2
 
 
 class ModeSpeed(Feature):
@@ -57,7 +74,7 @@ class ModeSpeed(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
         if not speeds:
             return 0
-        return max(set(speeds), key=speeds.count)
+        return counting.first_mode(Counter(speeds))
 
 
 class StdDevSpeed(Feature):
@@ -65,7 +82,7 @@ class StdDevSpeed(Feature):
     name = "stddev_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
-        return format(pstdev(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(pstdev(speeds)) if speeds else 0
 
 
 class MinSpeed(Feature):
@@ -97,7 +114,7 @@ class SpeedVariance(Feature):
     name = "speed_variance"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
-        return format(variance(speeds), self.floating_point_unit) if len(speeds) > 1 else 0
+        return self.format_value(variance(speeds)) if len(speeds) > 1 else 0
 
 
 class CoeffVariationSpeed(Feature):
@@ -106,7 +123,7 @@ class CoeffVariationSpeed(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
         avg_speed = mean(speeds) if speeds else 0
-        return format((pstdev(speeds) / avg_speed), self.floating_point_unit) if avg_speed != 0 else 0
+        return self.format_value((pstdev(speeds) / avg_speed)) if avg_speed != 0 else 0
 
 
 class SpeedSkewness(Feature):
@@ -114,7 +131,7 @@ class SpeedSkewness(Feature):
     name = "speed_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
-        return format(skew(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(stats.skew(speeds)) if speeds else 0
 
 
 class FwdAverageSpeed(Feature):
@@ -129,9 +146,11 @@ class FwdMedianSpeed(Feature):
     protocol = Protocols.Zwave
     name = "fwd_median_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        speeds = sorted([packet.get_speed() for packet in zwave_flow.get_forward_packets()])
-        mid = len(speeds) // 2
-        return (speeds[mid] + speeds[~mid]) / 2 if speeds else 0
+        speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
+        if not speeds:
+            return 0
+        lower, upper = counting.middle_values(speeds)
+        return (lower + upper) / 2
 
 
 class FwdModeSpeed(Feature):
@@ -141,7 +160,7 @@ class FwdModeSpeed(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
         if not speeds:
             return 0
-        return max(set(speeds), key=speeds.count)
+        return counting.first_mode(Counter(speeds))
 
 
 class FwdStdDevSpeed(Feature):
@@ -149,7 +168,7 @@ class FwdStdDevSpeed(Feature):
     name = "fwd_stddev_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
-        return format(pstdev(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(pstdev(speeds)) if speeds else 0
 
 
 class FwdMinSpeed(Feature):
@@ -181,7 +200,7 @@ class FwdSpeedVariance(Feature):
     name = "fwd_speed_variance"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
-        return format(variance(speeds), self.floating_point_unit) if len(speeds) > 1 else 0
+        return self.format_value(variance(speeds)) if len(speeds) > 1 else 0
 
 
 class FwdCoeffVariationSpeed(Feature):
@@ -190,7 +209,7 @@ class FwdCoeffVariationSpeed(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
         avg_speed = mean(speeds) if speeds else 0
-        return format((pstdev(speeds) / avg_speed), self.floating_point_unit) if avg_speed != 0 else 0
+        return self.format_value((pstdev(speeds) / avg_speed)) if avg_speed != 0 else 0
 
 
 class FwdSpeedSkewness(Feature):
@@ -198,7 +217,7 @@ class FwdSpeedSkewness(Feature):
     name = "fwd_speed_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
-        return format(skew(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(stats.skew(speeds)) if speeds else 0
 
 
 class BwdAverageSpeed(Feature):
@@ -213,9 +232,11 @@ class BwdMedianSpeed(Feature):
     protocol = Protocols.Zwave
     name = "bwd_median_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        speeds = sorted([packet.get_speed() for packet in zwave_flow.get_backward_packets()])
-        mid = len(speeds) // 2
-        return (speeds[mid] + speeds[~mid]) / 2 if speeds else 0
+        speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
+        if not speeds:
+            return 0
+        lower, upper = counting.middle_values(speeds)
+        return (lower + upper) / 2
 
 
 class BwdModeSpeed(Feature):
@@ -225,7 +246,7 @@ class BwdModeSpeed(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
         if not speeds:
             return 0
-        return max(set(speeds), key=speeds.count)
+        return counting.first_mode(Counter(speeds))
 
 
 class BwdStdDevSpeed(Feature):
@@ -233,7 +254,7 @@ class BwdStdDevSpeed(Feature):
     name = "bwd_stddev_speed"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
-        return format(pstdev(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(pstdev(speeds)) if speeds else 0
 
 
 class BwdMinSpeed(Feature):
@@ -265,7 +286,7 @@ class BwdSpeedVariance(Feature):
     name = "bwd_speed_variance"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
-        return format(variance(speeds), self.floating_point_unit) if len(speeds) > 1 else 0
+        return self.format_value(variance(speeds)) if len(speeds) > 1 else 0
 
 
 class BwdCoeffVariationSpeed(Feature):
@@ -274,7 +295,7 @@ class BwdCoeffVariationSpeed(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
         avg_speed = mean(speeds) if speeds else 0
-        return format((pstdev(speeds) / avg_speed), self.floating_point_unit) if avg_speed != 0 else 0
+        return self.format_value((pstdev(speeds) / avg_speed)) if avg_speed != 0 else 0
 
 
 class BwdSpeedSkewness(Feature):
@@ -282,12 +303,13 @@ class BwdSpeedSkewness(Feature):
     name = "bwd_speed_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
-        return format(skew(speeds), self.floating_point_unit) if speeds else 0
+        return self.format_value(stats.skew(speeds)) if speeds else 0
 
 
 class CountEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "count_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_packets()]
         class_count = {}
@@ -302,6 +324,7 @@ class CountEachPacketClass(Feature):
 class ProportionEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "proportion_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_packets()]
         class_count = {}
@@ -314,6 +337,7 @@ class ProportionEachPacketClass(Feature):
 class ProportionEachApplicationType(Feature):
     protocol = Protocols.Zwave
     name = "proportion_each_application_type"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_packets()]
         app_count = {}
@@ -326,6 +350,7 @@ class ProportionEachApplicationType(Feature):
 class FwdCountEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_forward_packets()]
         class_count = {}
@@ -340,6 +365,7 @@ class FwdCountEachPacketClass(Feature):
 class FwdProportionEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "fwd_proportion_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_forward_packets()]
         class_count = {}
@@ -352,6 +378,7 @@ class FwdProportionEachPacketClass(Feature):
 class FwdProportionEachApplicationType(Feature):
     protocol = Protocols.Zwave
     name = "fwd_proportion_each_application_type"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_forward_packets()]
         app_count = {}
@@ -364,6 +391,7 @@ class FwdProportionEachApplicationType(Feature):
 class BwdCountEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_backward_packets()]
         class_count = {}
@@ -378,6 +406,7 @@ class BwdCountEachPacketClass(Feature):
 class BwdProportionEachPacketClass(Feature):
     protocol = Protocols.Zwave
     name = "bwd_proportion_each_packet_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_backward_packets()]
         class_count = {}
@@ -390,6 +419,7 @@ class BwdProportionEachPacketClass(Feature):
 class BwdProportionEachApplicationType(Feature):
     protocol = Protocols.Zwave
     name = "bwd_proportion_each_application_type"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_backward_packets()]
         app_count = {}
@@ -411,9 +441,11 @@ class MedianRSSI(Feature):
     protocol = Protocols.Zwave
     name = "median_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        rssis = sorted([packet.get_rssi() for packet in zwave_flow.get_packets()])
-        mid = len(rssis) // 2
-        return (rssis[mid] + rssis[~mid]) / 2 if rssis else 0
+        rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
+        if not rssis:
+            return 0
+        lower, upper = counting.middle_values(rssis)
+        return (lower + upper) / 2
 
 
 class ModeRSSI(Feature):
@@ -423,7 +455,7 @@ class ModeRSSI(Feature):
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
         if not rssis:
             return 0
-        return max(set(rssis), key=rssis.count)
+        return counting.first_mode(Counter(rssis))
 
 
 class StdDevRSSI(Feature):
@@ -431,7 +463,7 @@ class StdDevRSSI(Feature):
     name = "stddev_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
-        return format(pstdev(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(pstdev(rssis)) if rssis else 0
 
 
 class MinRSSI(Feature):
@@ -463,7 +495,7 @@ class RSSIVariance(Feature):
     name = "rssi_variance"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
-        return format(variance(rssis), self.floating_point_unit) if len(rssis) > 1 else 0
+        return self.format_value(variance(rssis)) if len(rssis) > 1 else 0
 
 
 class CoeffVariationSpeed(Feature):
@@ -480,7 +512,7 @@ class RSSISkewness(Feature):
     name = "rssi_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
-        return format(skew(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.skew(rssis)) if rssis else 0
 
 
 class RSSIKurtosis(Feature):
@@ -488,7 +520,7 @@ class RSSIKurtosis(Feature):
     name = "rssi_kurtosis"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
-        return format(kurtosis(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.kurtosis(rssis)) if rssis else 0
 
 
 class FwdAverageRSSI(Feature):
@@ -503,9 +535,11 @@ class FwdMedianRSSI(Feature):
     protocol = Protocols.Zwave
     name = "fwd_median_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        rssis = sorted([packet.get_rssi() for packet in zwave_flow.get_forward_packets()])
-        mid = len(rssis) // 2
-        return (rssis[mid] + rssis[~mid]) / 2 if rssis else 0
+        rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
+        if not rssis:
+            return 0
+        lower, upper = counting.middle_values(rssis)
+        return (lower + upper) / 2
 
 
 class FwdModeRSSI(Feature):
@@ -515,7 +549,7 @@ class FwdModeRSSI(Feature):
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
         if not rssis:
             return 0
-        return max(set(rssis), key=rssis.count)
+        return counting.first_mode(Counter(rssis))
 
 
 class FwdStdDevRSSI(Feature):
@@ -523,7 +557,7 @@ class FwdStdDevRSSI(Feature):
     name = "fwd_stddev_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
-        return format(pstdev(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(pstdev(rssis)) if rssis else 0
 
 
 class FwdMinRSSI(Feature):
@@ -555,7 +589,7 @@ class FwdRSSIVariance(Feature):
     name = "fwd_rssi_variance"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
-        return format(variance(rssis), self.floating_point_unit) if len(rssis) > 1 else 0
+        return self.format_value(variance(rssis)) if len(rssis) > 1 else 0
 
 
 class FwdCoeffVariationSpeed(Feature):
@@ -572,7 +606,7 @@ class FwdRSSISkewness(Feature):
     name = "fwd_rssi_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
-        return format(skew(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.skew(rssis)) if rssis else 0
 
 
 class FwdRSSIKurtosis(Feature):
@@ -580,7 +614,7 @@ class FwdRSSIKurtosis(Feature):
     name = "fwd_rssi_kurtosis"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
-        return format(kurtosis(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.kurtosis(rssis)) if rssis else 0
 
 
 class BwdAverageRSSI(Feature):
@@ -595,9 +629,11 @@ class BwdMedianRSSI(Feature):
     protocol = Protocols.Zwave
     name = "bwd_median_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        rssis = sorted([packet.get_rssi() for packet in zwave_flow.get_backward_packets()])
-        mid = len(rssis) // 2
-        return (rssis[mid] + rssis[~mid]) / 2 if rssis else 0
+        rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
+        if not rssis:
+            return 0
+        lower, upper = counting.middle_values(rssis)
+        return (lower + upper) / 2
 
 
 class BwdModeRSSI(Feature):
@@ -607,7 +643,7 @@ class BwdModeRSSI(Feature):
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
         if not rssis:
             return 0
-        return max(set(rssis), key=rssis.count)
+        return counting.first_mode(Counter(rssis))
 
 
 class BwdStdDevRSSI(Feature):
@@ -615,7 +651,7 @@ class BwdStdDevRSSI(Feature):
     name = "bwd_stddev_rssi"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
-        return format(pstdev(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(pstdev(rssis)) if rssis else 0
 
 
 class BwdMinRSSI(Feature):
@@ -647,7 +683,7 @@ class BwdRSSIVariance(Feature):
     name = "bwd_rssi_variance"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
-        return format(variance(rssis), self.floating_point_unit) if len(rssis) > 1 else 0
+        return self.format_value(variance(rssis)) if len(rssis) > 1 else 0
 
 
 class BwdCoeffVariationSpeed(Feature):
@@ -664,7 +700,7 @@ class BwdRSSISkewness(Feature):
     name = "bwd_rssi_skewness"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
-        return format(skew(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.skew(rssis)) if rssis else 0
 
 
 class BwdRSSIKurtosis(Feature):
@@ -672,12 +708,13 @@ class BwdRSSIKurtosis(Feature):
     name = "bwd_rssi_kurtosis"    
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
-        return format(kurtosis(rssis), self.floating_point_unit) if rssis else 0
+        return self.format_value(stats.kurtosis(rssis)) if rssis else 0
 
 
 class TotalAcknowledgments(Feature):
     protocol = Protocols.Zwave
     name = "total_acknowledgments"   
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.is_ack())
 
@@ -694,6 +731,7 @@ class ProportionAcknowledgedPackets(Feature):
 class TotalCRCErrors(Feature):
     protocol = Protocols.Zwave
     name = "total_crc_errors"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if not packet.is_crc_ok())
 
@@ -710,6 +748,7 @@ class ProportionCRCErrors(Feature):
 class TotalSubstitutedPackets(Feature):
     protocol = Protocols.Zwave
     name = "total_substituted_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.is_substituted())
 
@@ -726,6 +765,7 @@ class ProportionSubstitutedPackets(Feature):
 class CountPacketsWithUnknownHeaders(Feature):
     protocol = Protocols.Zwave
     name = "count_packets_with_unknown_headers"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.is_unknown_header())
 
@@ -742,6 +782,7 @@ class ProportionUnknownHeaderPackets(Feature):
 class CountWakeupBeams(Feature):
     protocol = Protocols.Zwave
     name = "count_wakeup_beams"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.is_wakeup_beam())
 
@@ -759,23 +800,25 @@ class UniqueHexPatternsCount(Feature):
     protocol = Protocols.Zwave
     name = "unique_hex_patterns_count"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        hex_patterns = set(packet.get_hex_data() for packet in zwave_flow.get_packets())
+        hex_patterns = set(packet.get_frame() for packet in zwave_flow.get_packets())
         return len(hex_patterns)
 
 
 class FrequencyOfTopHexPatterns(Feature):
     protocol = Protocols.Zwave
     name = "frequency_of_top_hex_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             if hex_data in hex_pattern_counts:
                 hex_pattern_counts[hex_data] += 1
             else:
                 hex_pattern_counts[hex_data] = 1
         # Return the most frequent patterns, the slicing can be adjusted for more or less patterns
-        return dict(sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5])
+        return {ZwavePacket.to_hex(hex_data): count for hex_data, count in
+                sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5]}
 
 
 class EntropyOfHexData(Feature):
@@ -784,7 +827,7 @@ class EntropyOfHexData(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             hex_pattern_counts[hex_data] = hex_pattern_counts.get(hex_data, 0) + 1
         total = sum(hex_pattern_counts.values())
         entropy = -sum((count / total) * log2(count / total) for count in hex_pattern_counts.values())
@@ -795,8 +838,8 @@ class HexDataPatternLengthVariability(Feature):
     name = "hex_data_pattern_length_variability"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         from statistics import pstdev
-        lengths = [len(packet.get_hex_data()) for packet in zwave_flow.get_packets()]
-        return format(pstdev(lengths), self.floating_point_unit) if lengths else 0
+        lengths = [packet.get_hex_data_length() for packet in zwave_flow.get_packets()]
+        return self.format_value(pstdev(lengths)) if lengths else 0
 
 
 class CrossCorrelationSpeedRSSI(Feature):
@@ -806,7 +849,7 @@ class CrossCorrelationSpeedRSSI(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_packets()]
         rssis = [packet.get_rssi() for packet in zwave_flow.get_packets()]
         if len(speeds) > 1 and len(rssis) > 1:
-            return format(corrcoef(speeds, rssis)[0, 1], self.floating_point_unit)
+            return self.format_value(numpy.corrcoef(speeds, rssis)[0, 1])
         return 0  # Return 0 correlation if there's insufficient data
 
 
@@ -824,6 +867,7 @@ class TimeSeriesAnalysisPacketIntervals(Feature):
 class PercentagePacketsPerChannel(Feature):
     protocol = Protocols.Zwave
     name = "percentage_packets_per_channel"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         channels = [packet.get_channel() for packet in zwave_flow.get_packets()]
         channel_count = {}
@@ -847,6 +891,7 @@ class PercentageHighSpeedTransmissions(Feature):
 class TotalLowSignalPackets(Feature):
     protocol = Protocols.Zwave
     name = "total_low_signal_packets"    
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.is_low())
 
@@ -866,7 +911,7 @@ class AverageChannelUsage(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         channels = [packet.get_channel() for packet in zwave_flow.get_packets()]
         channel_counts = Counter(channels)
-        return format(mean(list(channel_counts.values())), self.floating_point_unit) if channels else 0
+        return self.format_value(mean(list(channel_counts.values()))) if channels else 0
 
 class MostCommonChannel(Feature):
     protocol = Protocols.Zwave
@@ -915,6 +960,7 @@ class EntropyOfChannelUsage(Feature):
 class CommonDataPatterns(Feature):
     protocol = Protocols.Zwave
     name = "common_data_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         data_entries = [packet.get_data() for packet in zwave_flow.get_packets() if packet.get_data()]
         return Counter(data_entries).most_common(1)[0][0] if data_entries else None
@@ -931,6 +977,7 @@ class UniqueDataEntries(Feature):
 class ClassDistribution(Feature):
     protocol = Protocols.Zwave
     name = "class_distribution"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_packets()]
         return Counter(classes)
@@ -939,6 +986,7 @@ class ClassDistribution(Feature):
 class MostCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "most_common_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_packets()]
         return Counter(classes).most_common(1)[0][0] if classes else None
@@ -947,6 +995,7 @@ class MostCommonClass(Feature):
 class LeastCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "least_common_class"    
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_packets()]
         return Counter(classes).most_common()[-1][0] if classes else None
@@ -955,6 +1004,7 @@ class LeastCommonClass(Feature):
 class ApplicationUsageFrequency(Feature):
     protocol = Protocols.Zwave
     name = "application_usage_frequency"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_packets()]
         return Counter(applications)
@@ -963,6 +1013,7 @@ class ApplicationUsageFrequency(Feature):
 class MostCommonApplication(Feature):
     protocol = Protocols.Zwave
     name = "most_common_application"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         applications = [packet.get_application() for packet in zwave_flow.get_packets()]
         return Counter(applications).most_common(1)[0][0] if applications else None
@@ -980,7 +1031,7 @@ class HeaderPatternConsistency(Feature):
     protocol = Protocols.Zwave
     name = "header_pattern_consistency"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_packets()]
         most_common_count = Counter(headers).most_common(1)[0][1] if headers else 0
         total_headers = len(headers)
         return most_common_count / total_headers if total_headers > 0 else 0
@@ -990,7 +1041,7 @@ class HeaderComplexity(Feature):
     protocol = Protocols.Zwave
     name = "header_complexity"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_packets()]
         unique_headers = set(headers)
         total_headers = len(headers)
         return len(unique_headers) / total_headers if total_headers > 0 else 0
@@ -1010,7 +1061,7 @@ class IncrementalDataChange(Feature):
     protocol = Protocols.Zwave
     name = "incremental_data_change"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        data_fields = [packet.get_payload() for packet in zwave_flow.get_packets() if packet.get_payload()]
+        data_fields = [packet.get_frame_payload() for packet in zwave_flow.get_packets() if packet.get_frame_payload()]
         return sum(1 for i in range(1, len(data_fields)) if data_fields[i] != data_fields[i-1])
 
 
@@ -1018,11 +1069,11 @@ class HeaderEntropy(Feature):
     protocol = Protocols.Zwave
     name = "header_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_packets()]
         header_counts = Counter(headers)
         total = sum(header_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in header_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class TemporalStabilityOfClassType(Feature):
@@ -1053,23 +1104,24 @@ class DataFieldEntropy(Feature):
         data_field_counts = Counter(data_fields)
         total = sum(data_field_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in data_field_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class PayloadEntropy(Feature):
     protocol = Protocols.Zwave
     name = "payload_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        payloads = [packet.get_payload() for packet in zwave_flow.get_packets() if packet.get_payload()]
+        payloads = [packet.get_frame_payload() for packet in zwave_flow.get_packets() if packet.get_frame_payload()]
         payloads_counts = Counter(payloads)
         total = sum(payloads_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in payloads_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class CountOfSingleCastPackets(Feature):
     protocol = Protocols.Zwave
     name = "count_of_single_cast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         single_casts = [1 for packet in zwave_flow.get_packets() if packet.get_data() == 'SINGLECAST']
         return len(single_casts)
@@ -1087,6 +1139,7 @@ class ProportionOfSingleCastPackets(Feature):
 class CountOfACKPackets(Feature):
     protocol = Protocols.Zwave
     name = "count_of_ack_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.get_data() == 'TRANSFER_ACKNOWLEDGE')
 
@@ -1103,6 +1156,7 @@ class ProportionOfACKPackets(Feature):
 class CountOfMulticastPackets(Feature):
     protocol = Protocols.Zwave
     name = "count_of_multicast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.get_data() == 'MULTICAST')
 
@@ -1119,6 +1173,7 @@ class ProportionOfMulticastPackets(Feature):
 class CountOfBroadcastPackets(Feature):
     protocol = Protocols.Zwave
     name = "count_of_broadcast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.get_data() == 'BROADCAST')
 
@@ -1135,6 +1190,7 @@ class ProportionOfBroadcastPackets(Feature):
 class CountOfExplorerAutoInclusionPackets(Feature):
     protocol = Protocols.Zwave
     name = "count_of_explorer_autoinclusion_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_packets() if packet.get_data() == 'EXPLORER_AUTOINCLUSION')
 
@@ -1151,6 +1207,7 @@ class ProportionOfExplorerAutoInclusionPackets(Feature):
 class FwdTotalAcknowledgments(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_acknowledgments"   
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.is_ack())
 
@@ -1167,6 +1224,7 @@ class FwdProportionAcknowledgedPackets(Feature):
 class FwdTotalCRCErrors(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_crc_errors"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if not packet.is_crc_ok())
 
@@ -1183,6 +1241,7 @@ class FwdProportionCRCErrors(Feature):
 class FwdTotalSubstitutedPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_substituted_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.is_substituted())
 
@@ -1199,6 +1258,7 @@ class FwdProportionSubstitutedPackets(Feature):
 class FwdCountPacketsWithUnknownHeaders(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_packets_with_unknown_headers"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.is_unknown_header())
 
@@ -1215,6 +1275,7 @@ class FwdProportionUnknownHeaderPackets(Feature):
 class FwdCountWakeupBeams(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_wakeup_beams"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.is_wakeup_beam())
 
@@ -1232,23 +1293,25 @@ class FwdUniqueHexPatternsCount(Feature):
     protocol = Protocols.Zwave
     name = "fwd_unique_hex_patterns_count"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        hex_patterns = set(packet.get_hex_data() for packet in zwave_flow.get_forward_packets())
+        hex_patterns = set(packet.get_frame() for packet in zwave_flow.get_forward_packets())
         return len(hex_patterns)
 
 
 class FwdFrequencyOfTopHexPatterns(Feature):
     protocol = Protocols.Zwave
     name = "fwd_frequency_of_top_hex_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_forward_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             if hex_data in hex_pattern_counts:
                 hex_pattern_counts[hex_data] += 1
             else:
                 hex_pattern_counts[hex_data] = 1
         # Return the most frequent patterns, the slicing can be adjusted for more or less patterns
-        return dict(sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5])
+        return {ZwavePacket.to_hex(hex_data): count for hex_data, count in
+                sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5]}
 
 
 class FwdEntropyOfHexData(Feature):
@@ -1257,7 +1320,7 @@ class FwdEntropyOfHexData(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_forward_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             hex_pattern_counts[hex_data] = hex_pattern_counts.get(hex_data, 0) + 1
         total = sum(hex_pattern_counts.values())
         entropy = -sum((count / total) * log2(count / total) for count in hex_pattern_counts.values())
@@ -1268,8 +1331,8 @@ class FwdHexDataPatternLengthVariability(Feature):
     name = "fwd_hex_data_pattern_length_variability"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         from statistics import pstdev
-        lengths = [len(packet.get_hex_data()) for packet in zwave_flow.get_forward_packets()]
-        return format(pstdev(lengths), self.floating_point_unit) if lengths else 0
+        lengths = [packet.get_hex_data_length() for packet in zwave_flow.get_forward_packets()]
+        return self.format_value(pstdev(lengths)) if lengths else 0
 
 
 class FwdCrossCorrelationSpeedRSSI(Feature):
@@ -1279,7 +1342,7 @@ class FwdCrossCorrelationSpeedRSSI(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_forward_packets()]
         rssis = [packet.get_rssi() for packet in zwave_flow.get_forward_packets()]
         if len(speeds) > 1 and len(rssis) > 1:
-            return format(corrcoef(speeds, rssis)[0, 1], self.floating_point_unit)
+            return self.format_value(numpy.corrcoef(speeds, rssis)[0, 1])
         return 0  # Return 0 correlation if there's insufficient data
 
 
@@ -1297,6 +1360,7 @@ class FwdTimeSeriesAnalysisPacketIntervals(Feature):
 class FwdPercentagePacketsPerChannel(Feature):
     protocol = Protocols.Zwave
     name = "fwd_percentage_packets_per_channel"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         channels = [packet.get_channel() for packet in zwave_flow.get_forward_packets()]
         channel_count = {}
@@ -1320,6 +1384,7 @@ class FwdPercentageHighSpeedTransmissions(Feature):
 class FwdTotalLowSignalPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_low_signal_packets"    
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.is_low())
 
@@ -1339,7 +1404,7 @@ class FwdAverageChannelUsage(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         channels = [packet.get_channel() for packet in zwave_flow.get_forward_packets()]
         channel_counts = Counter(channels)
-        return format(mean(list(channel_counts.values())), self.floating_point_unit) if channels else 0
+        return self.format_value(mean(list(channel_counts.values()))) if channels else 0
 
 class FwdMostCommonChannel(Feature):
     protocol = Protocols.Zwave
@@ -1390,6 +1455,7 @@ class FwdEntropyOfChannelUsage(Feature):
 class FwdCommonDataPatterns(Feature):
     protocol = Protocols.Zwave
     name = "fwd_common_data_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         data_entries = [packet.get_data() for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         return Counter(data_entries).most_common(1)[0][0] if data_entries else None
@@ -1406,6 +1472,7 @@ class FwdUniqueDataEntries(Feature):
 class FwdClassDistribution(Feature):
     protocol = Protocols.Zwave
     name = "fwd_class_distribution"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_forward_packets()]
         return Counter(classes)
@@ -1414,6 +1481,7 @@ class FwdClassDistribution(Feature):
 class FwdMostCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "fwd_most_common_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_forward_packets()]
         return Counter(classes).most_common(1)[0][0] if classes else None
@@ -1422,6 +1490,7 @@ class FwdMostCommonClass(Feature):
 class FwdLeastCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "fwd_least_common_class"    
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_forward_packets()]
         return Counter(classes).most_common()[-1][0] if classes else None
@@ -1430,6 +1499,7 @@ class FwdLeastCommonClass(Feature):
 class FwdApplicationUsageFrequency(Feature):
     protocol = Protocols.Zwave
     name = "fwd_application_usage_frequency"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_forward_packets()]
         return Counter(applications)
@@ -1438,6 +1508,7 @@ class FwdApplicationUsageFrequency(Feature):
 class FwdMostCommonApplication(Feature):
     protocol = Protocols.Zwave
     name = "fwd_most_common_application"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         applications = [packet.get_application() for packet in zwave_flow.get_forward_packets()]
         return Counter(applications).most_common(1)[0][0] if applications else None
@@ -1455,7 +1526,7 @@ class FwdHeaderPatternConsistency(Feature):
     protocol = Protocols.Zwave
     name = "fwd_header_pattern_consistency"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_forward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_forward_packets()]
         most_common_count = Counter(headers).most_common(1)[0][1] if headers else 0
         total_headers = len(headers)
         return most_common_count / total_headers if total_headers > 0 else 0
@@ -1465,7 +1536,7 @@ class FwdHeaderComplexity(Feature):
     protocol = Protocols.Zwave
     name = "fwd_header_complexity"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_forward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_forward_packets()]
         unique_headers = set(headers)
         total_headers = len(headers)
         return len(unique_headers) / total_headers if total_headers > 0 else 0
@@ -1485,7 +1556,7 @@ class FwdIncrementalDataChange(Feature):
     protocol = Protocols.Zwave
     name = "fwd_incremental_data_change"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        data_fields = [packet.get_payload() for packet in zwave_flow.get_forward_packets() if packet.get_payload()]
+        data_fields = [packet.get_frame_payload() for packet in zwave_flow.get_forward_packets() if packet.get_frame_payload()]
         return sum(1 for i in range(1, len(data_fields)) if data_fields[i] != data_fields[i-1])
 
 
@@ -1493,11 +1564,11 @@ class FwdHeaderEntropy(Feature):
     protocol = Protocols.Zwave
     name = "fwd_header_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_forward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_forward_packets()]
         header_counts = Counter(headers)
         total = sum(header_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in header_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class FwdTemporalStabilityOfClassType(Feature):
@@ -1528,23 +1599,24 @@ class FwdDataFieldEntropy(Feature):
         data_field_counts = Counter(data_fields)
         total = sum(data_field_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in data_field_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class FwdPayloadEntropy(Feature):
     protocol = Protocols.Zwave
     name = "fwd_payload_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        payloads = [packet.get_payload() for packet in zwave_flow.get_forward_packets() if packet.get_payload()]
+        payloads = [packet.get_frame_payload() for packet in zwave_flow.get_forward_packets() if packet.get_frame_payload()]
         payloads_counts = Counter(payloads)
         total = sum(payloads_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in payloads_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class FwdCountOfSingleCastPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_of_single_cast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         single_casts = [1 for packet in zwave_flow.get_forward_packets() if packet.get_data() == 'SINGLECAST']
         return len(single_casts)
@@ -1562,6 +1634,7 @@ class FwdProportionOfSingleCastPackets(Feature):
 class FwdCountOfACKPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_of_ack_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.get_data() == 'TRANSFER_ACKNOWLEDGE')
 
@@ -1578,6 +1651,7 @@ class FwdProportionOfACKPackets(Feature):
 class FwdCountOfMulticastPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_of_multicast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.get_data() == 'MULTICAST')
 
@@ -1594,6 +1668,7 @@ class FwdProportionOfMulticastPackets(Feature):
 class FwdCountOfBroadcastPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_of_broadcast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.get_data() == 'BROADCAST')
 
@@ -1610,6 +1685,7 @@ class FwdProportionOfBroadcastPackets(Feature):
 class FwdCountOfExplorerAutoInclusionPackets(Feature):
     protocol = Protocols.Zwave
     name = "fwd_count_of_explorer_autoinclusion_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_forward_packets() if packet.get_data() == 'EXPLORER_AUTOINCLUSION')
 
@@ -1626,6 +1702,7 @@ class FwdProportionOfExplorerAutoInclusionPackets(Feature):
 class BwdTotalAcknowledgments(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_acknowledgments"   
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.is_ack())
 
@@ -1642,6 +1719,7 @@ class BwdProportionAcknowledgedPackets(Feature):
 class BwdTotalCRCErrors(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_crc_errors"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if not packet.is_crc_ok())
 
@@ -1658,6 +1736,7 @@ class BwdProportionCRCErrors(Feature):
 class BwdTotalSubstitutedPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_substituted_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.is_substituted())
 
@@ -1674,6 +1753,7 @@ class BwdProportionSubstitutedPackets(Feature):
 class BwdCountPacketsWithUnknownHeaders(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_packets_with_unknown_headers"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.is_unknown_header())
 
@@ -1690,6 +1770,7 @@ class BwdProportionUnknownHeaderPackets(Feature):
 class BwdCountWakeupBeams(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_wakeup_beams"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.is_wakeup_beam())
 
@@ -1707,23 +1788,25 @@ class BwdUniqueHexPatternsCount(Feature):
     protocol = Protocols.Zwave
     name = "bwd_unique_hex_patterns_count"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        hex_patterns = set(packet.get_hex_data() for packet in zwave_flow.get_backward_packets())
+        hex_patterns = set(packet.get_frame() for packet in zwave_flow.get_backward_packets())
         return len(hex_patterns)
 
 
 class BwdFrequencyOfTopHexPatterns(Feature):
     protocol = Protocols.Zwave
     name = "bwd_frequency_of_top_hex_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_backward_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             if hex_data in hex_pattern_counts:
                 hex_pattern_counts[hex_data] += 1
             else:
                 hex_pattern_counts[hex_data] = 1
         # Return the most frequent patterns, the slicing can be adjusted for more or less patterns
-        return dict(sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5])
+        return {ZwavePacket.to_hex(hex_data): count for hex_data, count in
+                sorted(hex_pattern_counts.items(), key=lambda item: item[1], reverse=True)[:5]}
 
 
 class BwdEntropyOfHexData(Feature):
@@ -1732,7 +1815,7 @@ class BwdEntropyOfHexData(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         hex_pattern_counts = {}
         for packet in zwave_flow.get_backward_packets():
-            hex_data = packet.get_hex_data()
+            hex_data = packet.get_frame()
             hex_pattern_counts[hex_data] = hex_pattern_counts.get(hex_data, 0) + 1
         total = sum(hex_pattern_counts.values())
         entropy = -sum((count / total) * log2(count / total) for count in hex_pattern_counts.values())
@@ -1743,8 +1826,8 @@ class BwdHexDataPatternLengthVariability(Feature):
     name = "bwd_hex_data_pattern_length_variability"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         from statistics import pstdev
-        lengths = [len(packet.get_hex_data()) for packet in zwave_flow.get_backward_packets()]
-        return format(pstdev(lengths), self.floating_point_unit) if lengths else 0
+        lengths = [packet.get_hex_data_length() for packet in zwave_flow.get_backward_packets()]
+        return self.format_value(pstdev(lengths)) if lengths else 0
 
 
 class BwdCrossCorrelationSpeedRSSI(Feature):
@@ -1754,7 +1837,7 @@ class BwdCrossCorrelationSpeedRSSI(Feature):
         speeds = [packet.get_speed() for packet in zwave_flow.get_backward_packets()]
         rssis = [packet.get_rssi() for packet in zwave_flow.get_backward_packets()]
         if len(speeds) > 1 and len(rssis) > 1:
-            return format(corrcoef(speeds, rssis)[0, 1], self.floating_point_unit)
+            return self.format_value(numpy.corrcoef(speeds, rssis)[0, 1])
         return 0  # Return 0 correlation if there's insufficient data
 
 
@@ -1772,6 +1855,7 @@ class BwdTimeSeriesAnalysisPacketIntervals(Feature):
 class BwdPercentagePacketsPerChannel(Feature):
     protocol = Protocols.Zwave
     name = "bwd_percentage_packets_per_channel"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         channels = [packet.get_channel() for packet in zwave_flow.get_backward_packets()]
         channel_count = {}
@@ -1795,6 +1879,7 @@ class BwdPercentageHighSpeedTransmissions(Feature):
 class BwdTotalLowSignalPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_low_signal_packets"    
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.is_low())
 
@@ -1814,7 +1899,7 @@ class BwdAverageChannelUsage(Feature):
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         channels = [packet.get_channel() for packet in zwave_flow.get_backward_packets()]
         channel_counts = Counter(channels)
-        return format(mean(list(channel_counts.values())), self.floating_point_unit) if channels else 0
+        return self.format_value(mean(list(channel_counts.values()))) if channels else 0
 
 class BwdMostCommonChannel(Feature):
     protocol = Protocols.Zwave
@@ -1865,6 +1950,7 @@ class BwdEntropyOfChannelUsage(Feature):
 class BwdCommonDataPatterns(Feature):
     protocol = Protocols.Zwave
     name = "bwd_common_data_patterns"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         data_entries = [packet.get_data() for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         return Counter(data_entries).most_common(1)[0][0] if data_entries else None
@@ -1881,6 +1967,7 @@ class BwdUniqueDataEntries(Feature):
 class BwdClassDistribution(Feature):
     protocol = Protocols.Zwave
     name = "bwd_class_distribution"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         classes = [packet.get_class() for packet in zwave_flow.get_backward_packets()]
         return Counter(classes)
@@ -1889,6 +1976,7 @@ class BwdClassDistribution(Feature):
 class BwdMostCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "bwd_most_common_class"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_backward_packets()]
         return Counter(classes).most_common(1)[0][0] if classes else None
@@ -1897,6 +1985,7 @@ class BwdMostCommonClass(Feature):
 class BwdLeastCommonClass(Feature):
     protocol = Protocols.Zwave
     name = "bwd_least_common_class"    
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         classes = [packet.get_class() for packet in zwave_flow.get_backward_packets()]
         return Counter(classes).most_common()[-1][0] if classes else None
@@ -1905,6 +1994,7 @@ class BwdLeastCommonClass(Feature):
 class BwdApplicationUsageFrequency(Feature):
     protocol = Protocols.Zwave
     name = "bwd_application_usage_frequency"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> dict:
         applications = [packet.get_application() for packet in zwave_flow.get_backward_packets()]
         return Counter(applications)
@@ -1913,6 +2003,7 @@ class BwdApplicationUsageFrequency(Feature):
 class BwdMostCommonApplication(Feature):
     protocol = Protocols.Zwave
     name = "bwd_most_common_application"
+    is_numeric = False
     def extract(self, zwave_flow: ZwaveFlow) -> str:
         applications = [packet.get_application() for packet in zwave_flow.get_backward_packets()]
         return Counter(applications).most_common(1)[0][0] if applications else None
@@ -1930,7 +2021,7 @@ class BwdHeaderPatternConsistency(Feature):
     protocol = Protocols.Zwave
     name = "bwd_header_pattern_consistency"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_backward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_backward_packets()]
         most_common_count = Counter(headers).most_common(1)[0][1] if headers else 0
         total_headers = len(headers)
         return most_common_count / total_headers if total_headers > 0 else 0
@@ -1940,7 +2031,7 @@ class BwdHeaderComplexity(Feature):
     protocol = Protocols.Zwave
     name = "bwd_header_complexity"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_backward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_backward_packets()]
         unique_headers = set(headers)
         total_headers = len(headers)
         return len(unique_headers) / total_headers if total_headers > 0 else 0
@@ -1960,7 +2051,7 @@ class BwdIncrementalDataChange(Feature):
     protocol = Protocols.Zwave
     name = "bwd_incremental_data_change"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
-        data_fields = [packet.get_payload() for packet in zwave_flow.get_backward_packets() if packet.get_payload()]
+        data_fields = [packet.get_frame_payload() for packet in zwave_flow.get_backward_packets() if packet.get_frame_payload()]
         return sum(1 for i in range(1, len(data_fields)) if data_fields[i] != data_fields[i-1])
 
 
@@ -1968,11 +2059,11 @@ class BwdHeaderEntropy(Feature):
     protocol = Protocols.Zwave
     name = "bwd_header_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        headers = [packet.get_header() for packet in zwave_flow.get_backward_packets()]
+        headers = [packet.get_frame_header() for packet in zwave_flow.get_backward_packets()]
         header_counts = Counter(headers)
         total = sum(header_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in header_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class BwdTemporalStabilityOfClassType(Feature):
@@ -2003,23 +2094,24 @@ class BwdDataFieldEntropy(Feature):
         data_field_counts = Counter(data_fields)
         total = sum(data_field_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in data_field_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class BwdPayloadEntropy(Feature):
     protocol = Protocols.Zwave
     name = "bwd_payload_entropy"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        payloads = [packet.get_payload() for packet in zwave_flow.get_backward_packets() if packet.get_payload()]
+        payloads = [packet.get_frame_payload() for packet in zwave_flow.get_backward_packets() if packet.get_frame_payload()]
         payloads_counts = Counter(payloads)
         total = sum(payloads_counts.values())
         entropy = -sum((count / total) * math.log2(count / total) for count in payloads_counts.values()) if total > 0 else 0
-        return format(entropy, self.floating_point_unit)
+        return self.format_value(entropy)
 
 
 class BwdCountOfSingleCastPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_of_single_cast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         single_casts = [1 for packet in zwave_flow.get_backward_packets() if packet.get_data() == 'SINGLECAST']
         return len(single_casts)
@@ -2037,6 +2129,7 @@ class BwdProportionOfSingleCastPackets(Feature):
 class BwdCountOfACKPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_of_ack_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.get_data() == 'TRANSFER_ACKNOWLEDGE')
 
@@ -2053,6 +2146,7 @@ class BwdProportionOfACKPackets(Feature):
 class BwdCountOfMulticastPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_of_multicast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.get_data() == 'MULTICAST')
 
@@ -2069,6 +2163,7 @@ class BwdProportionOfMulticastPackets(Feature):
 class BwdCountOfBroadcastPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_of_broadcast_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.get_data() == 'BROADCAST')
 
@@ -2085,6 +2180,7 @@ class BwdProportionOfBroadcastPackets(Feature):
 class BwdCountOfExplorerAutoInclusionPackets(Feature):
     protocol = Protocols.Zwave
     name = "bwd_count_of_explorer_autoinclusion_packets"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return sum(1 for packet in zwave_flow.get_backward_packets() if packet.get_data() == 'EXPLORER_AUTOINCLUSION')
 
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+
+from collections import Counter, namedtuple
+from datetime import timedelta
+from operator import methodcaller
+from typing import Callable, Dict, List
+from ...flow_capturer import Packet
+from ...flow_capturer.flows import ZwaveFlow
+from ..feature import Feature
+from ..running_statistics import RunningStatistics
+
+
+class ZwaveDirectionStatistics:
+    """
+    The running statistics of the packets of one direction of a Z-Wave flow.
+
+    Args:
+        sketch_size (int): If given, the medians and the modes are computed from sketches of this
+            size, in bounded memory, instead of from the counts of every value.
+
+    Attributes:
+        packets_count (int): The number of packets added so far.
+        is_in_order (bool): False once a packet is older than the one before it, since the time deltas
+            of the batch features are then computed over the sorted timestamps.
+    """
+
+    SERIES = {
+        "speeds": methodcaller("get_speed"),
+        "rssis": methodcaller("get_rssi"),
+        "header_bytes": methodcaller("get_header_bytes"),
+        "payload_bytes": methodcaller("get_payload_bytes"),
+        "packets_len": methodcaller("get_packet_len"),
+    }
+
+    FLAGS = {
+        "ack": lambda packet: packet.is_ack(),
+        "crc_error": lambda packet: not packet.is_crc_ok(),
+        "substituted": lambda packet: packet.is_substituted(),
+        "unknown_header": lambda packet: packet.is_unknown_header(),
+        "wakeup_beam": lambda packet: packet.is_wakeup_beam(),
+        "low_signal": lambda packet: packet.is_low(),
+        "high_speed": lambda packet: packet.get_speed() > 100,
+        "single_cast": lambda packet: packet.get_data() == 'SINGLECAST',
+        "transfer_acknowledge": lambda packet: packet.get_data() == 'TRANSFER_ACKNOWLEDGE',
+        "multicast": lambda packet: packet.get_data() == 'MULTICAST',
+        "broadcast": lambda packet: packet.get_data() == 'BROADCAST',
+        "explorer_autoinclusion": lambda packet: packet.get_data() == 'EXPLORER_AUTOINCLUSION',
+    }
+
+    MICROSECOND = timedelta(microseconds=1)
+
+    def __init__(self, sketch_size: int = None):
+        self.packets_count = 0
+        self.series = {series: RunningStatistics(sketch_size=sketch_size) for series in self.SERIES}
+        self.series["data_field_sizes"] = RunningStatistics(sketch_size=sketch_size)
+        self.series["time_deltas"] = RunningStatistics(unit=10 ** 6, sketch_size=sketch_size)
+        self.flag_counts = Counter()
+        self.is_in_order = True
+        self.__first_timestamp = None
+        self.__last_timestamp = None
+
+    def add_packets(self, packets: List[Packet]) -> None:
+        """
+        Adds the packets of the direction that arrived since the previous call.
+
+        Args:
+            packets (List[Packet]): The new packets, in flow order.
+        """
+        for packet in packets:
+            for series, get_value in self.SERIES.items():
+                self.series[series].add(get_value(packet))
+            if packet.get_data():
+                self.series["data_field_sizes"].add(len(packet.get_data()))
+            for flag, is_flagged in self.FLAGS.items():
+                if is_flagged(packet):
+                    self.flag_counts[flag] += 1
+            timestamp = packet.get_timestamp()
+            if self.__last_timestamp is not None:
+                self.__add_time_delta(timestamp)
+            else:
+                self.__first_timestamp = timestamp
+            self.__last_timestamp = timestamp
+        self.packets_count += len(packets)
+
+    def merge(self, direction_statistics: "ZwaveDirectionStatistics") -> None:
+        """
+        Adds the statistics of the packets of the same direction of a later flow with the same key, as
+        if they were added after the packets of this one.
+
+        Args:
+            direction_statistics (ZwaveDirectionStatistics): The statistics of the later packets, without
+                a sketch size. They are not changed.
+        """
+        if direction_statistics.packets_count == 0:
+            return
+        if self.__last_timestamp is not None:
+            self.__add_time_delta(direction_statistics.__first_timestamp)
+        else:
+            self.__first_timestamp = direction_statistics.__first_timestamp
+        self.__last_timestamp = direction_statistics.__last_timestamp
+        for series, running_statistics in direction_statistics.series.items():
+            self.series[series].merge(running_statistics)
+        self.flag_counts.update(direction_statistics.flag_counts)
+        self.is_in_order = self.is_in_order and direction_statistics.is_in_order
+        self.packets_count += direction_statistics.packets_count
+
+    def __add_time_delta(self, timestamp) -> None:
+        time_delta = (timestamp - self.__last_timestamp) // self.MICROSECOND
+        if time_delta < 0:
+            self.is_in_order = False
+        self.series["time_deltas"].add(time_delta)
+
+
+# An incremental feature computes the value of the batch feature with the same name from a series
+# of one direction, or from the direction and the flow if its series is None. The batch feature is
+# passed for its floating point unit, and is extracted instead while the series has fewer than
+# 'min_values' values, where the batch features have edge cases of their own (e.g. nan, 0 or an
+# error for an empty series, -1 instead of the time deltas of a single packet).
+IncrementalFeature = namedtuple("IncrementalFeature", ["name", "prefix", "series", "min_values", "compute"])
+
+
+def _header_statistics(name: str) -> Dict[str, Callable]:
+    """The statistics of a header_related series, whose names put the statistic first or last."""
+    return {
+        f"average_{name}": lambda values, feature: values.total() / values.count,
+        f"median_{name}": lambda values, feature: (values.order_statistic(values.count // 2)
+                                                   + values.order_statistic((values.count - 1) // 2)) / 2,
+        f"mode_{name}": lambda values, feature: values.first_mode(),
+        f"stddev_{name}": lambda values, feature: feature.format_value(values.pstdev()),
+        f"min_{name}": lambda values, feature: values.minimum,
+        f"max_{name}": lambda values, feature: values.maximum,
+        f"{name}_range": lambda values, feature: values.maximum - values.minimum,
+        f"{name}_variance": lambda values, feature: feature.format_value(values.variance()),
+        f"{name}_skewness": lambda values, feature: feature.format_value(values.skewness()),
+    }
+
+
+def _batch_statistics(name: str, standard_deviation_name: str = "standard_deviation") -> Dict[str, Callable]:
+    """The statistics of a len_related or time_related series."""
+    return {
+        f"max_{name}": lambda values, feature: values.read(values.maximum),
+        f"min_{name}": lambda values, feature: values.read(values.minimum),
+        f"mean_{name}": lambda values, feature: feature.format_value(values.mean()),
+        f"mode_{name}": lambda values, feature: feature.format_value(float(values.smallest_mode())),
+        f"variance_{name}": lambda values, feature: feature.format_value(values.pvariance()),
+        f"{standard_deviation_name}_{name}": lambda values, feature: feature.format_value(values.pstdev()),
+        f"median_{name}": lambda values, feature: feature.format_value(values.median()),
+        f"skewness_{name}": lambda values, feature: feature.format_value(values.skewness()),
+        f"coefficient_of_variation_{name}": lambda values, feature: feature.format_value(values.variation()),
+    }
+
+
+def _proportion(flag: str) -> Callable:
+    return lambda direction, feature, zwave_flow: \
+        direction.flag_counts[flag] / direction.packets_count * 100 if direction.packets_count else 0
+
+
+def _count(flag: str) -> Callable:
+    return lambda direction, feature, zwave_flow: direction.flag_counts[flag]
+
+
+FLAG_FEATURES = {
+    "ack": ("total_acknowledgments", "proportion_acknowledged_packets"),
+    "crc_error": ("total_crc_errors", "proportion_crc_errors"),
+    "substituted": ("total_substituted_packets", "proportion_substituted_packets"),
+    "unknown_header": ("count_packets_with_unknown_headers", "proportion_unknown_header_packets"),
+    "wakeup_beam": ("count_wakeup_beams", "proportion_wakeup_beam_packets"),
+    "low_signal": ("total_low_signal_packets", "percentage_low_signal_packets"),
+    "high_speed": (None, "percentage_high_speed_transmissions"),
+    "single_cast": ("count_of_single_cast_packets", "proportion_of_single_cast_packets"),
+    "transfer_acknowledge": ("count_of_ack_packets", "proportion_of_ack_packets"),
+    "multicast": ("count_of_multicast_packets", "proportion_of_multicast_packets"),
+    "broadcast": ("count_of_broadcast_packets", "proportion_of_broadcast_packets"),
+    "explorer_autoinclusion": ("count_of_explorer_autoinclusion_packets",
+                               "proportion_of_explorer_autoinclusion_packets"),
+}
+
+RATE_FEATURES = {
+    "header_bytes_rate": "header_bytes",
+    "payload_bytes_rate": "payload_bytes",
+    "packet_len_rate": "packets_len",
+}
+
+
+def _rate(series: str) -> Callable:
+    def compute(direction: ZwaveDirectionStatistics, feature: Feature, zwave_flow: ZwaveFlow) -> float:
+        try:
+            return direction.series[series].total() / zwave_flow.get_duration()
+        except ZeroDivisionError:
+            return 0
+    return compute
+
+
+def _packets_rate(direction: ZwaveDirectionStatistics, feature: Feature, zwave_flow: ZwaveFlow) -> float:
+    try:
+        return direction.packets_count / zwave_flow.get_duration()
+    except ZeroDivisionError:
+        return 0
+
+
+def _load_incremental_features() -> Dict[str, IncrementalFeature]:
+    incremental_features = {}
+
+    def add(name: str, prefix: str, series: str, min_values: int, compute: Callable) -> None:
+        incremental_features[prefix + name] = IncrementalFeature(prefix + name, prefix, series, min_values, compute)
+
+    for prefix in ("", "fwd_", "bwd_"):
+        for name, compute in _header_statistics("speed").items():
+            add(name, prefix, "speeds", 2, compute)
+        for name, compute in _header_statistics("rssi").items():
+            add(name, prefix, "rssis", 2, compute)
+        add("rssi_kurtosis", prefix, "rssis", 2, lambda values, feature: feature.format_value(values.kurtosis()))
+        add("coeff_variation_rssi", prefix, "rssis", 2, lambda values, feature:
+            values.pstdev() / values.mean() if values.total() != 0 else 0)
+        for series in ("header_bytes", "payload_bytes", "packets_len"):
+            add(f"total_{series}", prefix, series, 2, lambda values, feature: values.total())
+            for name, compute in _batch_statistics(series).items():
+                add(name, prefix, series, 2, compute)
+        add("total_data_field_size", prefix, "data_field_sizes", 2, lambda values, feature: values.total())
+        for name, compute in _batch_statistics("data_field_size", "std").items():
+            add(name, prefix, "data_field_sizes", 2, compute)
+        for name, compute in _batch_statistics("packets_time_delta").items():
+            add(name, prefix, "time_deltas", 2, compute)
+        for flag, (count_name, proportion_name) in FLAG_FEATURES.items():
+            if count_name is not None:
+                add(count_name, prefix, None, 0, _count(flag))
+            add(proportion_name, prefix, None, 0, _proportion(flag))
+        for name, series in RATE_FEATURES.items():
+            add(name, prefix, None, 0, _rate(series))
+        add("packets_rate", prefix, None, 0, _packets_rate)
+    add("termination_reason", "", None, 0,
+        lambda direction, feature, zwave_flow: zwave_flow.get_termination_reason() or "snapshot")
+    return incremental_features
+
+
+INCREMENTAL_FEATURES: Dict[str, IncrementalFeature] = _load_incremental_features()
+
+# Features that cost the same time however long the flow is, and are extracted as they are.
+CONSTANT_TIME_FEATURES = {"home_id", "src_id", "dst_id", "duration", "packets_count", "fwd_packets_count",
+                          "bwd_packets_count"}
+
+
+class ZwaveFlowSnapshot:
+    """
+    The running statistics of a Z-Wave flow that is still open, in every direction.
+
+    Each update adds only the packets that arrived since the previous one, so taking a snapshot of
+    a flow every N packets costs time proportional to the N packets rather than to the flow. The
+    statistics of consecutive flows with the same key can be merged, which the time windows use to
+    combine the statistics of their panes.
+
+    Args:
+        sketch_size (int): If given, the medians and the modes are approximated with sketches of
+            this size, see RunningStatistics.
+    """
+
+    DIRECTIONS = {
+        "": ZwaveFlow.get_packets,
+        "fwd_": ZwaveFlow.get_forward_packets,
+        "bwd_": ZwaveFlow.get_backward_packets,
+    }
+
+    def __init__(self, sketch_size: int = None):
+        self.directions = {prefix: ZwaveDirectionStatistics(sketch_size) for prefix in self.DIRECTIONS}
+
+    def update(self, zwave_flow: ZwaveFlow) -> None:
+        """
+        Adds the packets that the flow received since the previous update.
+
+        Args:
+            zwave_flow (ZwaveFlow): The flow, which only grows between updates.
+        """
+        for prefix, get_packets in self.DIRECTIONS.items():
+            direction = self.directions[prefix]
+            direction.add_packets(get_packets(zwave_flow)[direction.packets_count:])
+
+    def merge(self, flow_snapshot: "ZwaveFlowSnapshot", is_same_direction: bool = True) -> None:
+        """
+        Adds the statistics of a later flow with the same key, e.g. the next pane of a time window, so
+        that they are the statistics of the flow extended with the later one (see Flow.extend).
+
+        Args:
+            flow_snapshot (ZwaveFlowSnapshot): The statistics of the later flow, without a sketch size.
+                They are not changed.
+            is_same_direction (bool): Whether the forward packets of the later flow are forward in this one.
+        """
+        forward_prefix, backward_prefix = ("fwd_", "bwd_") if is_same_direction else ("bwd_", "fwd_")
+        self.directions[""].merge(flow_snapshot.directions[""])
+        self.directions["fwd_"].merge(flow_snapshot.directions[forward_prefix])
+        self.directions["bwd_"].merge(flow_snapshot.directions[backward_prefix])
+
+    @staticmethod
+    def is_incremental(feature_name: str) -> bool:
+        """Checks whether a snapshot extracts a feature, in time that does not grow with the flow."""
+        return feature_name in INCREMENTAL_FEATURES or feature_name in CONSTANT_TIME_FEATURES
+
+    def extract(self, feature: Feature, zwave_flow: ZwaveFlow):
+        """
+        Extracts a feature of the flow from the snapshot, or from the flow if the feature costs constant
+        time or the series is too short.
+
+        Args:
+            feature (Feature): A feature for which 'is_incremental' is True.
+            zwave_flow (ZwaveFlow): The flow, after the last update.
+
+        Returns:
+            The value of the feature, equal to the one of the batch feature up to float rounding.
+        """
+        incremental_feature = INCREMENTAL_FEATURES.get(feature.name)
+        if incremental_feature is None:
+            return feature.extract(zwave_flow)
+        direction = self.directions[incremental_feature.prefix]
+        if incremental_feature.series is None:
+            return incremental_feature.compute(direction, feature, zwave_flow)
+        values = direction.series[incremental_feature.series]
+        if values.count < incremental_feature.min_values or \
+                (incremental_feature.series == "time_deltas" and not direction.is_in_order):
+            return feature.extract(zwave_flow)
+        return incremental_feature.compute(values, feature)
+
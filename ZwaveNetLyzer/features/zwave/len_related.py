@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 
 import statistics
-from scipy import stats
+from collections import Counter
 from statistics import pstdev, variance, mean
 from ...flow_capturer.flows import ZwaveFlow
 from ..feature import Feature
+from .. import counting
+from ..utils import LazyModule
 from ...protocols import Protocols
 
+stats = LazyModule("scipy.stats")
+
 
 class TotalHeaderBytes(Feature):
     protocol = Protocols.Zwave
     name = "total_header_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
         return sum(header_bytes)
@@ -37,7 +42,7 @@ class MeanHeaderBytes(Feature):
     name = "mean_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.mean(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(header_bytes))
 
 
 class ModeHeaderBytes(Feature):
@@ -45,7 +50,7 @@ class ModeHeaderBytes(Feature):
     name = "mode_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(float(stats.mode(header_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(header_bytes))))
 
 
 class VarianceHeaderBytes(Feature):
@@ -53,7 +58,7 @@ class VarianceHeaderBytes(Feature):
     name = "variance_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.pvariance(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(header_bytes))
 
 
 class StandardDeviationHeaderBytes(Feature):
@@ -61,7 +66,7 @@ class StandardDeviationHeaderBytes(Feature):
     name = "standard_deviation_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.pstdev(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(header_bytes))
 
 
 class MedianHeaderBytes(Feature):
@@ -69,7 +74,7 @@ class MedianHeaderBytes(Feature):
     name = "median_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.median(header_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(header_bytes))
 
 
 class SkewnessHeaderBytes(Feature):
@@ -77,7 +82,7 @@ class SkewnessHeaderBytes(Feature):
     name = "skewness_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(stats.skew(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(header_bytes))
 
 
 class CoefficientOfVariationHeaderBytes(Feature):
@@ -85,7 +90,7 @@ class CoefficientOfVariationHeaderBytes(Feature):
     name = "coefficient_of_variation_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
-        return format(stats.variation(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(header_bytes))
 
 
 class MaxPayloadBytes(Feature):
@@ -99,6 +104,7 @@ class MaxPayloadBytes(Feature):
 class TotalPayloadBytes(Feature):
     protocol = Protocols.Zwave
     name = "total_payload_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
         return sum(payload_bytes)
@@ -117,7 +123,7 @@ class MeanPayloadBytes(Feature):
     name = "mean_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.mean(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(payload_bytes))
 
 
 class ModePayloadBytes(Feature):
@@ -125,7 +131,7 @@ class ModePayloadBytes(Feature):
     name = "mode_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(float(stats.mode(payload_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(payload_bytes))))
 
 
 class VariancePayloadBytes(Feature):
@@ -133,7 +139,7 @@ class VariancePayloadBytes(Feature):
     name = "variance_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.pvariance(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(payload_bytes))
 
 
 class StandardDeviationPayloadBytes(Feature):
@@ -141,7 +147,7 @@ class StandardDeviationPayloadBytes(Feature):
     name = "standard_deviation_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.pstdev(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(payload_bytes))
 
 
 class MedianPayloadBytes(Feature):
@@ -149,7 +155,7 @@ class MedianPayloadBytes(Feature):
     name = "median_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(statistics.median(payload_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(payload_bytes))
 
 
 class SkewnessPayloadBytes(Feature):
@@ -157,7 +163,7 @@ class SkewnessPayloadBytes(Feature):
     name = "skewness_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(stats.skew(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(payload_bytes))
 
 
 class CoefficientOfVariationPayloadBytes(Feature):
@@ -165,12 +171,13 @@ class CoefficientOfVariationPayloadBytes(Feature):
     name = "coefficient_of_variation_payload_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
-        return format(stats.variation(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(payload_bytes))
 
 
 class TotalPacketLen(Feature):
     protocol = Protocols.Zwave
     name = "total_packets_len"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
         return sum(packet_len)
@@ -197,7 +204,7 @@ class MeanPacketLen(Feature):
     name = "mean_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(statistics.mean(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.mean(packet_len))
 
 
 class ModePacketLen(Feature):
@@ -205,7 +212,7 @@ class ModePacketLen(Feature):
     name = "mode_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(float(stats.mode(packet_len)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(packet_len))))
 
 
 class VariancePacketLen(Feature):
@@ -213,7 +220,7 @@ class VariancePacketLen(Feature):
     name = "variance_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(statistics.pvariance(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(packet_len))
 
 
 class StandardDeviationPacketLen(Feature):
@@ -221,7 +228,7 @@ class StandardDeviationPacketLen(Feature):
     name = "standard_deviation_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(statistics.pstdev(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(packet_len))
 
 
 class MedianPacketLen(Feature):
@@ -229,7 +236,7 @@ class MedianPacketLen(Feature):
     name = "median_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(statistics.median(packet_len), self.floating_point_unit)
+        return self.format_value(counting.median(packet_len))
 
 
 class SkewnessPacketLen(Feature):
@@ -237,7 +244,7 @@ class SkewnessPacketLen(Feature):
     name = "skewness_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(stats.skew(packet_len), self.floating_point_unit)
+        return self.format_value(stats.skew(packet_len))
 
 
 class CoefficientOfVariationPacketLen(Feature):
@@ -245,12 +252,13 @@ class CoefficientOfVariationPacketLen(Feature):
     name = "coefficient_of_variation_packets_len"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
-        return format(stats.variation(packet_len), self.floating_point_unit)
+        return self.format_value(stats.variation(packet_len))
 
 
 class TotalDataFieldSize(Feature):
     protocol = Protocols.Zwave
     name = "total_data_field_size"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
         return sum(data_sizes)
@@ -277,7 +285,7 @@ class MeanDataFieldSize(Feature):
     name = "mean_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(statistics.mean(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.mean(data_sizes))
 
 
 class ModeDataFieldSize(Feature):
@@ -285,7 +293,7 @@ class ModeDataFieldSize(Feature):
     name = "mode_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(float(stats.mode(data_sizes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(data_sizes))))
 
 
 class VarianceDataFieldSize(Feature):
@@ -293,7 +301,7 @@ class VarianceDataFieldSize(Feature):
     name = "variance_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(statistics.pvariance(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(data_sizes))
 
 
 class StdDataFieldSize(Feature):
@@ -301,7 +309,7 @@ class StdDataFieldSize(Feature):
     name = "std_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(statistics.pstdev(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(data_sizes))
 
 
 class SkewnessDataFieldSize(Feature):
@@ -309,7 +317,7 @@ class SkewnessDataFieldSize(Feature):
     name = "skewness_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(stats.skew(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.skew(data_sizes))
 
 
 class CoefficientOfVariationDataFieldSize(Feature):
@@ -317,7 +325,7 @@ class CoefficientOfVariationDataFieldSize(Feature):
     name = "coefficient_of_variation_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(stats.variation(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.variation(data_sizes))
 
 
 class MedianDataFieldSize(Feature):
@@ -325,12 +333,13 @@ class MedianDataFieldSize(Feature):
     name = "median_data_field_size"
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_packets() if packet.get_data()]
-        return format(statistics.median(data_sizes), self.floating_point_unit)
+        return self.format_value(counting.median(data_sizes))
 
 
 class FwdTotalHeaderBytes(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_header_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
@@ -365,7 +374,7 @@ class FwdMeanHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.mean(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(header_bytes))
 
 
 class FwdModeHeaderBytes(Feature):
@@ -375,7 +384,7 @@ class FwdModeHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(float(stats.mode(header_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(header_bytes))))
 
 
 class FwdVarianceHeaderBytes(Feature):
@@ -385,7 +394,7 @@ class FwdVarianceHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.pvariance(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(header_bytes))
 
 
 class FwdStandardDeviationHeaderBytes(Feature):
@@ -395,7 +404,7 @@ class FwdStandardDeviationHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.pstdev(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(header_bytes))
 
 
 class FwdMedianHeaderBytes(Feature):
@@ -405,7 +414,7 @@ class FwdMedianHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.median(header_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(header_bytes))
 
 
 class FwdSkewnessHeaderBytes(Feature):
@@ -415,7 +424,7 @@ class FwdSkewnessHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(stats.skew(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(header_bytes))
 
 
 class FwdCoefficientOfVariationHeaderBytes(Feature):
@@ -425,7 +434,7 @@ class FwdCoefficientOfVariationHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(stats.variation(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(header_bytes))
 
 
 class FwdMaxPayloadBytes(Feature):
@@ -441,6 +450,7 @@ class FwdMaxPayloadBytes(Feature):
 class FwdTotalPayloadBytes(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_payload_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
@@ -465,7 +475,7 @@ class FwdMeanPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.mean(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(payload_bytes))
 
 
 class FwdModePayloadBytes(Feature):
@@ -475,7 +485,7 @@ class FwdModePayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(float(stats.mode(payload_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(payload_bytes))))
 
 
 class FwdVariancePayloadBytes(Feature):
@@ -485,7 +495,7 @@ class FwdVariancePayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.pvariance(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(payload_bytes))
 
 
 class FwdStandardDeviationPayloadBytes(Feature):
@@ -495,7 +505,7 @@ class FwdStandardDeviationPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.pstdev(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(payload_bytes))
 
 
 class FwdMedianPayloadBytes(Feature):
@@ -505,7 +515,7 @@ class FwdMedianPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.median(payload_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(payload_bytes))
 
 
 class FwdSkewnessPayloadBytes(Feature):
@@ -515,7 +525,7 @@ class FwdSkewnessPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(stats.skew(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(payload_bytes))
 
 
 class FwdCoefficientOfVariationPayloadBytes(Feature):
@@ -525,12 +535,13 @@ class FwdCoefficientOfVariationPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(stats.variation(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(payload_bytes))
 
 
 class FwdTotalPacketLen(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_packets_len"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
@@ -565,7 +576,7 @@ class FwdMeanPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.mean(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.mean(packet_len))
 
 
 class FwdModePacketLen(Feature):
@@ -575,7 +586,7 @@ class FwdModePacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(float(stats.mode(packet_len)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(packet_len))))
 
 
 class FwdVariancePacketLen(Feature):
@@ -585,7 +596,7 @@ class FwdVariancePacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.pvariance(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(packet_len))
 
 
 class FwdStandardDeviationPacketLen(Feature):
@@ -595,7 +606,7 @@ class FwdStandardDeviationPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.pstdev(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(packet_len))
 
 
 class FwdMedianPacketLen(Feature):
@@ -605,7 +616,7 @@ class FwdMedianPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.median(packet_len), self.floating_point_unit)
+        return self.format_value(counting.median(packet_len))
 
 
 class FwdSkewnessPacketLen(Feature):
@@ -615,7 +626,7 @@ class FwdSkewnessPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(stats.skew(packet_len), self.floating_point_unit)
+        return self.format_value(stats.skew(packet_len))
 
 
 class FwdCoefficientOfVariationPacketLen(Feature):
@@ -625,12 +636,13 @@ class FwdCoefficientOfVariationPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(stats.variation(packet_len), self.floating_point_unit)
+        return self.format_value(stats.variation(packet_len))
 
 
 class FwdTotalDataFieldSize(Feature):
     protocol = Protocols.Zwave
     name = "fwd_total_data_field_size"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
@@ -665,7 +677,7 @@ class FwdMeanDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.mean(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.mean(data_sizes))
 
 
 class FwdModeDataFieldSize(Feature):
@@ -675,7 +687,7 @@ class FwdModeDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(float(stats.mode(data_sizes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(data_sizes))))
 
 
 class FwdVarianceDataFieldSize(Feature):
@@ -685,7 +697,7 @@ class FwdVarianceDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.pvariance(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(data_sizes))
 
 
 class FwdStdDataFieldSize(Feature):
@@ -695,7 +707,7 @@ class FwdStdDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.pstdev(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(data_sizes))
 
 
 class FwdSkewnessDataFieldSize(Feature):
@@ -705,7 +717,7 @@ class FwdSkewnessDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(stats.skew(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.skew(data_sizes))
 
 
 class FwdCoefficientOfVariationDataFieldSize(Feature):
@@ -715,7 +727,7 @@ class FwdCoefficientOfVariationDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(stats.variation(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.variation(data_sizes))
 
 
 class FwdMedianDataFieldSize(Feature):
@@ -725,12 +737,13 @@ class FwdMedianDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_forward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.median(data_sizes), self.floating_point_unit)
+        return self.format_value(counting.median(data_sizes))
 
 
 class BwdTotalHeaderBytes(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_header_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
@@ -765,7 +778,7 @@ class BwdMeanHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.mean(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(header_bytes))
 
 
 class BwdModeHeaderBytes(Feature):
@@ -773,7 +786,7 @@ class BwdModeHeaderBytes(Feature):
     name = "bwd_mode_header_bytes"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
-        return format(float(stats.mode(header_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(header_bytes))))
 
 
 class BwdVarianceHeaderBytes(Feature):
@@ -783,7 +796,7 @@ class BwdVarianceHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.pvariance(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(header_bytes))
 
 
 class BwdStandardDeviationHeaderBytes(Feature):
@@ -793,7 +806,7 @@ class BwdStandardDeviationHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.pstdev(header_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(header_bytes))
 
 
 class BwdMedianHeaderBytes(Feature):
@@ -803,7 +816,7 @@ class BwdMedianHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(statistics.median(header_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(header_bytes))
 
 
 class BwdSkewnessHeaderBytes(Feature):
@@ -813,7 +826,7 @@ class BwdSkewnessHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(stats.skew(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(header_bytes))
 
 
 class BwdCoefficientOfVariationHeaderBytes(Feature):
@@ -823,7 +836,7 @@ class BwdCoefficientOfVariationHeaderBytes(Feature):
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(header_bytes) == 0:
             return 0
-        return format(stats.variation(header_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(header_bytes))
 
 
 class BwdMaxPayloadBytes(Feature):
@@ -839,6 +852,7 @@ class BwdMaxPayloadBytes(Feature):
 class BwdTotalPayloadBytes(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_payload_bytes"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
@@ -863,7 +877,7 @@ class BwdMeanPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.mean(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.mean(payload_bytes))
 
 
 class BwdModePayloadBytes(Feature):
@@ -873,7 +887,7 @@ class BwdModePayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(float(stats.mode(payload_bytes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(payload_bytes))))
 
 
 class BwdVariancePayloadBytes(Feature):
@@ -883,7 +897,7 @@ class BwdVariancePayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.pvariance(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(payload_bytes))
 
 
 class BwdStandardDeviationPayloadBytes(Feature):
@@ -893,7 +907,7 @@ class BwdStandardDeviationPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.pstdev(payload_bytes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(payload_bytes))
 
 
 class BwdMedianPayloadBytes(Feature):
@@ -903,7 +917,7 @@ class BwdMedianPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(statistics.median(payload_bytes), self.floating_point_unit)
+        return self.format_value(counting.median(payload_bytes))
 
 
 class BwdSkewnessPayloadBytes(Feature):
@@ -913,7 +927,7 @@ class BwdSkewnessPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(stats.skew(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.skew(payload_bytes))
 
 
 class BwdCoefficientOfVariationPayloadBytes(Feature):
@@ -923,12 +937,13 @@ class BwdCoefficientOfVariationPayloadBytes(Feature):
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         if len(payload_bytes) == 0:
             return 0
-        return format(stats.variation(payload_bytes), self.floating_point_unit)
+        return self.format_value(stats.variation(payload_bytes))
 
 
 class BwdTotalPacketLen(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_packets_len"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
@@ -963,7 +978,7 @@ class BwdMeanPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.mean(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.mean(packet_len))
 
 
 class BwdModePacketLen(Feature):
@@ -973,7 +988,7 @@ class BwdModePacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(float(stats.mode(packet_len)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(packet_len))))
 
 
 class BwdVariancePacketLen(Feature):
@@ -983,7 +998,7 @@ class BwdVariancePacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.pvariance(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(packet_len))
 
 
 class BwdStandardDeviationPacketLen(Feature):
@@ -993,7 +1008,7 @@ class BwdStandardDeviationPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.pstdev(packet_len), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(packet_len))
 
 
 class BwdMedianPacketLen(Feature):
@@ -1003,7 +1018,7 @@ class BwdMedianPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(statistics.median(packet_len), self.floating_point_unit)
+        return self.format_value(counting.median(packet_len))
 
 
 class BwdSkewnessPacketLen(Feature):
@@ -1013,7 +1028,7 @@ class BwdSkewnessPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(stats.skew(packet_len), self.floating_point_unit)
+        return self.format_value(stats.skew(packet_len))
 
 
 class BwdCoefficientOfVariationPacketLen(Feature):
@@ -1023,12 +1038,13 @@ class BwdCoefficientOfVariationPacketLen(Feature):
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         if len(packet_len) == 0:
             return 0
-        return format(stats.variation(packet_len), self.floating_point_unit)
+        return self.format_value(stats.variation(packet_len))
 
 
 class BwdTotalDataFieldSize(Feature):
     protocol = Protocols.Zwave
     name = "bwd_total_data_field_size"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
@@ -1063,7 +1079,7 @@ class BwdMeanDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.mean(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.mean(data_sizes))
 
 
 class BwdModeDataFieldSize(Feature):
@@ -1073,7 +1089,7 @@ class BwdModeDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(float(stats.mode(data_sizes)[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(data_sizes))))
 
 
 class BwdVarianceDataFieldSize(Feature):
@@ -1083,7 +1099,7 @@ class BwdVarianceDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.pvariance(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(data_sizes))
 
 
 class BwdStdDataFieldSize(Feature):
@@ -1093,7 +1109,7 @@ class BwdStdDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.pstdev(data_sizes), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(data_sizes))
 
 
 class BwdSkewnessDataFieldSize(Feature):
@@ -1103,7 +1119,7 @@ class BwdSkewnessDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(stats.skew(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.skew(data_sizes))
 
 
 class BwdCoefficientOfVariationDataFieldSize(Feature):
@@ -1113,7 +1129,7 @@ class BwdCoefficientOfVariationDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(stats.variation(data_sizes), self.floating_point_unit)
+        return self.format_value(stats.variation(data_sizes))
 
 
 class BwdMedianDataFieldSize(Feature):
@@ -1123,4 +1139,4 @@ class BwdMedianDataFieldSize(Feature):
         data_sizes = [len(packet.get_data()) for packet in zwave_flow.get_backward_packets() if packet.get_data()]
         if len(data_sizes) == 0:
             return 0
-        return format(statistics.median(data_sizes), self.floating_point_unit)
\ No newline at end of file
+        return self.format_value(counting.median(data_sizes))
\ No newline at end of file
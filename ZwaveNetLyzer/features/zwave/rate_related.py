@@ -1,17 +1,20 @@
 #!/usr/bin/env python3
 
 import statistics
-from scipy import stats
 from ...flow_capturer import Flow
 from ...flow_capturer import Packet
 from ...flow_capturer.flows import ZwaveFlow
 from ..feature import Feature
+from ..utils import LazyModule
 from ...protocols import Protocols
 
+stats = LazyModule("scipy.stats")
+
 
 class PacketsCount(Feature):
     protocol = Protocols.Zwave
     name = "packets_count"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return len(zwave_flow.get_packets())
 
@@ -19,6 +22,7 @@ class PacketsCount(Feature):
 class HeaderBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "header_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_packets()]
         try:
@@ -30,6 +34,7 @@ class HeaderBytesRate(Feature):
 class PayloadBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "payload_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_packets()]
         try:
@@ -41,6 +46,7 @@ class PayloadBytesRate(Feature):
 class PacketLenRate(Feature):
     protocol = Protocols.Zwave
     name = "packet_len_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_packets()]
         try:
@@ -52,6 +58,7 @@ class PacketLenRate(Feature):
 class PacketsRate(Feature):
     protocol = Protocols.Zwave
     name = "packets_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         try:
             return len(zwave_flow.get_packets()) / zwave_flow.get_duration()
@@ -62,6 +69,7 @@ class PacketsRate(Feature):
 class FwdPacketsCount(Feature):
     protocol = Protocols.Zwave
     name = "fwd_packets_count"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return len(zwave_flow.get_forward_packets())
 
@@ -69,6 +77,7 @@ class FwdPacketsCount(Feature):
 class FwdHeaderBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "fwd_header_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_forward_packets()]
         try:
@@ -80,6 +89,7 @@ class FwdHeaderBytesRate(Feature):
 class FwdPayloadBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "fwd_payload_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_forward_packets()]
         try:
@@ -91,6 +101,7 @@ class FwdPayloadBytesRate(Feature):
 class FwdPacketLenRate(Feature):
     protocol = Protocols.Zwave
     name = "fwd_packet_len_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_forward_packets()]
         try:
@@ -102,6 +113,7 @@ class FwdPacketLenRate(Feature):
 class FwdPacketsRate(Feature):
     protocol = Protocols.Zwave
     name = "fwd_packets_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         try:
             return len(zwave_flow.get_forward_packets()) / zwave_flow.get_duration()
@@ -112,6 +124,7 @@ class FwdPacketsRate(Feature):
 class BwdPacketsCount(Feature):
     protocol = Protocols.Zwave
     name = "bwd_packets_count"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> int:
         return len(zwave_flow.get_backward_packets())
 
@@ -119,6 +132,7 @@ class BwdPacketsCount(Feature):
 class BwdHeaderBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "bwd_header_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         header_bytes = [packet.get_header_bytes() for packet in zwave_flow.get_backward_packets()]
         try:
@@ -130,6 +144,7 @@ class BwdHeaderBytesRate(Feature):
 class BwdPayloadBytesRate(Feature):
     protocol = Protocols.Zwave
     name = "bwd_payload_bytes_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         payload_bytes = [packet.get_payload_bytes() for packet in zwave_flow.get_backward_packets()]
         try:
@@ -141,6 +156,7 @@ class BwdPayloadBytesRate(Feature):
 class BwdPacketLenRate(Feature):
     protocol = Protocols.Zwave
     name = "bwd_packet_len_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packet_len = [packet.get_packet_len() for packet in zwave_flow.get_backward_packets()]
         try:
@@ -152,6 +168,7 @@ class BwdPacketLenRate(Feature):
 class BwdPacketsRate(Feature):
     protocol = Protocols.Zwave
     name = "bwd_packets_rate"
+    is_count = True
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         try:
             return len(zwave_flow.get_backward_packets()) / zwave_flow.get_duration()
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 
 import statistics
-from scipy import stats
+from collections import Counter
 from ...flow_capturer import Packet
 from ...flow_capturer.flows import ZwaveFlow
 from ..feature import Feature
 from ...protocols import Protocols
-from .. import utils
+from .. import counting, utils
+
+stats = utils.LazyModule("scipy.stats")
 
 class Duration(Feature):
     protocol = Protocols.Zwave
@@ -33,35 +35,35 @@ class MeanPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "mean_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class ModePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "mode_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(float(stats.mode(utils.packets_delta_time_calculation(zwave_flow.get_packets()))[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(utils.packets_delta_time_calculation(zwave_flow.get_packets())))))
 
 
 class VariancePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "variance_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class StandardDeviationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "standard_deviation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class MedianPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "median_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class SkewnessPacketsTimeDelta(Feature):
@@ -69,14 +71,14 @@ class SkewnessPacketsTimeDelta(Feature):
     name = "skewness_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
         packets_time_delta = [packet.get_timestamp() for packet in zwave_flow.get_packets()]
-        return format(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class CoefficientOfVariationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "coefficient_of_variation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_packets())), self.floating_point_unit)
+        return self.format_value(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_packets())))
 
 
 class FwdMaxPacketsTimeDelta(Feature):
@@ -97,49 +99,49 @@ class FwdMeanPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_mean_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class FwdModePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_mode_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(float(stats.mode(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets()))[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))))
 
 
 class FwdVariancePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_variance_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class FwdStandardDeviationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_standard_deviation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class FwdMedianPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_median_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class FwdSkewnessPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_skewness_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class FwdCoefficientOfVariationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "fwd_coefficient_of_variation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())), self.floating_point_unit)
+        return self.format_value(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_forward_packets())))
 
 
 class BwdMaxPacketsTimeDelta(Feature):
@@ -160,46 +162,46 @@ class BwdMeanPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_mean_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.mean(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
 
 
 class BwdModePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_mode_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(float(stats.mode(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets()))[0]), self.floating_point_unit)
+        return self.format_value(float(counting.smallest_mode(Counter(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))))
 
 
 class BwdVariancePacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_variance_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pvariance(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
 
 
 class BwdStandardDeviationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_standard_deviation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.pstdev(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
 
 
 class BwdMedianPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_median_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
+        return self.format_value(statistics.median(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
 
 
 class BwdSkewnessPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_skewness_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
+        return self.format_value(stats.skew(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
 
 
 class BwdCoefficientOfVariationPacketsTimeDelta(Feature):
     protocol = Protocols.Zwave
     name = "bwd_coefficient_of_variation_packets_time_delta"
     def extract(self, zwave_flow: ZwaveFlow) -> float:
-        return format(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())), self.floating_point_unit)
\ No newline at end of file
+        return self.format_value(stats.variation(utils.packets_delta_time_calculation(zwave_flow.get_backward_packets())))
\ No newline at end of file
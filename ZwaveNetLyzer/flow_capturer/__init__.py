@@ -6,3 +6,12 @@ from .flow_capturer import FlowCapturer, ZwaveFlowCapturer
 from .flow import Flow
 from .packet import Packet
 from .flow_factory import FlowFactory
+from .csv_packet_reader import CSVPacketReader
+from .packet_filter import PacketFilter
+from .packet_sampler import PacketSampler
+from .sniffer_merger import SnifferMerger
+from .duplicate_filter import DuplicateFilter
+from .reorder_buffer import ReorderBuffer
+from .flow_windower import FlowWindower
+from .flow_snapshotter import FlowSnapshotter
+from .value_dictionary import ValueDictionary
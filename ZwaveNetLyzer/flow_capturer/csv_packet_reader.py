@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import csv
+import locale
+from typing import BinaryIO
+
+
+# The columns of a Zniffer CSV export, in the order Zniffer writes them.
+ZNIFFER_COLUMNS = ["Date", "Time", "Speed", "Channel", "Rssi", "HomeId", "Source", "Destination", "Data",
+                   "Class", "Application", "Hex Data", "Payload", "IsAck", "IsCrcOk", "IsLow",
+                   "IsSubstituted", "IsUnknownHeader", "IsWakeupBeam", "ApiType"]
+
+class CSVPacketReader:
+    """
+    Reads the rows of a Zniffer CSV export as dictionaries, like csv.DictReader, while keeping
+    track of the byte offset of the next unread row so that reading can be resumed later.
+
+    Attributes:
+        fieldnames (List[str]): The column names read from the header row.
+        offset (int): The byte offset of the first row that has not been read yet.
+    """
+
+    def __init__(self, csv_file: BinaryIO, delimiter: str = ';', start_offset: int = 0):
+        """
+        Initializes a new instance of the CSVPacketReader class.
+
+        Args:
+            csv_file (BinaryIO): The CSV file, opened in binary mode.
+            delimiter (str): The delimiter of the CSV file.
+            start_offset (int): The byte offset of the first row to read. 0 starts right after the header.
+        """
+        self.__csv_file = csv_file
+        self.__delimiter = delimiter
+        self.__encoding = locale.getpreferredencoding(False)
+        header_line = csv_file.readline().decode(self.__encoding)
+        self.fieldnames = next(csv.reader([header_line], delimiter=delimiter))
+        if start_offset:
+            csv_file.seek(start_offset)
+        self.offset = csv_file.tell()
+
+    def __iter__(self):
+        return iter(csv.DictReader(self.__lines(), fieldnames=self.fieldnames, delimiter=self.__delimiter))
+
+    def __lines(self):
+        for line in iter(self.__csv_file.readline, b''):
+            self.offset = self.__csv_file.tell()
+            yield line.decode(self.__encoding)
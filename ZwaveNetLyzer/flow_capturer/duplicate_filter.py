@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+from collections import deque
+from datetime import timedelta
+
+from ..config_loader import ConfigLoader
+from .packet import Packet
+
+
+class DuplicateFilter:
+    """
+    Drops the copies of a frame captured by several overlapping sniffers.
+
+    A packet is a duplicate if a packet with the same frame key (for Z-Wave, the HomeId, source,
+    destination and hex data) was kept less than 'duplicate_window' seconds before or after it.
+    The first copy is kept. The copies are compared with the kept packet rather than with the
+    previous copy, so a frame that is really sent again after the window is kept.
+
+    The kept packets are remembered in arrival order and forgotten once they are older than the
+    window, so the memory depends on the number of packets within a window, not on the capture.
+
+    Attributes:
+        duplicate_window (timedelta): How close in time two copies of a frame are.
+        duplicate_packets_counter (int): The number of dropped duplicates.
+    """
+
+    def __init__(self, config: ConfigLoader):
+        if config.duplicate_window < 0:
+            raise Exception(f"Invalid duplicate_window: {config.duplicate_window}. It must be 0 or more.")
+        self.duplicate_window = timedelta(seconds=config.duplicate_window)
+        self.duplicate_packets_counter = 0
+        self.__kept_frames = {}
+        self.__kept_frames_order = deque()
+
+    def is_duplicate(self, packet: Packet) -> bool:
+        """
+        Checks whether a packet is a copy of a recently kept packet, and remembers it otherwise.
+
+        Args:
+            packet (Packet): The packet, in capture order.
+
+        Returns:
+            bool: True if the packet is a duplicate, False otherwise.
+        """
+        timestamp = packet.get_timestamp()
+        self.__forget_frames_before(timestamp - self.duplicate_window)
+        frame_key = packet.get_frame_key()
+        kept_timestamp = self.__kept_frames.get(frame_key)
+        if kept_timestamp is not None and abs(timestamp - kept_timestamp) <= self.duplicate_window:
+            self.duplicate_packets_counter += 1
+            return True
+        self.__kept_frames[frame_key] = timestamp
+        self.__kept_frames_order.append((timestamp, frame_key))
+        return False
+
+    def __forget_frames_before(self, oldest_timestamp) -> None:
+        kept_frames_order = self.__kept_frames_order
+        while kept_frames_order and kept_frames_order[0][0] < oldest_timestamp:
+            timestamp, frame_key = kept_frames_order.popleft()
+            if self.__kept_frames.get(frame_key) == timestamp:
+                del self.__kept_frames[frame_key]
+
+    def get_state(self) -> dict:
+        """Gets the recently kept frames, so that a continued capture drops their later copies."""
+        return {
+            "kept_frames_order": list(self.__kept_frames_order),
+            "duplicate_packets_counter": self.duplicate_packets_counter,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """Restores a state returned by 'get_state'."""
+        self.__kept_frames_order = deque(state["kept_frames_order"])
+        self.__kept_frames = {frame_key: timestamp for timestamp, frame_key in self.__kept_frames_order}
+        self.duplicate_packets_counter = state["duplicate_packets_counter"]
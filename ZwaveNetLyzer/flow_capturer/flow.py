@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import copy
 from abc import ABC, abstractmethod
 from typing import List
 from .packet import Packet
@@ -15,13 +16,19 @@ class Flow(ABC):
         _activity_timeout (int): The time in seconds that a flow should wait
             for additional packets before being closed.
         _max_duration (int): The maximum duration in seconds that a flow is allowed to be open.
+        _max_packets (int): The maximum number of packets of the flow, or 0 for no limit.
         _start_time (float): The timestamp of the first packet in the flow.
         _end_time (float): The timestamp of the last packet in the flow.
         _packets (List[Packet]): The list of packets contained in the flow.
+        _termination_reason (str): Why the flow was terminated, or None while it is ongoing.
+        _packet_sampling_interval (int): N if only one in N packets of the capture was kept, 1 otherwise.
+        _statistics: The incremental statistics of the packets of the flow, or None, see 'get_statistics'.
     """
     protocol: Protocols
+    _packet_sampling_interval: int = 1
+    _statistics = None
 
-    def __init__(self, packet: Packet, activity_timeout: int, max_duration: int):
+    def __init__(self, packet: Packet, activity_timeout: int, max_duration: int, max_packets: int = 0):
         """
         Initializes a new instance of the Flow class.
 
@@ -30,15 +37,18 @@ class Flow(ABC):
             activity_timeout (int): The time in seconds that a flow should wait
                 for additional packets before being closed.
             max_duration (int): The maximum duration in seconds that a flow is allowed to be open.
+            max_packets (int): The maximum number of packets of the flow. 0 means no limit.
         """
         self.protocol = packet.get_protocol()
         self._activity_timeout = activity_timeout
         self._max_duration = max_duration
+        self._max_packets = max_packets
         self._start_time = packet.get_timestamp()
         self._end_time = packet.get_timestamp()
         self._packets: List[Packet] = []
         self._forward_packets: List[Packet] = []
         self._backward_packets: List[Packet] = []
+        self._termination_reason: str = None
         self.add_packet(packet=packet)
 
     @abstractmethod
@@ -64,6 +74,75 @@ class Flow(ABC):
         """
         pass
 
+    def get_end_reason(self, new_packet_timestamp: float) -> str:
+        """
+        Gets the reason why the flow should be closed before the provided timestamp.
+
+        Args:
+            new_packet_timestamp (float): The timestamp of the new packet to be added to the flow.
+
+        Returns:
+            str: The reason why the flow should be closed, or None if it should stay open.
+        """
+        return "timeout" if self.is_ended(new_packet_timestamp) else None
+
+    def get_termination_reason(self) -> str:
+        """
+        Gets the reason why the flow was terminated.
+
+        Returns:
+            str: The termination reason, or None if the flow is still ongoing.
+        """
+        return self._termination_reason
+
+    def set_termination_reason(self, termination_reason: str) -> None:
+        """
+        Sets the reason why the flow was terminated.
+
+        Args:
+            termination_reason (str): The termination reason.
+        """
+        self._termination_reason = termination_reason
+
+    def get_packet_sampling_interval(self) -> int:
+        """
+        Gets the packet sampling interval of the capture the flow was assembled from.
+
+        Returns:
+            int: N if one in N packets was kept, 1 if every packet was kept.
+        """
+        return self._packet_sampling_interval
+
+    def set_packet_sampling_interval(self, packet_sampling_interval: int) -> None:
+        """
+        Sets the packet sampling interval of the capture the flow was assembled from.
+
+        Args:
+            packet_sampling_interval (int): N if one in N packets was kept.
+        """
+        self._packet_sampling_interval = packet_sampling_interval
+
+    def get_statistics(self):
+        """
+        Gets the incremental statistics of the packets of the flow, e.g. the ZwaveFlowSnapshot of a
+        time window combined from the statistics of its panes. The feature extractor computes the
+        features they cover from them instead of from the packets.
+
+        Returns:
+            The statistics of the protocol of the flow, or None if the flow has none.
+        """
+        return self._statistics
+
+    def set_statistics(self, statistics) -> None:
+        """
+        Sets the incremental statistics of the packets of the flow, which must cover every packet of
+        the flow and are not updated when packets are added.
+
+        Args:
+            statistics: The statistics, e.g. a ZwaveFlowSnapshot, or None.
+        """
+        self._statistics = statistics
+
     def get_protocol(self) -> Protocols:
         """
         Gets the protocol used by the flow.
@@ -124,6 +203,47 @@ class Flow(ABC):
 
         self._end_time = packet.get_timestamp()
 
+    def copy(self) -> "Flow":
+        """
+        Copies the flow, so that packets can be added to the copy without changing the flow.
+
+        Returns:
+            Flow: A flow with the same attributes and copies of the packet lists.
+        """
+        flow_copy = copy.copy(self)
+        flow_copy._packets = list(self._packets)
+        flow_copy._forward_packets = list(self._forward_packets)
+        flow_copy._backward_packets = list(self._backward_packets)
+        return flow_copy
+
+    def extend(self, flow: "Flow") -> bool:
+        """
+        Appends the packets of a later flow with the same key.
+
+        The first packet of the other flow is forward in that flow, so it tells whether the
+        forward packets of the other flow are forward or backward in this one, and the packet
+        lists are extended without checking the direction of each packet.
+
+        Args:
+            flow (Flow): A flow with the same key whose packets are not older than the packets of this flow.
+
+        Returns:
+            bool: Whether the forward packets of the other flow are forward in this one.
+        """
+        packets = flow.get_packets()
+        if not packets:
+            return True
+        self._packets.extend(packets)
+        is_same_direction = self._is_forward_packet(packets[0])
+        if is_same_direction:
+            self._forward_packets.extend(flow.get_forward_packets())
+            self._backward_packets.extend(flow.get_backward_packets())
+        else:
+            self._forward_packets.extend(flow.get_backward_packets())
+            self._backward_packets.extend(flow.get_forward_packets())
+        self._end_time = packets[-1].get_timestamp()
+        return is_same_direction
+
     def _is_forward_packet(self, packet: Packet) -> bool:
         """
         Determines if the given packet is a forward packet.
@@ -1,55 +1,258 @@
 #!/usr/bin/env python3
 
 import csv
+import logging
 import os
+import pickle
+from collections import OrderedDict
+from itertools import islice
 
 from ..config_loader import ConfigLoader, ZwaveConfigLoader
 from .packet import Packet
 from .packet_factory import PacketFactory
 from .flow_factory import FlowFactory
 from .flow import Flow
-from typing import List
+from .csv_packet_reader import CSVPacketReader
+from .packet_filter import PacketFilter
+from .packet_sampler import PacketSampler
+from .sniffer_merger import SnifferMerger
+from .duplicate_filter import DuplicateFilter
+from .reorder_buffer import ReorderBuffer
+from .flow_windower import FlowWindower
+from .flow_snapshotter import FlowSnapshotter
+from .value_dictionary import ValueDictionary
+from typing import Callable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
 
 class FlowCapturer:
     """
     A class that captures packets from an input file and creates flows.
 
+    The number of ongoing flows can be bounded with 'max_ongoing_flows' and/or
+    'max_flow_table_bytes'. When a limit is exceeded, flows are evicted following
+    'flow_eviction_policy' ("lru" evicts the least recently updated flow, "oldest" the
+    earliest created one) and finished with the "evicted" termination reason. The flow table
+    is bounded, but the finished flows are kept in 'finished_flows' until they are taken out, which
+    analyze_input_file does every 'checkpoint_interval' packets when the flow table is bounded.
+
+    If 'max_packet_lateness' is set, packets that arrive slightly out of order are put back in
+    timestamp order, and if 'duplicate_window' is set, the copies of a frame captured by several
+    sniffers are dropped, before the packets are added to flows. If 'window_mode' is set, the
+    flows are cut into time windows by a FlowWindower instead, and every window is a finished flow.
+    If 'snapshot_interval_packets' or 'snapshot_interval_seconds' is set, a FlowSnapshotter takes
+    snapshots of the features of the open flows into 'flow_snapshotter.snapshots'.
+
     Args:
         config (ConfigLoader): The configuration loader for packet capturing.
+
+    Attributes:
+        progress_callback (Callable[[int, int], None]): If set, it is called with the numbers of
+            processed packets and created flows every 'read_packets_count_value_log_info' packets.
+        value_dictionary (ValueDictionary): The categorical values that the packets parsed by
+            'process_packets' share.
     """
 
+    ESTIMATED_FLOW_BYTES = 1000
+    ESTIMATED_PACKET_BYTES = 600
+
     def __init__(self, config: ConfigLoader):
+        if config.flow_eviction_policy not in ("lru", "oldest"):
+            raise Exception(f"Unknown flow_eviction_policy: {config.flow_eviction_policy}. "
+                            "Please use 'lru' or 'oldest'.")
+        if config.statistics_mode not in FlowSnapshotter.STATISTICS_MODES:
+            raise Exception(f"Invalid statistics_mode: {config.statistics_mode}. "
+                            f"It must be one of {', '.join(FlowSnapshotter.STATISTICS_MODES)}.")
         self.finished_flows: List[Flow] = []
-        self.ongoing_flows = {}
+        self.ongoing_flows = OrderedDict()
         self.config = config
         self.flows_counter = 0
+        self.packets_counter = 0
+        self.ongoing_packets_counter = 0
+        self.evicted_flows_counter = 0
+        self.progress_callback: Callable[[int, int], None] = None
+        self.value_dictionary = ValueDictionary()
+        self.packet_filter = PacketFilter(config)
+        self.packet_sampler = PacketSampler(config)
+        self.reorder_buffer = ReorderBuffer(config) if config.max_packet_lateness else None
+        self.duplicate_filter = DuplicateFilter(config) if config.duplicate_window else None
+        self.flow_windower = FlowWindower(config) if config.window_mode else None
+        self.flow_snapshotter = FlowSnapshotter(config) \
+            if config.snapshot_interval_packets or config.snapshot_interval_seconds else None
+        self.__is_flow_table_bounded = bool(config.max_ongoing_flows or config.max_flow_table_bytes)
+        self.__is_lru_eviction = self.__is_flow_table_bounded and config.flow_eviction_policy == "lru"
 
-    def process_packets(self, packet_reader):
+    def process_packets(self, packet_reader, flush_ongoing_flows: bool = True):
         """
         Processes packets from the packet reader and adds them to flows.
 
         Args:
             packet_reader: An iterable reader that provides packets.
+            flush_ongoing_flows (bool): Whether the flows that are still open at the end of the reader
+                are finished. Pass False to carry them into the next reader of the same capture.
 
         Returns:
             list: A list of finished Flow objects.
         """
-        packet_counter = 0
-        for packet in packet_reader:
-            packet_counter += 1
-            iot_netlyzer_packet = PacketFactory.create(raw_packet=packet)
+        if self.packet_filter.is_active():
+            packet_reader = filter(self.packet_filter.accepts, packet_reader)
+        if self.packet_sampler.is_active():
+            packet_reader = filter(self.packet_sampler.accepts, packet_reader)
+        parsed_packets = (PacketFactory.create(raw_packet=packet, value_dictionary=self.value_dictionary)
+                          for packet in packet_reader)
+        return self.process_parsed_packets(parsed_packets, flush_ongoing_flows)
+
+    def process_parsed_packets(self, parsed_packets, flush_ongoing_flows: bool = True):
+        """
+        Processes packets that were already created by PacketFactory and adds them to flows.
+
+        Parsing is the costly part of the capture, so a parsed capture can be kept in memory and
+        assembled into flows several times with different settings.
+
+        Args:
+            parsed_packets: An iterable of the packet lists returned by PacketFactory.create.
+            flush_ongoing_flows (bool): Whether the flows that are still open at the end are finished.
+
+        Returns:
+            list: A list of finished Flow objects.
+        """
+        for iot_netlyzer_packet in parsed_packets:
+            self.packets_counter += 1
+            if self.reorder_buffer is not None:
+                iot_netlyzer_packet = self.reorder_buffer.push(iot_netlyzer_packet)
+            if self.duplicate_filter is not None:
+                iot_netlyzer_packet = [packet for packet in iot_netlyzer_packet
+                                       if not self.duplicate_filter.is_duplicate(packet)]
             self.add_packet_to_flow(iot_netlyzer_packet)
-            if packet_counter % self.config.read_packets_count_value_log_info == 0:
-                    print(f">> {packet_counter} number of packets has been processed so far...")
+            if self.packets_counter % self.config.read_packets_count_value_log_info == 0:
+                logger.info(f">> {self.packets_counter} number of packets has been processed so far...")
+                if self.progress_callback is not None:
+                    self.progress_callback(self.packets_counter, self.flows_counter)
 
-        print(f">> End of reading from {self.config.input_file_address}")
-        print(f">> {packet_counter} packets analyzed in total.")
-        print(f">> {self.flows_counter} flows created in total.")
-        print(">> Preparing the output file...")
+        if flush_ongoing_flows:
+            return self.finish_capture()
+        return self.finished_flows
 
+    def finish_capture(self) -> List[Flow]:
+        """
+        Ends the capture. The ongoing flows are either finished or, if 'flow_state_output_file' is
+        configured, saved there so that the next file of the capture can continue them.
+
+        Returns:
+            list: A list of finished Flow objects.
+        """
+        logger.info(f">> {self.packets_counter} packets analyzed in total.")
+        logger.info(f">> {self.flows_counter} flows created in total.")
+        if self.packet_filter.rejected_packets_counter:
+            logger.info(f">> {self.packet_filter.rejected_packets_counter} packets skipped by the filters.")
+        if self.packet_sampler.skipped_flow_packets_counter:
+            logger.info(f">> {self.packet_sampler.skipped_flow_packets_counter} packets of unsampled flows skipped.")
+        if self.packet_sampler.skipped_sampled_packets_counter:
+            logger.info(f">> {self.packet_sampler.skipped_sampled_packets_counter} packets skipped by packet sampling "
+                        f"(1 in {self.packet_sampler.packet_sampling_interval} kept).")
+        if self.reorder_buffer is not None:
+            logger.info(f">> {self.reorder_buffer.late_packets_counter} late packets reordered, "
+                        f"{self.reorder_buffer.dropped_packets_counter} packets dropped as too late.")
+        if self.duplicate_filter is not None:
+            logger.info(f">> {self.duplicate_filter.duplicate_packets_counter} duplicate packets removed.")
+        if self.flow_snapshotter is not None:
+            logger.info(f">> {self.flow_snapshotter.snapshots_counter} snapshots of open flows taken.")
+        if self.evicted_flows_counter:
+            logger.info(f">> {self.evicted_flows_counter} flows evicted from the full flow table.")
+        if self.config.flow_state_output_file is not None:
+            self.save_state(self.config.flow_state_output_file)
+            logger.info(f">> {len(self.ongoing_flows)} ongoing flows saved to {self.config.flow_state_output_file}")
+        else:
+            self.flush_ongoing_flows()
+        logger.info(">> Preparing the output file...")
+        return self.finished_flows
+
+    def flush_ongoing_flows(self) -> None:
+        """
+        Moves every ongoing flow to the finished flows, after adding the packets still held by the
+        reorder buffer.
+        """
+        if self.reorder_buffer is not None and len(self.reorder_buffer):
+            buffered_packets = self.reorder_buffer.flush()
+            if self.duplicate_filter is not None:
+                buffered_packets = [packet for packet in buffered_packets
+                                    if not self.duplicate_filter.is_duplicate(packet)]
+            self.add_packet_to_flow(buffered_packets)
+        if self.flow_windower is not None:
+            windows = self.flow_windower.flush()
+            self.flows_counter += len(windows)
+            self.finished_flows.extend(windows)
         list_of_ongoing_flows = list(self.ongoing_flows.values())
+        for flow in list_of_ongoing_flows:
+            flow.set_termination_reason("end_of_capture")
         self.finished_flows.extend(list_of_ongoing_flows)
-        return self.finished_flows
+        self.ongoing_flows = OrderedDict()
+        if self.flow_snapshotter is not None:
+            self.flow_snapshotter.clear()
+        self.ongoing_packets_counter = 0
+
+    def get_state(self) -> dict:
+        """
+        Gets the open flow table and the counters needed to continue the capture later.
+
+        Returns:
+            dict: The state of the capture.
+        """
+        return {
+            "ongoing_flows": self.ongoing_flows,
+            "flows_counter": self.flows_counter,
+            "packets_counter": self.packets_counter,
+            "evicted_flows_counter": self.evicted_flows_counter,
+            "sampled_packets_counter": self.packet_sampler.sampled_packets_counter,
+            "reorder_buffer": self.reorder_buffer.get_state() if self.reorder_buffer is not None else None,
+            "duplicate_filter": self.duplicate_filter.get_state() if self.duplicate_filter is not None else None,
+            "flow_windower": self.flow_windower.get_state() if self.flow_windower is not None else None,
+            "flow_snapshotter": self.flow_snapshotter.get_state() if self.flow_snapshotter is not None else None,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """
+        Restores a state returned by 'get_state'.
+
+        Args:
+            state (dict): The state of the capture.
+        """
+        self.ongoing_flows = OrderedDict(state["ongoing_flows"])
+        self.flows_counter = state["flows_counter"]
+        self.packets_counter = state.get("packets_counter", self.packets_counter)
+        self.evicted_flows_counter = state.get("evicted_flows_counter", self.evicted_flows_counter)
+        self.packet_sampler.sampled_packets_counter = state.get("sampled_packets_counter",
+                                                                self.packet_sampler.sampled_packets_counter)
+        if self.reorder_buffer is not None and state.get("reorder_buffer") is not None:
+            self.reorder_buffer.set_state(state["reorder_buffer"])
+        if self.duplicate_filter is not None and state.get("duplicate_filter") is not None:
+            self.duplicate_filter.set_state(state["duplicate_filter"])
+        if self.flow_windower is not None and state.get("flow_windower") is not None:
+            self.flow_windower.set_state(state["flow_windower"])
+        if self.flow_snapshotter is not None and state.get("flow_snapshotter") is not None:
+            self.flow_snapshotter.set_state(state["flow_snapshotter"])
+        self.ongoing_packets_counter = sum(len(flow.get_packets()) for flow in self.ongoing_flows.values())
+
+    def save_state(self, state_file_address: str) -> None:
+        """
+        Serializes the open flow table so that another run can continue the same capture.
+
+        Args:
+            state_file_address (str): The file to write the state to.
+        """
+        with open(state_file_address, 'wb') as state_file:
+            pickle.dump(self.get_state(), state_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_state(self, state_file_address: str) -> None:
+        """
+        Restores an open flow table saved by 'save_state'.
+
+        Args:
+            state_file_address (str): The file to read the state from.
+        """
+        with open(state_file_address, 'rb') as state_file:
+            self.set_state(pickle.load(state_file))
+        logger.info(f">> {len(self.ongoing_flows)} ongoing flows loaded from {state_file_address}")
 
     def capture(self) -> List[Flow]:
         """
@@ -70,6 +273,11 @@ class FlowCapturer:
         Returns:
             None
         """
+        if self.flow_windower is not None:
+            windows = self.flow_windower.add_packets(packets)
+            self.flows_counter += len(windows)
+            self.finished_flows.extend(windows)
+            return
         for packet in packets:
             possible_flow_ids = packet.get_possible_flow_ids()
             flow_id = possible_flow_ids[0]
@@ -81,13 +289,67 @@ class FlowCapturer:
                 flow_id = alternative_flow_id
 
             flow: Flow = self.ongoing_flows[flow_id]
-            if flow.is_ended(new_packet_timestamp=packet.get_timestamp()):
-                self.finished_flows.append(flow)
-                del self.ongoing_flows[flow_id]
+            end_reason = flow.get_end_reason(new_packet_timestamp=packet.get_timestamp())
+            if end_reason is not None:
+                self.finish_flow(flow_id=flow_id, termination_reason=end_reason)
                 self.create_new_flow(packet=packet, flow_id=flow_id)
                 continue
 
             flow.add_packet(packet)
+            self.ongoing_packets_counter += 1
+            if self.flow_snapshotter is not None:
+                self.flow_snapshotter.update(flow_id, flow)
+            if self.__is_lru_eviction:
+                self.ongoing_flows.move_to_end(flow_id)
+            if self.__is_flow_table_bounded:
+                self.evict_flows()
+
+    def finish_flow(self, flow_id: str, termination_reason: str) -> None:
+        """
+        Removes an ongoing flow from the flow table and adds it to the finished flows.
+
+        Args:
+            flow_id (str): The ID of the flow.
+            termination_reason (str): Why the flow is finished.
+
+        Returns:
+            None
+        """
+        flow: Flow = self.ongoing_flows.pop(flow_id)
+        flow.set_termination_reason(termination_reason)
+        self.ongoing_packets_counter -= len(flow.get_packets())
+        self.finished_flows.append(flow)
+        if self.flow_snapshotter is not None:
+            self.flow_snapshotter.forget(flow_id)
+
+    def evict_flows(self) -> None:
+        """
+        Evicts flows, in the order of the eviction policy, until the flow table is within its limits.
+        The most recent flow is never evicted.
+
+        Returns:
+            None
+        """
+        while len(self.ongoing_flows) > 1 and self.is_flow_table_full():
+            flow_id = next(iter(self.ongoing_flows))
+            self.finish_flow(flow_id=flow_id, termination_reason="evicted")
+            self.evicted_flows_counter += 1
+
+    def is_flow_table_full(self) -> bool:
+        """
+        Checks whether the flow table exceeds 'max_ongoing_flows' or, by an estimate of its
+        memory usage, 'max_flow_table_bytes'.
+
+        Returns:
+            bool: True if the flow table exceeds one of its limits, False otherwise.
+        """
+        if self.config.max_ongoing_flows and len(self.ongoing_flows) > self.config.max_ongoing_flows:
+            return True
+        if self.config.max_flow_table_bytes:
+            estimated_bytes = (len(self.ongoing_flows) * self.ESTIMATED_FLOW_BYTES
+                               + self.ongoing_packets_counter * self.ESTIMATED_PACKET_BYTES)
+            return estimated_bytes > self.config.max_flow_table_bytes
+        return False
 
     def create_new_flow(self, packet: Packet, flow_id: str) -> None:
         """
@@ -103,6 +365,11 @@ class FlowCapturer:
         self.flows_counter += 1
         new_flow = FlowFactory.create(packet=packet, config=self.config)
         self.ongoing_flows[flow_id] = new_flow
+        self.ongoing_packets_counter += 1
+        if self.flow_snapshotter is not None:
+            self.flow_snapshotter.update(flow_id, new_flow)
+        if self.__is_flow_table_bounded:
+            self.evict_flows()
 
 
 class ZwaveFlowCapturer(FlowCapturer):
@@ -118,11 +385,57 @@ class ZwaveFlowCapturer(FlowCapturer):
 
     def capture(self) -> List[Flow]:
         """
-        Capture Z-Wave packets from a CSV file and process them into flows.
+        Capture Z-Wave packets from CSV files and process them into flows.
+
+        The input files are read one after another as a single capture, so the flows that are
+        open at the end of a file continue in the next one. With the "merge" input files mode,
+        the files of several sniffers are read at the same time and merged in timestamp order.
 
         Returns:
             list: A list of finished Flow objects.
         """
-        with open(self.config.input_file_address, 'r') as csv_file:
-            csv_reader = csv.DictReader(csv_file, delimiter=';')
-            return self.process_packets(csv_reader)
\ No newline at end of file
+        if self.config.flow_state_input_file is not None:
+            self.load_state(self.config.flow_state_input_file)
+        if self.config.input_files_mode == "merge":
+            with SnifferMerger(self.config.get_input_files()) as merged_rows:
+                self.process_packets(merged_rows, flush_ongoing_flows=False)
+            logger.info(f">> End of reading from {len(merged_rows.input_files)} merged sniffer files")
+            return self.finish_capture()
+        for input_file_address in self.config.get_input_files():
+            with open(input_file_address, 'r') as csv_file:
+                csv_reader = csv.DictReader(csv_file, delimiter=';')
+                self.process_packets(csv_reader, flush_ongoing_flows=False)
+            logger.info(f">> End of reading from {input_file_address}")
+        return self.finish_capture()
+
+    def capture_in_chunks(self, chunk_size: int, file_index: int = 0,
+                          input_offset: int = 0) -> Iterator[Tuple[int, int]]:
+        """
+        Capture Z-Wave packets like 'capture', pausing after every 'chunk_size' packets.
+
+        At each pause the finished flows can be taken out of 'finished_flows' and the state of
+        the capture saved. The capture is not finished at the end; call 'finish_capture' for that.
+
+        Args:
+            chunk_size (int): The number of packets to read between two pauses.
+            file_index (int): The index of the input file to start from.
+            input_offset (int): The byte offset of the first packet to read in that file.
+
+        Yields:
+            Tuple[int, int]: The index of the input file and the byte offset of the next packet to
+                read, which is where the capture can be resumed from.
+        """
+        input_files = self.config.get_input_files()
+        for index in range(file_index, len(input_files)):
+            with open(input_files[index], 'rb') as csv_file:
+                packet_reader = CSVPacketReader(csv_file, delimiter=';',
+                                                start_offset=input_offset if index == file_index else 0)
+                raw_packets = iter(packet_reader)
+                while True:
+                    chunk = list(islice(raw_packets, chunk_size))
+                    if not chunk:
+                        break
+                    self.process_packets(chunk, flush_ongoing_flows=False)
+                    yield index, packet_reader.offset
+            logger.info(f">> End of reading from {input_files[index]}")
+            yield index + 1, 0
@@ -21,6 +21,9 @@ class FlowFactory:
         if packet.protocol == Protocols.Zwave:
             new_flow = ZwaveFlow(zwave_packet=packet,
                                  activity_timeout=config.zwave_activity_timeout,
-                                 max_duration=config.max_zwave_flow_duration)
+                                 max_duration=config.max_zwave_flow_duration,
+                                 max_packets=config.max_packets_per_flow)
+        if config.packet_sampling_interval != 1:
+            new_flow.set_packet_sampling_interval(config.packet_sampling_interval)
 
         return new_flow
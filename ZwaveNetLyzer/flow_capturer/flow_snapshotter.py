@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+from datetime import timedelta
+from typing import Dict, List
+
+from ..config_loader import ConfigLoader
+from ..protocols import Protocols
+from .flow import Flow
+
+
+class FlowSnapshotter:
+    """
+    Extracts the current features of the flows that are still open, every 'snapshot_interval_packets'
+    packets and/or every 'snapshot_interval_seconds' seconds of each flow, counted from its first
+    packet or its previous snapshot.
+
+    Each open flow keeps an incremental state of counts, sums, power sums, value counts and last
+    timestamps, which a snapshot updates with the packets added since the previous snapshot. So the
+    snapshots of a flow cost time proportional to its packets rather than to its packets times its
+    snapshots. Only the features that can be computed that way are extracted, see
+    FeatureExtractor.load_snapshot_features. With the "approximate" statistics_mode, the value
+    counts are replaced by sketches of 'sketch_size' values, so the statistics of a flow stay bounded
+    however long the flow is, although the flow still keeps its packets.
+
+    Attributes:
+        snapshot_interval_packets (int): The number of packets of a flow between two of its snapshots, or 0.
+        snapshot_interval_seconds (timedelta): The time between two snapshots of a flow, or None.
+        snapshots (Dict[Protocols, List[dict]]): The snapshots taken so far, in the format of the
+            feature records of FeatureExtractor.execute.
+        snapshots_counter (int): The number of snapshots taken.
+    """
+
+    # The ways to compute the medians and the modes of the snapshots.
+    STATISTICS_MODES = ("exact", "approximate")
+
+    def __init__(self, config: ConfigLoader):
+        if config.snapshot_interval_packets < 0 or config.snapshot_interval_seconds < 0:
+            raise Exception("snapshot_interval_packets and snapshot_interval_seconds must be 0 or more.")
+        if config.window_mode:
+            raise Exception("Snapshots are not supported with window_mode, whose windows are already emitted "
+                            "while the flows are open.")
+        # Imported here since the feature extractor imports the flow capturer.
+        from ..feature_extractor import FeatureExtractor
+        self.snapshot_interval_packets: int = config.snapshot_interval_packets
+        self.snapshot_interval_seconds = timedelta(seconds=config.snapshot_interval_seconds) \
+            if config.snapshot_interval_seconds else None
+        self.label: str = config.label
+        self.sketch_size: int = config.sketch_size if config.statistics_mode == "approximate" else None
+        self.snapshots: Dict[Protocols, List[dict]] = {}
+        self.snapshots_counter = 0
+        self.__features = FeatureExtractor.load_snapshot_features(config.feature_families,
+                                                                  config.features_ignore_list)
+        for features in self.__features.values():
+            for feature in features:
+                feature.set_floating_point_unit(config.floating_point_unit)
+        self.__feature_extractor = FeatureExtractor
+        self.__flow_snapshots = {}
+
+    def update(self, flow_id: str, flow: Flow) -> None:
+        """
+        Takes a snapshot of a flow if one is due, after a packet was added to it.
+
+        Args:
+            flow_id (str): The key of the flow in the flow table.
+            flow (Flow): The open flow.
+        """
+        flow_snapshot = self.__flow_snapshots.get(flow_id)
+        if flow_snapshot is None:
+            flow_snapshot = self.__flow_snapshots[flow_id] = {
+                "state": self.__feature_extractor.load_flow_snapshot_class(flow.get_protocol())(self.sketch_size),
+                "packets_count": 0,
+                "timestamp": flow.get_timestamp(),
+            }
+        packets = flow.get_packets()
+        timestamp = packets[-1].get_timestamp()
+        if not ((self.snapshot_interval_packets
+                 and len(packets) - flow_snapshot["packets_count"] >= self.snapshot_interval_packets)
+                or (self.snapshot_interval_seconds is not None
+                    and timestamp - flow_snapshot["timestamp"] >= self.snapshot_interval_seconds)):
+            return
+        protocol = flow.get_protocol()
+        self.snapshots.setdefault(protocol, []).append(
+            self.__feature_extractor.execute_snapshot(flow, flow_snapshot["state"], self.__features[protocol],
+                                                      label=self.label))
+        self.snapshots_counter += 1
+        flow_snapshot["packets_count"] = len(packets)
+        flow_snapshot["timestamp"] = timestamp
+
+    def forget(self, flow_id: str) -> None:
+        """Drops the incremental state of a flow that ended."""
+        self.__flow_snapshots.pop(flow_id, None)
+
+    def clear(self) -> None:
+        """Drops the incremental state of every flow, at the end of the capture."""
+        self.__flow_snapshots = {}
+
+    def get_state(self) -> dict:
+        """Gets the incremental states of the open flows, so that a continued capture keeps their snapshot times."""
+        return {"flow_snapshots": self.__flow_snapshots, "snapshots_counter": self.snapshots_counter}
+
+    def set_state(self, state: dict) -> None:
+        """Restores a state returned by 'get_state'."""
+        self.__flow_snapshots = dict(state["flow_snapshots"])
+        self.snapshots_counter = state["snapshots_counter"]
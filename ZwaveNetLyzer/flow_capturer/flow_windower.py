@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+import copy
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import List
+
+from ..config_loader import ConfigLoader
+from .flow import Flow
+from .flow_factory import FlowFactory
+from .packet import Packet
+
+
+class FlowWindower:
+    """
+    Cuts the flows of a capture into time windows, so that the features of every flow are
+    emitted every 'window_slide' seconds instead of once when the flow ends.
+
+    "tumbling" windows are 'window_size' seconds long and follow each other. "sliding" windows
+    are 'window_size' seconds long and start every 'window_slide' seconds, so they overlap. The
+    windows are aligned to multiples of 'window_slide' seconds, and a flow only has a window
+    when it has packets in it.
+
+    The packets of each flow key are grouped, as they arrive, into panes of 'window_slide'
+    seconds, which are flows of their own. When a pane is first part of a window, the incremental
+    statistics of its packets are computed once, as for the snapshots of open flows (see
+    FeatureExtractor.load_flow_snapshot_class). A window is made of the last panes of its key: a
+    tumbling window is its only pane, and a sliding window is a copy of its first pane extended
+    with the packet lists of the next ones, or the first pane itself once no later window needs
+    it. Its statistics are those of its panes merged, which FeatureExtractor.execute reads
+    instead of the packets for the features they cover (see Flow.get_statistics). So the flow
+    lookup, the direction and the statistics of each packet are computed once, however many
+    windows the packet is part of, and only the other features read the packets of every window.
+
+    Attributes:
+        window_mode (str): "tumbling" or "sliding".
+        window_size (timedelta): The length of a window.
+        window_slide (timedelta): The time between the starts of two windows.
+        windows_counter (int): The number of emitted windows.
+    """
+
+    EPOCH = datetime(1970, 1, 1)
+
+    def __init__(self, config: ConfigLoader):
+        if config.window_mode not in ("tumbling", "sliding"):
+            raise Exception(f"Unknown window_mode: {config.window_mode}. Please use 'tumbling' or 'sliding'.")
+        window_slide = config.window_size if config.window_mode == "tumbling" else config.window_slide
+        if not 0 < window_slide <= config.window_size:
+            raise Exception("window_slide must be greater than 0 and at most window_size.")
+        self.config = config
+        self.window_mode: str = config.window_mode
+        self.window_size = timedelta(seconds=config.window_size)
+        self.window_slide = timedelta(seconds=window_slide)
+        self.windows_counter = 0
+        self.__panes = {}
+        self.__window_end: datetime = None
+
+    def add_packets(self, packets: List[Packet]) -> List[Flow]:
+        """
+        Adds packets to the panes of their flows.
+
+        Args:
+            packets (List[Packet]): The packets, in timestamp order.
+
+        Returns:
+            List[Flow]: The windows that ended before the packets, in time order.
+        """
+        windows = []
+        for packet in packets:
+            timestamp = packet.get_timestamp()
+            if self.__window_end is None:
+                self.__window_end = self.__get_next_window_end(timestamp)
+            while timestamp >= self.__window_end:
+                windows.extend(self.__end_window(termination_reason="window_end"))
+                if not self.__panes and timestamp >= self.__window_end:
+                    self.__window_end = self.__get_next_window_end(timestamp)
+
+            possible_flow_ids = packet.get_possible_flow_ids()
+            flow_id = possible_flow_ids[0] if possible_flow_ids[1] not in self.__panes else possible_flow_ids[1]
+            panes = self.__panes.get(flow_id)
+            if panes is None:
+                panes = self.__panes[flow_id] = deque()
+            pane_start = self.__window_end - self.window_slide
+            if panes and panes[-1][0] == pane_start:
+                panes[-1][1].add_packet(packet)
+            else:
+                # The statistics of a pane are computed when it is first part of a window.
+                panes.append([pane_start, FlowFactory.create(packet=packet, config=self.config), None])
+        return windows
+
+    def flush(self) -> List[Flow]:
+        """
+        Ends the current window at the end of the capture.
+
+        Returns:
+            List[Flow]: The windows of the flows that have packets in it.
+        """
+        if self.__window_end is None:
+            return []
+        windows = self.__end_window(termination_reason="end_of_capture")
+        self.__panes = {}
+        self.__window_end = None
+        return windows
+
+    def __get_next_window_end(self, timestamp: datetime) -> datetime:
+        slide_seconds = self.window_slide.total_seconds()
+        seconds = (timestamp - self.EPOCH).total_seconds()
+        return self.EPOCH + timedelta(seconds=(math.floor(seconds / slide_seconds) + 1) * slide_seconds)
+
+    def __end_window(self, termination_reason: str) -> List[Flow]:
+        window_start = self.__window_end - self.window_size
+        next_window_start = window_start + self.window_slide
+        windows = []
+        for flow_id in list(self.__panes):
+            panes = self.__panes[flow_id]
+            while panes and panes[0][0] < window_start:
+                panes.popleft()
+            if not panes:
+                del self.__panes[flow_id]
+                continue
+            if panes[0][0] < next_window_start:
+                # The first pane is not part of a later window, so it becomes the window itself.
+                window_statistics = self.__get_pane_statistics(panes[0])
+                window = panes.popleft()[1]
+                later_panes = panes
+            else:
+                window_statistics = copy.deepcopy(self.__get_pane_statistics(panes[0]))
+                window = panes[0][1].copy()
+                later_panes = islice(panes, 1, None)
+            for pane_entry in later_panes:
+                window_statistics.merge(self.__get_pane_statistics(pane_entry), window.extend(pane_entry[1]))
+            if not panes:
+                del self.__panes[flow_id]
+            window.set_statistics(window_statistics)
+            window.set_termination_reason(termination_reason)
+            windows.append(window)
+        self.windows_counter += len(windows)
+        self.__window_end += self.window_slide
+        return windows
+
+    def __get_pane_statistics(self, pane_entry: list):
+        _, pane, pane_statistics = pane_entry
+        if pane_statistics is None:
+            # Imported here since the feature extractor imports the flow capturer.
+            from ..feature_extractor import FeatureExtractor
+            pane_statistics = pane_entry[2] = FeatureExtractor.load_flow_snapshot_class(pane.get_protocol())()
+            pane_statistics.update(pane)
+        return pane_statistics
+
+    def get_state(self) -> dict:
+        """Gets the panes of the current windows, so that a continued capture completes them."""
+        return {"panes": self.__panes, "window_end": self.__window_end, "windows_counter": self.windows_counter}
+
+    def set_state(self, state: dict) -> None:
+        """Restores a state returned by 'get_state'."""
+        self.__panes = state["panes"]
+        self.__window_end = state["window_end"]
+        self.windows_counter = state["windows_counter"]
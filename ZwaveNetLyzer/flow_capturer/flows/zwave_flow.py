@@ -10,7 +10,7 @@ from ...protocols import Protocols
 class ZwaveFlow(Flow):
     """Represents a flow for Zwave packets."""
 
-    def __init__(self, zwave_packet: ZwavePacket, activity_timeout: int, max_duration: int):
+    def __init__(self, zwave_packet: ZwavePacket, activity_timeout: int, max_duration: int, max_packets: int = 0):
         """
         Initializes a new instance of the ZwaveFlow class.
 
@@ -18,12 +18,14 @@ class ZwaveFlow(Flow):
             packet (ZwavePacket): The initial packet to add to the flow.
             activity_timeout (int, optional): The maximum amount of time allowed without receiving any new packets. Defaults to 100000.
             max_duration (int, optional): The maximum amount of time allowed for the flow to run. Defaults to 1000000.
+            max_packets (int, optional): The maximum number of packets of the flow. Defaults to 0, which means no limit.
         """
         self.protocol = Protocols.Zwave
         self.__home_id = zwave_packet.get_home_id()
         self.__src_id = zwave_packet.get_src_id()
         self.__dst_id = zwave_packet.get_dst_id()
-        super().__init__(packet=zwave_packet, activity_timeout=activity_timeout, max_duration=max_duration)
+        super().__init__(packet=zwave_packet, activity_timeout=activity_timeout, max_duration=max_duration,
+                         max_packets=max_packets)
 
     def __str__(self) -> str:
         """
@@ -44,14 +46,28 @@ class ZwaveFlow(Flow):
         Returns:
             bool: True if the flow has ended, False otherwise.
         """
+        return self.get_end_reason(new_packet_timestamp) is not None
+
+    def get_end_reason(self, new_packet_timestamp: datetime) -> str:
+        """
+        Gets the reason why the flow has ended.
+
+        Args:
+            new_packet_timestamp (datetime): The timestamp of the latest packet received.
+
+        Returns:
+            str: "max_duration", "activity_timeout" or "max_packets" if the flow has ended, None otherwise.
+        """
         duration = (new_packet_timestamp - self._start_time).total_seconds()
         if duration > self._max_duration:
-            return True
+            return "max_duration"
         if duration > self._activity_timeout and len(self._packets) > 1:
             last_packet_timestamp = self._packets[-1].get_timestamp()
             if (new_packet_timestamp - last_packet_timestamp).total_seconds() > self._activity_timeout:
-                return True
-        return False
+                return "activity_timeout"
+        if self._max_packets and len(self._packets) >= self._max_packets:
+            return "max_packets"
+        return None
     
     def get_home_id(self):
         return self.__home_id
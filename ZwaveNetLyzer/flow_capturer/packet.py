@@ -12,11 +12,17 @@ class Packet(ABC):
     payload_bytes: int
     packet_len: int
     _timestamp: str
+    _sniffer_index: int = 0
 
     @abstractmethod
     def get_possible_flow_ids() -> List[str]:
         """Get the possible IDs of the flow that the packet belongs to"""
         pass
+
+    @abstractmethod
+    def get_frame_key(self) -> tuple:
+        """Get the values that are equal in every copy of the same frame captured by several sniffers"""
+        pass
     
     def get_protocol(self):
         """Get the IoT protocol of the packet"""
@@ -25,6 +31,10 @@ class Packet(ABC):
     def get_timestamp(self):
         """Get the timestamp of the packet"""
         return self._timestamp
+
+    def get_sniffer_index(self) -> int:
+        """Get the index of the sniffer that captured the packet, 0 unless several sniffers were merged"""
+        return self._sniffer_index
     
     def __len__(self):
         """Get the length of the packet"""
@@ -41,3 +51,14 @@ class Packet(ABC):
     def get_packet_len(self):
         """Get the whole size of the packets"""
         return self.header_bytes + self.payload_bytes
+
+    def get_state(self) -> dict:
+        """Get the parsed attributes of the packet, from which 'from_state' rebuilds it without parsing"""
+        return vars(self)
+
+    @classmethod
+    def from_state(cls, state: dict):
+        """Rebuild a packet from the attributes returned by 'get_state'"""
+        packet = cls.__new__(cls)
+        packet.__dict__.update(state)
+        return packet
@@ -3,6 +3,7 @@
 from typing import Type
 from .packet import Packet
 from .packets import ZwavePacket
+from .value_dictionary import ValueDictionary
 from ..protocols import Protocols
 
 class PacketFactory:
@@ -12,12 +13,19 @@ class PacketFactory:
         raise TypeError("This is a static class and cannot be instantiated.")
 
     @staticmethod
-    def create(raw_packet) -> Type[Packet]:
-        """Create a new Packet object based on the given Scapy packet."""
+    def create(raw_packet, value_dictionary: ValueDictionary = None) -> Type[Packet]:
+        """
+        Create a new Packet object based on the given Scapy packet.
+
+        Args:
+            raw_packet: The raw packet, e.g. a row of a Zniffer capture.
+            value_dictionary (ValueDictionary): The dictionary of the run, which the packets share
+                their categorical values through. None gives each packet its own copies.
+        """
         new_packet: Type[Packet] = None
         protocol = PacketFactory.find_protocol(raw_packet)
         if protocol == Protocols.Zwave:
-            new_packet = ZwavePacket(packet_info=raw_packet)
+            new_packet = ZwavePacket(packet_info=raw_packet, value_dictionary=value_dictionary)
 
         return [new_packet]
 
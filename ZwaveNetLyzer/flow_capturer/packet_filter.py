@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from ..config_loader import ConfigLoader
+
+
+class PacketFilter:
+    """
+    Selects the raw rows of a capture before packets are created from them.
+
+    The checks only look up and compare the strings of the row: node ids, home ids, channels
+    and frame types are looked up in sets, and the time range is compared with the
+    "Date Time" string of the row, which sorts like the timestamp since Zniffer writes
+    zero-padded dates and times. So a rejected row costs a few dictionary lookups instead of
+    the creation of a packet and its flow assembly.
+
+    Attributes:
+        home_ids (set): The accepted HomeId values, or None to accept every home.
+        node_ids (set): The accepted node ids; a row is accepted if its Source or Destination is one of them.
+        start_time (str): The first accepted "YYYY-MM-DD HH:MM:SS.ffffff" timestamp, or a prefix of it.
+        end_time (str): The timestamp, or its prefix, from which rows are rejected.
+        channels (set): The accepted Channel values.
+        frame_types (set): The accepted frame types of the Data column, e.g. "SINGLECAST".
+        rejected_packets_counter (int): The number of rejected rows.
+    """
+
+    def __init__(self, config: ConfigLoader):
+        self.home_ids = self.__normalize_hex_ids(config.filter_home_ids)
+        self.node_ids = self.__normalize_hex_ids(config.filter_node_ids)
+        self.start_time: str = config.filter_start_time
+        self.end_time: str = config.filter_end_time
+        self.channels = {str(channel) for channel in config.filter_channels} if config.filter_channels else None
+        self.frame_types = set(config.filter_frame_types) if config.filter_frame_types else None
+        self.rejected_packets_counter = 0
+
+    @staticmethod
+    def __normalize_hex_ids(hex_ids: list) -> set:
+        if not hex_ids:
+            return None
+        return {hex_id for original in hex_ids for hex_id in (original, original.upper(), original.lower())}
+
+    def is_active(self) -> bool:
+        """Checks whether any filter is configured."""
+        return any(value is not None for value in (self.home_ids, self.node_ids, self.start_time, self.end_time,
+                                                     self.channels, self.frame_types))
+
+    def accepts(self, raw_packet: dict) -> bool:
+        """
+        Checks whether a raw row passes every configured filter.
+
+        Args:
+            raw_packet (dict): A row of the capture, keyed by the Zniffer column names.
+
+        Returns:
+            bool: True if the row is accepted, False otherwise.
+        """
+        if (self.home_ids is not None and raw_packet['HomeId'] not in self.home_ids) \
+                or (self.node_ids is not None and raw_packet['Source'] not in self.node_ids
+                    and raw_packet['Destination'] not in self.node_ids) \
+                or (self.channels is not None and raw_packet['Channel'] not in self.channels) \
+                or (self.frame_types is not None and raw_packet['Data'] not in self.frame_types):
+            self.rejected_packets_counter += 1
+            return False
+        if self.start_time is not None or self.end_time is not None:
+            timestamp = f"{raw_packet['Date']} {raw_packet['Time']}"
+            if (self.start_time is not None and timestamp < self.start_time) \
+                    or (self.end_time is not None and timestamp >= self.end_time):
+                self.rejected_packets_counter += 1
+                return False
+        return True
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import hashlib
+
+from ..config_loader import ConfigLoader
+
+
+class PacketSampler:
+    """
+    Samples the raw rows of a capture before packets are created from them.
+
+    Flow sampling keeps the rows of a flow if a hash of its canonical key, the HomeId and the
+    two node ids in sorted order, falls under 'flow_sampling_rate'. The decision is made when
+    the first row of a key arrives and then looked up, so the rows of a skipped flow never
+    become packets or flows, and both directions and every later flow between the same two
+    nodes get the same decision. The hash does not depend on the process, so every run keeps
+    the same flows.
+
+    Packet sampling keeps one in 'packet_sampling_interval' of the rows left by flow sampling.
+
+    Attributes:
+        flow_sampling_rate (float): The fraction of flow keys to keep.
+        flow_sampling_seed (int): Salts the hash, to draw another sample of flows.
+        packet_sampling_interval (int): N to keep one in N rows.
+        sampled_packets_counter (int): The number of rows seen by packet sampling so far.
+        skipped_flow_packets_counter (int): The number of rows of skipped flows.
+        skipped_sampled_packets_counter (int): The number of rows skipped by packet sampling.
+    """
+
+    HASH_RANGE = 2 ** 64
+
+    def __init__(self, config: ConfigLoader):
+        if not 0 <= config.flow_sampling_rate <= 1:
+            raise Exception(f"Invalid flow_sampling_rate: {config.flow_sampling_rate}. It must be between 0 and 1.")
+        if config.packet_sampling_interval < 1:
+            raise Exception(f"Invalid packet_sampling_interval: {config.packet_sampling_interval}. "
+                            "It must be 1 or more.")
+        self.flow_sampling_rate: float = config.flow_sampling_rate
+        self.flow_sampling_seed: int = config.flow_sampling_seed
+        self.packet_sampling_interval: int = config.packet_sampling_interval
+        self.sampled_packets_counter = 0
+        self.skipped_flow_packets_counter = 0
+        self.skipped_sampled_packets_counter = 0
+        self.__flow_decisions = {}
+
+    def is_active(self) -> bool:
+        """Checks whether flow or packet sampling is configured."""
+        return self.flow_sampling_rate < 1 or self.packet_sampling_interval > 1
+
+    def accepts(self, raw_packet: dict) -> bool:
+        """
+        Checks whether a raw row is kept by the sampling.
+
+        Args:
+            raw_packet (dict): A row of the capture, keyed by the Zniffer column names.
+
+        Returns:
+            bool: True if the row is kept, False otherwise.
+        """
+        if self.flow_sampling_rate < 1:
+            key = (raw_packet['HomeId'], raw_packet['Source'], raw_packet['Destination'])
+            is_sampled_flow = self.__flow_decisions.get(key)
+            if is_sampled_flow is None:
+                is_sampled_flow = self.is_sampled_flow(*key)
+                self.__flow_decisions[key] = is_sampled_flow
+            if not is_sampled_flow:
+                self.skipped_flow_packets_counter += 1
+                return False
+        if self.packet_sampling_interval > 1:
+            self.sampled_packets_counter += 1
+            if (self.sampled_packets_counter - 1) % self.packet_sampling_interval:
+                self.skipped_sampled_packets_counter += 1
+                return False
+        return True
+
+    def is_sampled_flow(self, home_id: str, src_id: str, dst_id: str) -> bool:
+        """
+        Checks whether the flows between two nodes are kept by flow sampling.
+
+        Args:
+            home_id (str): The HomeId of the flow.
+            src_id (str): One node id of the flow.
+            dst_id (str): The other node id of the flow.
+
+        Returns:
+            bool: True if the hash of the canonical key falls under the sampling rate.
+        """
+        canonical_key = "_".join([str(self.flow_sampling_seed), home_id, *sorted((src_id, dst_id))])
+        digest = hashlib.blake2b(canonical_key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") < self.flow_sampling_rate * self.HASH_RANGE
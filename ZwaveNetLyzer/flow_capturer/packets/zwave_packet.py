@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
 from datetime import datetime
+from typing import Union
 from ..packet import Packet
+from ..value_dictionary import ValueDictionary
 from ...protocols import Protocols
 
 
@@ -9,43 +11,57 @@ class ZwavePacket(Packet):
     """
     Represents an Zwave packet.
 
+    The Hex Data, header and Payload of the packet are decoded to bytes once, when it is parsed,
+    and the hex strings of the packet are derived from them. A value that is not whole bytes of
+    upper case hex digits, as Zniffer writes them, is kept as its hex string instead, e.g. a
+    header that ends in the middle of a byte, lower case or invalid hex digits. The features thus
+    give every packet the values that they gave its hex strings, and no row fails to parse.
+
     Attributes:
 
     """
 
-    def __init__(self, packet_info: dict):
+    def __init__(self, packet_info: dict, value_dictionary: ValueDictionary = None):
         """
         Initializes a new instance of the ZwavePacket class.
 
         Args:
             packet_info (Dictionary): The dictionary that has the information of the packet.
+            value_dictionary (ValueDictionary): The dictionary of the run, whose shared copies of the
+                HomeId, Source, Destination, Data, Class and Application values the packet keeps.
         """
+        share = value_dictionary.__getitem__ if value_dictionary is not None else lambda value: value
         self.protocol = Protocols.Zwave
         self.__date = packet_info['Date']
         self.__time = packet_info['Time']
         date_time_str = f"{self.__date} {self.__time}"
         self._timestamp = datetime.strptime(date_time_str, '%Y-%m-%d %H:%M:%S.%f')
+        self._sniffer_index = packet_info.get('SnifferIndex', 0)
         self.__speed = float(packet_info['Speed'][:-1]) * 1000
         self.__channel = int(packet_info['Channel'])
         self.__rssi = int(packet_info['Rssi'])
-        self.__home_id = packet_info['HomeId']
-        self.__src_id = packet_info['Source']
-        self.__dst_id = packet_info['Destination']
-        self.__data = packet_info['Data']
-        self.__class = packet_info['Class']
-        self.__application = packet_info['Application']
-        self.__hex_data = packet_info['Hex Data']
-        # Remove spaces from payload to correctly count hex digit pairs
-        self.__payload = packet_info['Payload'].replace(" ", "")
-        self.__header = self.__calculate_header()
+        self.__home_id = share(packet_info['HomeId'])
+        self.__src_id = share(packet_info['Source'])
+        self.__dst_id = share(packet_info['Destination'])
+        self.__data = share(packet_info['Data'])
+        self.__class = share(packet_info['Class'])
+        self.__application = share(packet_info['Application'])
+        hex_data = packet_info['Hex Data']
+        payload = packet_info['Payload'].replace(" ", "")
+        # The header is the Hex Data up to the first match of the payload, so it is empty without a
+        # payload, and the last digit is dropped if the payload is not found.
+        header = hex_data[:hex_data.find(payload)]
+        self.__frame = self.__decode_hex(hex_data)
+        self.__payload = self.__decode_hex(payload)
+        self.__header = self.__decode_hex(header)
         self.__is_ack = packet_info['IsAck'].upper() == 'TRUE'
         self.__is_crc_ok = packet_info['IsCrcOk'].upper() == 'TRUE'
         self.__is_low = packet_info['IsLow'].upper() == 'TRUE'
         self.__is_substituted = packet_info['IsSubstituted'].upper() == 'TRUE'
         self.__is_unknown_header = packet_info['IsUnknownHeader'].upper() == 'TRUE'
         self.__is_wakeup_beam = packet_info['IsWakeupBeam'].upper() == 'TRUE'
-        self.payload_bytes = self.__calculate_payload_size()
-        self.header_bytes = self.__calculate_header_size()
+        self.payload_bytes = len(payload) // 2
+        self.header_bytes = len(hex_data) // 2 - self.payload_bytes
 
     def get_possible_flow_ids(self) -> str:
         """
@@ -53,22 +69,30 @@ class ZwavePacket(Packet):
         """
         return [f"{self.__home_id}_{self.__src_id}_{self.__dst_id}", f"{self.__home_id}_{self.__dst_id}_{self.__src_id}"]
 
-    def __calculate_payload_size(self):
-        if self.__payload is None:
-            return 0
-        return len(self.__payload) // 2
-
-    def __calculate_header_size(self):
-        hex_data_size = len(self.__hex_data) // 2
-        return hex_data_size - self.payload_bytes
-    
-    def __calculate_header(self):
-        if self.__payload is None:
-            return self.__hex_data
-        index = self.__hex_data.find(self.__payload)
-        header_data = self.__hex_data[:index]
-        return header_data
-    
+    def get_frame_key(self) -> tuple:
+        """
+        Gets the values that are equal in every copy of the same frame captured by several sniffers.
+        """
+        return (self.__home_id, self.__src_id, self.__dst_id, self.__frame)
+
+    @staticmethod
+    def __decode_hex(hex_data: str) -> Union[bytes, str]:
+        # Only a string that 'to_hex' gives back unchanged is decoded, so that two values are equal
+        # exactly when their hex strings are.
+        if len(hex_data) % 2 == 0 and hex_data == hex_data.upper():
+            try:
+                value = bytes.fromhex(hex_data)
+            except ValueError:
+                return hex_data
+            if 2 * len(value) == len(hex_data):
+                return value
+        return hex_data
+
+    @staticmethod
+    def to_hex(value: Union[bytes, str]) -> str:
+        """Get the hex string of a value of 'get_frame', 'get_frame_header' or 'get_frame_payload'"""
+        return value.hex().upper() if isinstance(value, bytes) else value
+
     def get_speed(self):
         return self.__speed
 
@@ -97,11 +121,28 @@ class ZwavePacket(Packet):
         return self.__application
 
     def get_payload(self):
-        return self.__payload
+        return self.to_hex(self.__payload)
 
     def get_header(self):
+        return self.to_hex(self.__header)
+
+    def get_frame(self) -> Union[bytes, str]:
+        """Get the decoded Hex Data of the packet, or its hex string if it is not decoded"""
+        return self.__frame
+
+    def get_frame_header(self) -> Union[bytes, str]:
+        """Get the decoded header of the packet, the frame before its payload, or its hex string if it is not decoded"""
         return self.__header
 
+    def get_frame_payload(self) -> Union[bytes, str]:
+        """Get the decoded payload of the packet, or its hex string if it is not decoded"""
+        return self.__payload
+
+    def get_hex_data_length(self) -> int:
+        """Get the number of hex digits of the Hex Data of the packet"""
+        frame = self.__frame
+        return 2 * len(frame) if isinstance(frame, bytes) else len(frame)
+
     def is_ack(self):
         return self.__is_ack
 
@@ -121,4 +162,4 @@ class ZwavePacket(Packet):
         return self.__is_wakeup_beam
 
     def get_hex_data(self):
-        return self.__hex_data
\ No newline at end of file
+        return self.to_hex(self.__frame)
\ No newline at end of file
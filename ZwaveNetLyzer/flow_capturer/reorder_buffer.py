@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import heapq
+from datetime import timedelta
+from typing import List
+
+from ..config_loader import ConfigLoader
+from .packet import Packet
+
+
+class ReorderBuffer:
+    """
+    Puts packets whose timestamps are slightly out of order, e.g. in merged or multi-threaded
+    exports, back in timestamp order.
+
+    The packets are held in a heap until the newest timestamp seen is 'max_packet_lateness'
+    seconds past theirs, so a packet may arrive up to that late and still be placed in order.
+    A packet that arrives even later, i.e. older than a packet that was already released, is
+    dropped. Packets with equal timestamps keep their arrival order.
+
+    Attributes:
+        max_packet_lateness (timedelta): How late a packet may arrive.
+        late_packets_counter (int): The number of packets that arrived out of order and were reordered.
+        dropped_packets_counter (int): The number of packets that arrived too late and were dropped.
+    """
+
+    def __init__(self, config: ConfigLoader):
+        if config.max_packet_lateness < 0:
+            raise Exception(f"Invalid max_packet_lateness: {config.max_packet_lateness}. It must be 0 or more.")
+        self.max_packet_lateness = timedelta(seconds=config.max_packet_lateness)
+        self.late_packets_counter = 0
+        self.dropped_packets_counter = 0
+        self.__heap = []
+        self.__sequence = 0
+        self.__newest_timestamp = None
+        self.__released_timestamp = None
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def push(self, packets: List[Packet]) -> List[Packet]:
+        """
+        Adds packets to the buffer.
+
+        Args:
+            packets (List[Packet]): The packets, in arrival order.
+
+        Returns:
+            List[Packet]: The packets that can no longer be preceded by a late packet, in timestamp order.
+        """
+        for packet in packets:
+            timestamp = packet.get_timestamp()
+            if self.__released_timestamp is not None and timestamp < self.__released_timestamp:
+                self.dropped_packets_counter += 1
+                continue
+            if self.__newest_timestamp is None or timestamp > self.__newest_timestamp:
+                self.__newest_timestamp = timestamp
+            elif timestamp < self.__newest_timestamp:
+                self.late_packets_counter += 1
+            heapq.heappush(self.__heap, (timestamp, self.__sequence, packet))
+            self.__sequence += 1
+        return self.__release_until(self.__newest_timestamp - self.max_packet_lateness) if self.__heap else []
+
+    def flush(self) -> List[Packet]:
+        """
+        Releases every buffered packet, at the end of the capture.
+
+        Returns:
+            List[Packet]: The buffered packets, in timestamp order.
+        """
+        return self.__release_until(None)
+
+    def __release_until(self, watermark) -> List[Packet]:
+        heap = self.__heap
+        released_packets = []
+        while heap and (watermark is None or heap[0][0] <= watermark):
+            timestamp, _, packet = heapq.heappop(heap)
+            released_packets.append(packet)
+            self.__released_timestamp = timestamp
+        return released_packets
+
+    def get_state(self) -> dict:
+        """Gets the buffered packets and the counters, so that a continued capture releases them in order."""
+        return {
+            "heap": self.__heap,
+            "sequence": self.__sequence,
+            "newest_timestamp": self.__newest_timestamp,
+            "released_timestamp": self.__released_timestamp,
+            "late_packets_counter": self.late_packets_counter,
+            "dropped_packets_counter": self.dropped_packets_counter,
+        }
+
+    def set_state(self, state: dict) -> None:
+        """Restores a state returned by 'get_state'."""
+        self.__heap = list(state["heap"])
+        self.__sequence = state["sequence"]
+        self.__newest_timestamp = state["newest_timestamp"]
+        self.__released_timestamp = state["released_timestamp"]
+        self.late_packets_counter = state["late_packets_counter"]
+        self.dropped_packets_counter = state["dropped_packets_counter"]
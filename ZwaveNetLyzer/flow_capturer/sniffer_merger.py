@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import csv
+import heapq
+from contextlib import ExitStack
+from typing import Iterator, List
+
+
+class SnifferMerger:
+    """
+    Merges the Zniffer CSV exports of several sniffers that listened at the same time into one
+    capture in timestamp order.
+
+    The files are read row by row and merged with a heap that holds the next row of each file,
+    so only one row per file is kept in memory. Each file must be in timestamp order on its own.
+    Rows with the same timestamp keep the order of the files. Every row is tagged with the index
+    of its file in the 'SnifferIndex' column.
+
+    Use it as a context manager, which opens the files on entry and closes them on exit:
+
+        with SnifferMerger(input_files) as merged_rows:
+            flow_capturer.process_packets(merged_rows)
+
+    Attributes:
+        input_files (List[str]): The CSV file of each sniffer.
+        delimiter (str): The delimiter of the CSV files.
+    """
+
+    SNIFFER_INDEX_COLUMN = "SnifferIndex"
+
+    def __init__(self, input_files: List[str], delimiter: str = ';'):
+        self.input_files = input_files
+        self.delimiter = delimiter
+        self.__exit_stack: ExitStack = None
+        self.__readers = []
+
+    def __enter__(self) -> "SnifferMerger":
+        self.__exit_stack = ExitStack()
+        self.__readers = [csv.DictReader(self.__exit_stack.enter_context(open(input_file_address, 'r')),
+                                         delimiter=self.delimiter)
+                          for input_file_address in self.input_files]
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__exit_stack.close()
+        self.__readers = []
+
+    def __iter__(self) -> Iterator[dict]:
+        tagged_readers = [self.__tag_rows(sniffer_index, reader) for sniffer_index, reader in enumerate(self.__readers)]
+        return heapq.merge(*tagged_readers, key=self.get_timestamp)
+
+    def __tag_rows(self, sniffer_index: int, reader: csv.DictReader) -> Iterator[dict]:
+        for row in reader:
+            row[self.SNIFFER_INDEX_COLUMN] = sniffer_index
+            yield row
+
+    @staticmethod
+    def get_timestamp(row: dict) -> str:
+        """Gets the "Date Time" string of a row, which sorts like its timestamp."""
+        return f"{row['Date']} {row['Time']}"
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+
+class ValueDictionary(dict):
+    """
+    The distinct values of the categorical fields of the packets of a run, such as their HomeId,
+    node ids, Data, Class and Application, which the packets share instead of keeping a copy each.
+
+    Parsing a row gives new strings for every packet, although a capture has few distinct values
+    of these fields. A packet that keeps the shared copy of a value only costs a reference, and
+    since Python strings cache their hash and compare equal by identity first, counting, grouping
+    and comparing the shared values cost about as much as integer codes would, with nothing to
+    decode when the features are written.
+
+    A ValueDictionary maps each distinct value to its shared copy, and indexing it with a new
+    value adds the value.
+    """
+
+    def __missing__(self, value: str) -> str:
+        self[value] = value
+        return value
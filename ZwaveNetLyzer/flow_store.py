@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import gzip
+import pickle
+from typing import List
+
+from .config_loader import ConfigLoader, ZwaveConfigLoader
+from .flow_capturer import Flow, FlowFactory
+from .flow_capturer.packets import ZwavePacket
+from .protocols import Protocols
+
+
+class FlowStore:
+    """
+    Saves assembled flows so that their features can be extracted again without reading and
+    assembling the input.
+
+    The packets of every flow are stored column by column, in flow order, with one column per
+    parsed packet attribute; equal values of a column are shared, so repeated identifiers and
+    flags are written once. Each flow is stored as its protocol, the position and number of its
+    packets in the columns and its termination reason, together with the flow settings needed
+    to rebuild it. The file is a gzip-compressed pickle.
+
+    Attributes:
+        flow_store_file_address (str): The file the flows are kept in.
+    """
+
+    PACKET_CLASSES = {
+        Protocols.Zwave: ZwavePacket,
+    }
+    FLOW_SETTINGS = ["zwave_activity_timeout", "max_zwave_flow_duration", "max_packets_per_flow",
+                     "packet_sampling_interval"]
+
+    def __init__(self, flow_store_file_address: str):
+        self.flow_store_file_address = flow_store_file_address
+
+    def save(self, flows: List[Flow], config: ConfigLoader) -> None:
+        """
+        Saves the flows.
+
+        Args:
+            flows (List[Flow]): The assembled flows.
+            config (ConfigLoader): The configuration the flows were assembled with.
+        """
+        packet_columns = {}
+        shared_values = {}
+        flow_boundaries = []
+        for flow in flows:
+            columns = packet_columns.setdefault(flow.get_protocol(), {})
+            packets = flow.get_packets()
+            start = len(next(iter(columns.values()), []))
+            for packet in packets:
+                for attribute, value in packet.get_state().items():
+                    if isinstance(value, (str, bytes, bool, int, float)):
+                        value = shared_values.setdefault((type(value), value), value)
+                    columns.setdefault(attribute, []).append(value)
+            flow_boundaries.append((flow.get_protocol(), start, len(packets), flow.get_termination_reason()))
+
+        with gzip.open(self.flow_store_file_address, 'wb', compresslevel=6) as flow_store_file:
+            pickle.dump({
+                "flow_settings": {name: getattr(config, name) for name in self.FLOW_SETTINGS},
+                "packet_columns": packet_columns,
+                "flows": flow_boundaries,
+            }, flow_store_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self) -> List[Flow]:
+        """
+        Loads the saved flows.
+
+        Returns:
+            List[Flow]: The flows, in the order they were saved.
+        """
+        with gzip.open(self.flow_store_file_address, 'rb') as flow_store_file:
+            flow_store = pickle.load(flow_store_file)
+
+        config = ZwaveConfigLoader(**flow_store["flow_settings"])
+        packets = {}
+        for protocol, columns in flow_store["packet_columns"].items():
+            packet_class = self.PACKET_CLASSES[protocol]
+            attributes = list(columns.keys())
+            packets[protocol] = [packet_class.from_state(dict(zip(attributes, values)))
+                                 for values in zip(*columns.values())]
+
+        flows = []
+        for protocol, start, number_of_packets, termination_reason in flow_store["flows"]:
+            flow_packets = packets[protocol][start:start + number_of_packets]
+            flow = FlowFactory.create(packet=flow_packets[0], config=config)
+            for packet in flow_packets[1:]:
+                flow.add_packet(packet)
+            flow.set_termination_reason(termination_reason)
+            flows.append(flow)
+        return flows
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+
+import argparse
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, TextIO
+
+from .flow_capturer.csv_packet_reader import ZNIFFER_COLUMNS
+
+
+DEFAULT_FRAME_TYPE_MIX = {
+    "SINGLECAST": 0.6,
+    "TRANSFER_ACKNOWLEDGE": 0.3,
+    "MULTICAST": 0.03,
+    "BROADCAST": 0.05,
+    "EXPLORER_AUTOINCLUSION": 0.02,
+}
+
+COMMAND_CLASSES = {
+    "BASIC": ("20", ["SET", "GET", "REPORT"]),
+    "SWITCH_BINARY": ("25", ["SET", "GET", "REPORT"]),
+    "SWITCH_MULTILEVEL": ("26", ["SET", "GET", "REPORT"]),
+    "SENSOR_MULTILEVEL": ("31", ["GET", "REPORT"]),
+    "METER": ("32", ["GET", "REPORT"]),
+    "NOTIFICATION": ("71", ["GET", "REPORT"]),
+    "BATTERY": ("80", ["GET", "REPORT"]),
+    "WAKE_UP": ("84", ["NOTIFICATION", "NO_MORE_INFORMATION"]),
+    "NO_OPERATION": ("00", [""]),
+}
+
+COMMAND_CODES = {"SET": "01", "GET": "02", "REPORT": "03", "NOTIFICATION": "07", "NO_MORE_INFORMATION": "08", "": ""}
+
+SPEEDS = [("100K", 0), ("40K", 1), ("9.6K", 2)]
+
+# Frames at 100 kbit/s end with a CRC-16, slower ones with an 8-bit checksum.
+CHECKSUM_BYTES = {"100K": 2, "40K": 1, "9.6K": 1}
+
+
+class ZnifferTraceGenerator:
+    """
+    A deterministic generator of synthetic Zniffer CSV traces for scale and memory testing.
+
+    The generated rows have the columns that ZwavePacket consumes, plus the ApiType column used
+    to detect the protocol. Traffic is made of conversations between two nodes of the same
+    home. Each conversation is a burst of frames whose length follows 'flow_length_distribution',
+    and several conversations are interleaved, as on a real network. Frames end with a CRC-16 at
+    100 kbit/s and with an 8-bit checksum otherwise, and only the acknowledgements are marked
+    IsAck. Rows are produced one by one, so traces of any size can be written in constant memory.
+
+    Attributes:
+        seed (int): The seed of the random generator. The same parameters and seed give the same trace.
+        number_of_homes (int): The number of Z-Wave networks (home ids).
+        nodes_per_home (int): The number of nodes of each home.
+        packet_rate (float): The mean number of packets per second over the whole trace.
+        flow_length_mean (float): The mean number of packets of a conversation.
+        flow_length_distribution (str): "geometric", "uniform" or "fixed".
+        frame_type_mix (Dict[str, float]): The relative weight of each frame type of the Data column.
+        concurrent_conversations (int): The number of conversations interleaved at any time.
+        start_time (datetime): The timestamp of the first packet.
+    """
+
+    def __init__(self, seed: int = 0, number_of_homes: int = 1, nodes_per_home: int = 10,
+                 packet_rate: float = 10.0, flow_length_mean: float = 20.0,
+                 flow_length_distribution: str = "geometric", frame_type_mix: Dict[str, float] = None,
+                 concurrent_conversations: int = 4, start_time: datetime = datetime(2024, 1, 1)):
+        if flow_length_distribution not in ("geometric", "uniform", "fixed"):
+            raise ValueError(f"Unknown flow length distribution: {flow_length_distribution}")
+        self.seed = seed
+        self.number_of_homes = number_of_homes
+        self.nodes_per_home = nodes_per_home
+        self.packet_rate = packet_rate
+        self.flow_length_mean = flow_length_mean
+        self.flow_length_distribution = flow_length_distribution
+        self.frame_type_mix = frame_type_mix or DEFAULT_FRAME_TYPE_MIX
+        self.concurrent_conversations = concurrent_conversations
+        self.start_time = start_time
+
+    def write(self, output_file: TextIO, number_of_rows: int) -> None:
+        """
+        Writes a trace with a header row and the given number of packet rows.
+
+        Args:
+            output_file (TextIO): The file to write the trace to.
+            number_of_rows (int): The number of packet rows.
+        """
+        output_file.write(";".join(ZNIFFER_COLUMNS) + "\n")
+        output_file.writelines(";".join(row) + "\n" for row in self.rows(number_of_rows))
+
+    def rows(self, number_of_rows: int) -> Iterator[List[str]]:
+        """
+        Generates the packet rows of the trace, in timestamp order.
+
+        Args:
+            number_of_rows (int): The number of packet rows.
+
+        Yields:
+            List[str]: The values of a row, in the order of ZNIFFER_COLUMNS.
+        """
+        rng = random.Random(self.seed)
+        homes = self.__create_homes(rng)
+        frame_types = list(self.frame_type_mix.keys())
+        frame_type_weights = list(self.frame_type_mix.values())
+        conversations = [self.__new_conversation(rng, homes) for _ in range(self.concurrent_conversations)]
+
+        day = self.start_time.date()
+        date_string = day.isoformat()
+        start_of_day = datetime.combine(day, datetime.min.time())
+        microseconds = int((self.start_time - start_of_day).total_seconds() * 1_000_000)
+        mean_gap = 1_000_000 / self.packet_rate
+
+        for _ in range(number_of_rows):
+            microseconds += max(1, int(rng.expovariate(1.0) * mean_gap))
+            if microseconds >= 86_400_000_000:
+                days, microseconds = divmod(microseconds, 86_400_000_000)
+                day += timedelta(days=days)
+                date_string = day.isoformat()
+            seconds, micro = divmod(microseconds, 1_000_000)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            time_string = f"{hour:02d}:{minute:02d}:{second:02d}.{micro:06d}"
+
+            index = rng.randrange(len(conversations))
+            conversation = conversations[index]
+            conversation["remaining"] -= 1
+            if conversation["remaining"] <= 0:
+                conversations[index] = self.__new_conversation(rng, homes)
+            yield self.__frame(rng, conversation, date_string, time_string,
+                               rng.choices(frame_types, frame_type_weights)[0])
+
+    def __create_homes(self, rng: random.Random) -> List[dict]:
+        homes = []
+        for _ in range(self.number_of_homes):
+            nodes = []
+            for node_id in range(1, self.nodes_per_home + 1):
+                speed, channel = rng.choice(SPEEDS)
+                nodes.append({"id": f"{node_id:02X}", "speed": speed, "channel": str(channel),
+                              "rssi": rng.randint(-95, -40)})
+            homes.append({"home_id": f"{rng.getrandbits(32):08X}", "nodes": nodes})
+        return homes
+
+    def __new_conversation(self, rng: random.Random, homes: List[dict]) -> dict:
+        home = rng.choice(homes)
+        source, destination = rng.sample(home["nodes"], 2) if len(home["nodes"]) > 1 else home["nodes"] * 2
+        command_class = rng.choice(list(COMMAND_CLASSES.keys()))
+        if self.flow_length_distribution == "fixed":
+            length = max(1, int(self.flow_length_mean))
+        elif self.flow_length_distribution == "uniform":
+            length = rng.randint(1, max(1, int(2 * self.flow_length_mean - 1)))
+        else:
+            length = 1 + int(rng.expovariate(1.0 / max(self.flow_length_mean - 1, 1e-9)))
+        return {"home_id": home["home_id"], "source": source, "destination": destination,
+                "command_class": command_class, "remaining": length}
+
+    def __frame(self, rng: random.Random, conversation: dict, date_string: str, time_string: str,
+                frame_type: str) -> List[str]:
+        source, destination = conversation["source"], conversation["destination"]
+        if rng.random() < 0.5:
+            source, destination = destination, source
+        if frame_type in ("BROADCAST", "EXPLORER_AUTOINCLUSION"):
+            destination = {"id": "FF"}
+
+        if frame_type == "TRANSFER_ACKNOWLEDGE":
+            command_class, application, payload = "", "", ""
+        else:
+            command_class = conversation["command_class"]
+            class_code, commands = COMMAND_CLASSES[command_class]
+            application = rng.choice(commands)
+            parameters = "".join(f"{rng.getrandbits(8):02X}" for _ in range(rng.randint(0, 4)))
+            payload = class_code + COMMAND_CODES[application] + parameters
+
+        checksum_bytes = CHECKSUM_BYTES[source["speed"]]
+        header = conversation["home_id"] + source["id"] + f"{rng.getrandbits(8):02X}" + "01" \
+            + f"{9 + len(payload) // 2 + checksum_bytes:02X}" + destination["id"]
+        hex_data = header + payload + f"{rng.getrandbits(8 * checksum_bytes):0{2 * checksum_bytes}X}"
+        return [
+            date_string,
+            time_string,
+            source["speed"],
+            source["channel"],
+            str(source["rssi"] + rng.randint(-3, 3)),
+            conversation["home_id"],
+            source["id"],
+            destination["id"],
+            frame_type,
+            command_class,
+            application,
+            hex_data,
+            " ".join(payload[i:i + 2] for i in range(0, len(payload), 2)),
+            "True" if frame_type == "TRANSFER_ACKNOWLEDGE" else "False",
+            "False" if rng.random() < 0.005 else "True",
+            "True" if rng.random() < 0.01 else "False",
+            "True" if rng.random() < 0.005 else "False",
+            "True" if rng.random() < 0.002 else "False",
+            "True" if frame_type == "BROADCAST" and rng.random() < 0.1 else "False",
+            "Zniffer",
+        ]
+
+
+def args_parser() -> argparse.ArgumentParser:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: An ArgumentParser object.
+    """
+    parser = argparse.ArgumentParser(prog='ZwaveNetLyzer-trace-generator',
+                                     description='Generate a synthetic Zniffer CSV trace.')
+    parser.add_argument('output_file', help='The CSV file to write.')
+    parser.add_argument('-n', '--rows', type=int, default=100000, help='Number of packet rows.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random generator.')
+    parser.add_argument('--homes', type=int, default=1, help='Number of homes.')
+    parser.add_argument('--nodes-per-home', type=int, default=10, help='Number of nodes per home.')
+    parser.add_argument('--packet-rate', type=float, default=10.0, help='Mean packets per second.')
+    parser.add_argument('--flow-length-mean', type=float, default=20.0, help='Mean packets per conversation.')
+    parser.add_argument('--flow-length-distribution', default='geometric',
+                        choices=['geometric', 'uniform', 'fixed'], help='Distribution of conversation lengths.')
+    parser.add_argument('--frame-type-mix', action='append', metavar='TYPE=WEIGHT',
+                        help='Weight of a frame type of the Data column, e.g. BROADCAST=0.2. Can be repeated.')
+    return parser
+
+
+def main() -> None:
+    """The main function of the trace generator."""
+    parsed_args = args_parser().parse_args()
+    frame_type_mix = None
+    if parsed_args.frame_type_mix:
+        frame_type_mix = {}
+        for item in parsed_args.frame_type_mix:
+            frame_type, weight = item.split("=")
+            frame_type_mix[frame_type] = float(weight)
+    generator = ZnifferTraceGenerator(seed=parsed_args.seed,
+                                      number_of_homes=parsed_args.homes,
+                                      nodes_per_home=parsed_args.nodes_per_home,
+                                      packet_rate=parsed_args.packet_rate,
+                                      flow_length_mean=parsed_args.flow_length_mean,
+                                      flow_length_distribution=parsed_args.flow_length_distribution,
+                                      frame_type_mix=frame_type_mix)
+    with open(parsed_args.output_file, 'w', newline='', buffering=1 << 20) as output_file:
+        generator.write(output_file, parsed_args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,19 +7,20 @@ from .strategy import Strategy
 class CSVWriter(Strategy):
     """A class to write data to a CSV file."""
 
-    def write(self, file_address: str, data: list):
+    def write(self, file_address: str, data: list, writing_mode: str = 'w'):
         """Write data to a CSV file with the given file address.
 
         Args:
             file_address (str): The file address to write the data to.
             data (list): A list of dictionaries containing the data to be written.
+            writing_mode (str): 'w' to write a new file with a header row, 'a' to append rows to it.
 
         Returns:
             None.
         """
 
-        writing_mode = 'w'
         with open(file_address, writing_mode, newline='') as f:
             writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
+            if writing_mode == 'w':
+                writer.writeheader()
             writer.writerows(data)
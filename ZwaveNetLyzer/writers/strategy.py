@@ -4,6 +4,6 @@ from abc import ABC, abstractmethod
 
 class Strategy(ABC):
     @abstractmethod
-    def write(self, file_address: str, data: list) -> None:
+    def write(self, file_address: str, data: list, writing_mode: str = 'w') -> None:
         pass
 
@@ -12,5 +12,5 @@ class Writer(object):
         else:
             self.strategy = CSVWriter()
 
-    def write(self, file_address: str, data: list):
-        self.strategy.write(file_address, data)
\ No newline at end of file
+    def write(self, file_address: str, data: list, writing_mode: str = 'w'):
+        self.strategy.write(file_address, data, writing_mode)
\ No newline at end of file
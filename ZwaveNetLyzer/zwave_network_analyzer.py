@@ -1,39 +1,431 @@
 #!/usr/bin/python3
 
+import copy
+import csv
+import logging
+import os
 import warnings
-from .flow_capturer import ZwaveFlowCapturer
+from .flow_capturer import PacketFilter, PacketSampler, SnifferMerger, ValueDictionary, ZwaveFlowCapturer
+from .flow_capturer.packet_factory import PacketFactory
 from .feature_extractor import FeatureExtractor
 from .writers import Writer, CSVWriter
 from .config_loader import ZwaveConfigLoader
+from .checkpoint import Checkpoint
+from .flow_store import FlowStore
+
+logger = logging.getLogger(__name__)
+
+
+def analyze_input_file(zwave_config: ZwaveConfigLoader, input_file_address,
+                       output_file_address: str = None) -> dict:
+    """
+    Capture the flows of an input file and extract their features.
+
+    This is a module level function so that it can be sent to worker processes.
+
+    If the flow table is bounded with 'max_ongoing_flows' or 'max_flow_table_bytes' and the
+    results are written to a file, the features of the finished and evicted flows are written
+    every 'checkpoint_interval' packets (see analyze_in_chunks), so the memory of the run stays
+    bounded however many flows the input has. This is not possible with a flow store, snapshots
+    or merged sniffer files, which keep every flow, or when the results are returned.
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The loaded configuration.
+        input_file_address (str or list): The input file to analyze, or a list of files that are
+            read in order, or merged with the "merge" input files mode, as a single capture.
+        output_file_address (str): If given, the results are written to this file instead of being returned.
+
+    Returns:
+        dict: The extracted features of each protocol, or None if they were written to a file.
+    """
+    warnings.filterwarnings("ignore")
+    file_config = copy.copy(zwave_config)
+    file_config.input_file_address = input_file_address
+    logger.info(f">> Analyzing the {input_file_address}...")
+    if file_config.checkpoint_file is not None and file_config.input_files_mode == "merge":
+        logger.warning(">> Checkpoints are not supported with merged sniffer files and are disabled.")
+        file_config.checkpoint_file = None
+    is_snapshotting = bool(file_config.snapshot_interval_packets or file_config.snapshot_interval_seconds)
+    if is_snapshotting and (file_config.snapshot_output_file is None or file_config.checkpoint_file is not None):
+        logger.warning(">> Snapshots are only taken with a snapshot_output_file and without checkpoints.")
+        file_config.snapshot_interval_packets = file_config.snapshot_interval_seconds = 0
+    if file_config.statistics_mode == "approximate" \
+            and not (file_config.snapshot_interval_packets or file_config.snapshot_interval_seconds):
+        logger.warning(">> The approximate statistics_mode only applies to snapshots, the features are exact.")
+    if file_config.checkpoint_file is not None and output_file_address is not None:
+        if file_config.flow_store_output_file is not None:
+            logger.warning(">> The flow store is not saved when checkpoints are enabled.")
+        analyze_in_chunks(file_config, output_file_address)
+        return None
+    if (file_config.max_ongoing_flows or file_config.max_flow_table_bytes) and output_file_address is not None \
+            and file_config.flow_store_output_file is None and file_config.input_files_mode != "merge" \
+            and not (file_config.snapshot_interval_packets or file_config.snapshot_interval_seconds):
+        # The finished and evicted flows are written as they finish, so that they do not pile up.
+        analyze_in_chunks(file_config, output_file_address)
+        return None
+    flow_capturer = ZwaveFlowCapturer(zwave_config=file_config)
+    flows = flow_capturer.capture()
+    if file_config.flow_store_output_file is not None:
+        FlowStore(file_config.flow_store_output_file).save(flows, file_config)
+        logger.info(f">> {len(flows)} flows saved to {file_config.flow_store_output_file}")
+    if flow_capturer.flow_snapshotter is not None:
+        write_data(flow_capturer.flow_snapshotter.snapshots, file_config.snapshot_output_file)
+        logger.info(f">> {flow_capturer.flow_snapshotter.snapshots_counter} snapshots written to "
+                    f"{file_config.snapshot_output_file}")
+    data = FeatureExtractor.execute(flows=flows,
+                                    floating_point_unit=file_config.floating_point_unit,
+                                    features_ignore_list=file_config.features_ignore_list,
+                                    label=file_config.label,
+                                    feature_families=file_config.feature_families)
+    if output_file_address is None:
+        return data
+    write_data(data, output_file_address)
+    return None
+
+
+def analyze_in_chunks(zwave_config: ZwaveConfigLoader, output_file_address: str) -> None:
+    """
+    Capture the flows of the configured input and write the features of the flows finished so far
+    every 'checkpoint_interval' packets, so that the finished flows are not kept until the end of
+    the capture. The output is the same as the one of 'analyze_input_file'.
+
+    If 'checkpoint_file' is set, a checkpoint is saved after each chunk, and if a checkpoint of an
+    interrupted run exists, the analysis resumes from it and the output is the same as the one of
+    an uninterrupted run.
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The loaded configuration.
+        output_file_address (str): The output file address.
+    """
+    checkpoint = Checkpoint(zwave_config.checkpoint_file) if zwave_config.checkpoint_file is not None else None
+    input_files = zwave_config.get_input_files()
+    flow_capturer = ZwaveFlowCapturer(zwave_config=zwave_config)
+    file_index, input_offset, output_position = 0, 0, 0
+    if checkpoint is not None and checkpoint.exists():
+        saved_checkpoint = checkpoint.load()
+        if saved_checkpoint["input_files"] != input_files:
+            raise Exception(f"The checkpoint {zwave_config.checkpoint_file} belongs to another input.")
+        file_index = saved_checkpoint["file_index"]
+        input_offset = saved_checkpoint["input_offset"]
+        output_position = saved_checkpoint["output_position"]
+        flow_capturer.set_state(saved_checkpoint["flow_state"])
+        if os.path.exists(output_file_address):
+            with open(output_file_address, 'r+b') as output_file:
+                output_file.truncate(output_position)
+        logger.info(f">> Resuming from the checkpoint after {flow_capturer.packets_counter} packets...")
+    elif zwave_config.flow_state_input_file is not None:
+        flow_capturer.load_state(zwave_config.flow_state_input_file)
+
+    def write_finished_flows() -> int:
+        data = FeatureExtractor.execute(flows=flow_capturer.finished_flows,
+                                        floating_point_unit=zwave_config.floating_point_unit,
+                                        features_ignore_list=zwave_config.features_ignore_list,
+                                        label=zwave_config.label,
+                                        feature_families=zwave_config.feature_families)
+        flow_capturer.finished_flows = []
+        write_data(data, output_file_address, writing_mode='w' if output_position == 0 else 'a')
+        return os.path.getsize(output_file_address) if os.path.exists(output_file_address) else 0
+
+    for file_index, input_offset in flow_capturer.capture_in_chunks(zwave_config.checkpoint_interval,
+                                                                     file_index, input_offset):
+        output_position = write_finished_flows()
+        if checkpoint is not None:
+            checkpoint.save({
+                "input_files": input_files,
+                "file_index": file_index,
+                "input_offset": input_offset,
+                "flow_state": flow_capturer.get_state(),
+                "output_position": output_position,
+            })
+    flow_capturer.finish_capture()
+    write_finished_flows()
+    if checkpoint is not None:
+        checkpoint.remove()
+
+
+def analyze_flow_store(zwave_config: ZwaveConfigLoader, output_file_address: str) -> None:
+    """
+    Extract the features of the flows saved in 'flow_store_input_file' and write them.
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The loaded configuration.
+        output_file_address (str): The output file address.
+    """
+    flow_store_files = zwave_config.flow_store_input_file
+    if isinstance(flow_store_files, str):
+        flow_store_files = [flow_store_files]
+    flows = []
+    for flow_store_file in flow_store_files:
+        flows.extend(FlowStore(flow_store_file).load())
+        logger.info(f">> Flows loaded from {flow_store_file}")
+    logger.info(f">> {len(flows)} flows loaded in total.")
+    data = FeatureExtractor.execute(flows=flows,
+                                    floating_point_unit=zwave_config.floating_point_unit,
+                                    features_ignore_list=zwave_config.features_ignore_list,
+                                    label=zwave_config.label,
+                                    feature_families=zwave_config.feature_families)
+    write_data(data, output_file_address)
+
+
+def read_packet_store(zwave_config: ZwaveConfigLoader, input_files: list = None) -> list:
+    """
+    Parse input files, in order, into a list of the packet lists returned by PacketFactory.create.
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The loaded configuration.
+        input_files (list): The input files to parse. Defaults to every input file of the configuration.
+
+    Returns:
+        list: The parsed packets of the input files, as a single capture.
+    """
+    packet_store = []
+    value_dictionary = ValueDictionary()
+    packet_filter = PacketFilter(zwave_config)
+    packet_sampler = PacketSampler(zwave_config)
+    if input_files is None:
+        input_files = zwave_config.get_input_files()
+
+    def parse_rows(rows) -> None:
+        if packet_filter.is_active():
+            rows = filter(packet_filter.accepts, rows)
+        if packet_sampler.is_active():
+            rows = filter(packet_sampler.accepts, rows)
+        packet_store.extend(PacketFactory.create(raw_packet=row, value_dictionary=value_dictionary) for row in rows)
+
+    if zwave_config.input_files_mode == "merge":
+        with SnifferMerger(input_files) as merged_rows:
+            parse_rows(merged_rows)
+        logger.info(f">> End of reading from {len(merged_rows.input_files)} merged sniffer files")
+        return packet_store
+    for input_file_address in input_files:
+        with open(input_file_address, 'r') as csv_file:
+            parse_rows(csv.DictReader(csv_file, delimiter=';'))
+        logger.info(f">> End of reading from {input_file_address}")
+    return packet_store
+
+
+sweep_packet_stores: list = None
+
+
+def set_sweep_packet_stores(packet_stores: list) -> None:
+    """Keep the parsed packets in a worker process so that they are sent to it only once."""
+    global sweep_packet_stores
+    sweep_packet_stores = packet_stores
+
+
+def analyze_packet_store(zwave_config: ZwaveConfigLoader, output_file_address: str = None,
+                         packet_store: list = None, packet_store_index: int = 0) -> dict:
+    """
+    Assemble the flows of parsed packets with the given configuration and extract their features.
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The configuration of the flow capturer and the feature extractor.
+        output_file_address (str): If given, the results are written to this file instead of being returned.
+        packet_store (list): The parsed packets. Defaults to the packets of the capture at
+            'packet_store_index' among those set by 'set_sweep_packet_stores'.
+        packet_store_index (int): The index of the capture among the packet stores of the sweep.
+
+    Returns:
+        dict: The extracted features of each protocol, or None if they were written to a file.
+    """
+    warnings.filterwarnings("ignore")
+    if packet_store is None:
+        packet_store = sweep_packet_stores[packet_store_index]
+    flow_capturer = ZwaveFlowCapturer(zwave_config=zwave_config)
+    flows = flow_capturer.process_parsed_packets(packet_store)
+    data = FeatureExtractor.execute(flows=flows,
+                                    floating_point_unit=zwave_config.floating_point_unit,
+                                    features_ignore_list=zwave_config.features_ignore_list,
+                                    label=zwave_config.label,
+                                    feature_families=zwave_config.feature_families)
+    if output_file_address is None:
+        return data
+    write_data(data, output_file_address)
+    logger.info(f">> Results written to {output_file_address}")
+    return None
+
+
+# The options applied while the input is parsed, which a sweep cannot vary.
+SWEEP_PARSING_OPTIONS = {"filter_home_ids", "filter_node_ids", "filter_start_time", "filter_end_time",
+                         "filter_channels", "filter_frame_types", "flow_sampling_rate", "flow_sampling_seed",
+                         "packet_sampling_interval", "input_files_mode", "output_mode"}
+
+
+def run_sweep(zwave_config: ZwaveConfigLoader) -> None:
+    """
+    Parse the input once and assemble and extract its flows once per configuration of 'sweep',
+    in parallel if more than one worker is configured. Snapshots of open flows are not taken.
+
+    The input files are read as in a run without a sweep: with the "independent" input files mode,
+    each file is parsed and assembled as a separate capture, and the results of a configuration
+    are written to one combined file in input order, or to one file per input file with the
+    "per_file" output mode, named like the output files of the run (see get_output_file_address).
+
+    Args:
+        zwave_config (ZwaveConfigLoader): The loaded configuration with the 'sweep' option.
+    """
+    configs = []
+    for sweep_options in zwave_config.sweep:
+        parsing_options = SWEEP_PARSING_OPTIONS.intersection(sweep_options)
+        if parsing_options:
+            raise Exception(f"The sweep cannot change {', '.join(sorted(parsing_options))}, since the input is "
+                            "parsed once for every configuration. Please set them outside of the sweep.")
+        sweep_config = copy.copy(zwave_config)
+        sweep_config.set_options(**sweep_options)
+        sweep_config.sweep = None
+        sweep_config.flow_state_output_file = None
+        sweep_config.snapshot_interval_packets = sweep_config.snapshot_interval_seconds = 0
+        sweep_config.output_file_address = zwave_config.get_sweep_output_file_address(sweep_options)
+        configs.append(sweep_config)
+
+    input_files = zwave_config.get_input_files()
+    is_independent = zwave_config.input_files_mode == "independent" and len(input_files) > 1
+    if is_independent:
+        packet_stores = [read_packet_store(zwave_config, [input_file]) for input_file in input_files]
+        input_names = zwave_config.get_input_names(input_files)
+    else:
+        packet_stores = [read_packet_store(zwave_config, input_files)]
+    per_file = is_independent and zwave_config.output_mode == "per_file"
+    logger.info(f">> {sum(map(len, packet_stores))} packets of {len(packet_stores)} captures parsed for "
+                f"{len(configs)} configurations.")
+
+    # One task per configuration and capture. The results of the captures of a configuration are
+    # returned and combined, unless they are written to their own files.
+    task_configs, task_output_files, task_indexes = [], [], []
+    for sweep_config in configs:
+        for index in range(len(packet_stores)):
+            task_configs.append(sweep_config)
+            task_indexes.append(index)
+            if per_file:
+                task_output_files.append(sweep_config.get_output_file_address(input_files[index], input_names[index]))
+            else:
+                task_output_files.append(sweep_config.output_file_address if not is_independent else None)
+
+    number_of_workers = min(max(int(zwave_config.number_of_workers), 1), len(task_configs))
+    if number_of_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=number_of_workers, initializer=set_sweep_packet_stores,
+                                 initargs=(packet_stores,)) as executor:
+            results = list(executor.map(analyze_packet_store, task_configs, task_output_files,
+                                        [None] * len(task_configs), task_indexes))
+    else:
+        results = [analyze_packet_store(task_config, output_file_address, packet_stores[index])
+                   for task_config, output_file_address, index in zip(task_configs, task_output_files, task_indexes)]
+
+    if not is_independent or per_file:
+        return
+    for config_index, sweep_config in enumerate(configs):
+        combined_data = {}
+        for data in results[config_index * len(packet_stores):(config_index + 1) * len(packet_stores)]:
+            for protocol, rows in data.items():
+                combined_data.setdefault(protocol, []).extend(rows)
+        write_data(combined_data, sweep_config.output_file_address)
+        logger.info(f">> Results written to {sweep_config.output_file_address}")
+
+
+def write_data(data: dict, output_file_address: str, writing_mode: str = 'w') -> None:
+    """
+    Write the extracted features of each protocol to the output file.
+
+    Args:
+        data (dict): The extracted features of each protocol.
+        output_file_address (str): The output file address.
+        writing_mode (str): 'w' to write a new file, 'a' to append rows to it.
+    """
+    writer = Writer(CSVWriter())
+    for protocol in data.keys():
+        if len(data[protocol]) == 0:
+            continue
+        writer.write(file_address=output_file_address, data=data[protocol], writing_mode=writing_mode)
 
 
 class ZwaveNetLyzer:
     """A class to analyze a given pcap file and extract features from captured packets."""
 
-    def __init__(self, zwave_config_file_address: str):
+    def __init__(self, zwave_config_file_address: str = None, **options):
         """
         Initialize the ZwaveNetLyzer object with the given configuration file address and capturing mode.
+        Keyword options set configuration attributes and take precedence over the configuration file.
         """
-        print("You initiated ZwaveNetLyzer!")
+        logger.info("You initiated ZwaveNetLyzer!")
         self.__zwave_config_file_address = zwave_config_file_address
+        self.__options = options
         warnings.filterwarnings("ignore")
 
     def run(self):
         """
         Analyze the pcap file and extract features from captured flows.
         """
-        zwave_config = ZwaveConfigLoader(self.__zwave_config_file_address)
-        print(f">> Analyzing the {zwave_config.input_file_address}...")
-        flow_capturer = ZwaveFlowCapturer(zwave_config=zwave_config)
-        flows = flow_capturer.capture()
-        data = FeatureExtractor.execute(flows=flows,
-                                        floating_point_unit=zwave_config.floating_point_unit,
-                                        features_ignore_list=zwave_config.features_ignore_list,
-                                        label=zwave_config.label)
-        writer = Writer(CSVWriter())
-        for protocol in data.keys():
-            if len(data[protocol]) == 0:
-                continue
-            file_address = zwave_config.output_file_address
-            writer.write(file_address=file_address, data=data[protocol])
-        print(">> Results are ready!")
\ No newline at end of file
+        zwave_config = ZwaveConfigLoader(self.__zwave_config_file_address, **self.__options)
+        if zwave_config.flow_store_input_file is not None:
+            analyze_flow_store(zwave_config, zwave_config.output_file_address)
+            logger.info(">> Results are ready!")
+            return
+        input_files = zwave_config.get_input_files()
+        if len(input_files) == 0:
+            logger.info(f">> No input file found for {zwave_config.input_file_address}")
+            return
+        if zwave_config.sweep:
+            run_sweep(zwave_config)
+        elif len(input_files) == 1:
+            analyze_input_file(zwave_config, input_files[0], zwave_config.output_file_address)
+        elif zwave_config.input_files_mode in ("stitch", "merge"):
+            analyze_input_file(zwave_config, input_files, zwave_config.output_file_address)
+        else:
+            self.__run_independent_files(zwave_config, input_files)
+        logger.info(">> Results are ready!")
+
+    def __run_independent_files(self, zwave_config: ZwaveConfigLoader, input_files: list) -> None:
+        """
+        Analyze each input file as a separate capture, in parallel if more than one worker is configured.
+
+        With the "per_file" output mode each worker writes its own output file, and keeps its own
+        checkpoint if checkpoints are enabled. Otherwise the results are gathered and written to a
+        single combined file in input order, without checkpoints. Each file saves its own flow
+        store and snapshots if they are configured. The files written for an input file are named
+        after its path relative to the directory of the inputs (see
+        ZwaveConfigLoader.get_input_names), so that files with the same name in different
+        directories, e.g. one directory per home, do not overwrite each other.
+        """
+        per_file = zwave_config.output_mode == "per_file"
+        if zwave_config.checkpoint_file is not None and not per_file:
+            logger.warning(">> Checkpoints of several independent input files are only supported with the "
+                           "\"per_file\" output mode and are disabled.")
+            zwave_config = copy.copy(zwave_config)
+            zwave_config.checkpoint_file = None
+        output_files = [None] * len(input_files)
+        configs = [zwave_config] * len(input_files)
+        if per_file or zwave_config.flow_store_output_file is not None \
+                or zwave_config.snapshot_output_file is not None:
+            input_names = zwave_config.get_input_names(input_files)
+        if per_file:
+            output_files = [zwave_config.get_output_file_address(input_file, input_name)
+                            for input_file, input_name in zip(input_files, input_names)]
+        if zwave_config.flow_store_output_file is not None or zwave_config.snapshot_output_file is not None \
+                or (per_file and zwave_config.checkpoint_file is not None):
+            configs = []
+            for input_name in input_names:
+                file_config = copy.copy(zwave_config)
+                if per_file and zwave_config.checkpoint_file is not None:
+                    file_config.checkpoint_file = f"{zwave_config.checkpoint_file}_{input_name}"
+                if zwave_config.flow_store_output_file is not None:
+                    file_config.flow_store_output_file = f"{zwave_config.flow_store_output_file}_{input_name}"
+                if zwave_config.snapshot_output_file is not None:
+                    file_config.snapshot_output_file = f"{zwave_config.snapshot_output_file}_{input_name}"
+                configs.append(file_config)
+        number_of_workers = min(max(int(zwave_config.number_of_workers), 1), len(input_files))
+        if number_of_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            logger.info(f">> Analyzing {len(input_files)} files with {number_of_workers} workers...")
+            with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+                results = list(executor.map(analyze_input_file, configs, input_files, output_files))
+        else:
+            results = list(map(analyze_input_file, configs, input_files, output_files))
+
+        if per_file:
+            return
+        combined_data = {}
+        for data in results:
+            for protocol, rows in data.items():
+                combined_data.setdefault(protocol, []).extend(rows)
+        write_data(combined_data, zwave_config.output_file_address)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+"""
+End-to-end benchmark of ZwaveNetLyzer.
+
+Runs the stages of ZwaveNetLyzer.run (ingest, flow assembly, feature extraction and writing)
+over synthetic traces of increasing size, through the same code as the command line: the
+reader, filter and sampler of the input files, ZwaveFlowCapturer.process_parsed_packets with
+its reorder buffer, duplicate filter, time windows and snapshots, FeatureExtractor.execute and
+write_data. The command line parses and assembles the packets as they are read, while the
+benchmark parses the whole input before assembling it, so that the two stages are timed apart.
+Options such as window_mode can be set for the run with --option.
+
+Each size runs in a new process, whose peak resident set size is recorded for the whole run.
+The wall time, CPU time, traced memory peak (with Python 3.9 or later) and throughput of each
+stage are recorded too, and the results are appended to a JSON history file. With --compare,
+the latest run of the history is compared with an earlier one and regressions past a threshold
+make the script exit with a non-zero status.
+
+Usage:
+    python benchmarks/end_to_end.py --sizes 1000 10000 100000
+    python benchmarks/end_to_end.py --sizes 10000 --option window_mode='"sliding"' --option window_size=60
+    python benchmarks/end_to_end.py --compare --threshold 0.1
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from ZwaveNetLyzer.config_loader import ZwaveConfigLoader
+from ZwaveNetLyzer.feature_extractor import FeatureExtractor
+from ZwaveNetLyzer.flow_capturer import ZwaveFlowCapturer
+from ZwaveNetLyzer.trace_generator import ZnifferTraceGenerator
+from ZwaveNetLyzer.zwave_network_analyzer import read_packet_store, write_data
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+STAGES = ["ingest", "flow_assembly", "extraction", "writing"]
+# Metrics that regress when they grow, and those that regress when they shrink.
+STAGE_METRICS = ["wall_time", "tracemalloc_peak"]
+INVERSE_STAGE_METRICS = ["throughput"]
+RUN_METRICS = ["rss_peak"]
+DEFAULT_HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+
+
+def peak_rss_bytes() -> int:
+    """
+    Gets the peak resident set size of the process, or 0 where it is not available. It is the
+    peak of the whole life of the process, so it is read once per run.
+    """
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageTimer:
+    """
+    Measures the wall time, CPU time and traced memory peak of a stage. The traced memory peak
+    of each stage needs tracemalloc.reset_peak, which was added in Python 3.9, and is None before.
+    """
+
+    def __init__(self, name: str, results: dict, trace_memory: bool):
+        self.name = name
+        self.results = results
+        self.trace_memory = trace_memory
+
+    def __enter__(self):
+        self.trace_memory = self.trace_memory and hasattr(tracemalloc, "reset_peak")
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.results[self.name] = {
+            "wall_time": time.perf_counter() - self.wall_start,
+            "cpu_time": time.process_time() - self.cpu_start,
+            "tracemalloc_peak": tracemalloc.get_traced_memory()[1] if self.trace_memory else None,
+        }
+
+
+def run_pipeline(input_file: str, work_dir: str, trace_memory: bool, options: dict = None) -> dict:
+    """
+    Runs the stages of ZwaveNetLyzer on the given input file.
+
+    Args:
+        input_file (str): The input file.
+        work_dir (str): The directory of the configuration and output files.
+        trace_memory (bool): Whether the memory allocations are traced.
+        options (dict): Configuration options of the run, such as window_mode.
+
+    Returns:
+        dict: The measurements of each stage, the number of packets and flows and the peak
+            resident set size of the run.
+    """
+    warnings.filterwarnings("ignore")
+    config_file = os.path.join(work_dir, "config.json")
+    output_file = os.path.join(work_dir, "output.csv")
+    with open(config_file, "w") as f:
+        json.dump({"input_file_address": input_file, "output_file_address": output_file,
+                   "snapshot_output_file": os.path.join(work_dir, "snapshots.csv"), **(options or {})}, f)
+    config = ZwaveConfigLoader(config_file)
+    stages = {}
+
+    if trace_memory:
+        tracemalloc.start()
+    with StageTimer("ingest", stages, trace_memory):
+        packet_store = read_packet_store(config)
+    with StageTimer("flow_assembly", stages, trace_memory):
+        flow_capturer = ZwaveFlowCapturer(zwave_config=config)
+        flows = flow_capturer.process_parsed_packets(packet_store)
+    with StageTimer("extraction", stages, trace_memory):
+        data = FeatureExtractor.execute(flows=flows, floating_point_unit=config.floating_point_unit,
+                                        features_ignore_list=config.features_ignore_list, label=config.label,
+                                        feature_families=config.feature_families)
+    with StageTimer("writing", stages, trace_memory):
+        write_data(data, output_file)
+        if flow_capturer.flow_snapshotter is not None:
+            write_data(flow_capturer.flow_snapshotter.snapshots, config.snapshot_output_file)
+    if trace_memory:
+        tracemalloc.stop()
+
+    number_of_packets, number_of_flows = len(packet_store), len(flows)
+    for name, stage in stages.items():
+        units = number_of_packets if name in ("ingest", "flow_assembly") else number_of_flows
+        stage["throughput"] = units / stage["wall_time"] if stage["wall_time"] > 0 else None
+        stage["throughput_unit"] = "packets/s" if name in ("ingest", "flow_assembly") else "flows/s"
+    return {
+        "packets": number_of_packets,
+        "flows": number_of_flows,
+        "wall_time": sum(stage["wall_time"] for stage in stages.values()),
+        "cpu_time": sum(stage["cpu_time"] for stage in stages.values()),
+        "rss_peak": peak_rss_bytes(),
+        "stages": stages,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: list, seed: int, homes: int, trace_memory: bool, options: dict = None) -> dict:
+    warnings.filterwarnings("ignore")
+    run = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tracemalloc": trace_memory,
+        "options": options or {},
+        "results": {},
+    }
+    # A new process per size, so that its peak resident set size is the one of its run only.
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            input_file = os.path.join(work_dir, f"trace_{size}.csv")
+            with open(input_file, "w", newline="") as trace_file:
+                ZnifferTraceGenerator(seed=seed, number_of_homes=homes).write(trace_file, size)
+            with context.Pool(processes=1) as pool:
+                result = pool.apply(run_pipeline, (input_file, work_dir, trace_memory, options))
+            run["results"][str(size)] = result
+            stage_summary = ", ".join(f"{name} {stage['wall_time']:.3f}s" for name, stage in result["stages"].items())
+            print(f">> {size} packets, {result['flows']} flows: {result['wall_time']:.3f}s ({stage_summary})")
+    return run
+
+
+def load_history(history_file: str) -> list:
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file) as f:
+        return json.load(f)
+
+
+def compare_metric(size: str, scope: str, metric: str, old, new, threshold: float, regressions: list) -> None:
+    """Prints the change of a metric and adds it to 'regressions' if it is past the threshold."""
+    if not old or new is None:
+        return
+    change = (new - old) / old
+    loss = -change if metric in INVERSE_STAGE_METRICS else change
+    status = "REGRESSION" if loss > threshold else "ok"
+    print(f"{size:>10} {scope:<14} {metric:<17} {old:>14.4f} {new:>14.4f} {change:>+8.1%}  {status}")
+    if loss > threshold:
+        regressions.append(f"{size} packets, {scope} {metric}: {change:+.1%}")
+
+
+def compare_runs(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compares the wall time, traced memory peak and throughput of each size and stage of two runs,
+    and the peak resident set size of each size. A lower throughput is a regression.
+
+    Returns:
+        list: A description of each regression past the threshold.
+    """
+    regressions = []
+    if baseline.get("tracemalloc") != current.get("tracemalloc"):
+        print(">> Warning: only one of the runs traced memory allocations, which slows the stages down.")
+    if baseline.get("options", {}) != current.get("options", {}):
+        print(">> Warning: the runs were made with different options.")
+    for size, result in current["results"].items():
+        if size not in baseline["results"]:
+            continue
+        baseline_result = baseline["results"][size]
+        for stage in STAGES:
+            for metric in STAGE_METRICS + INVERSE_STAGE_METRICS:
+                compare_metric(size, stage, metric, baseline_result["stages"][stage].get(metric),
+                               result["stages"][stage].get(metric), threshold, regressions)
+        for metric in RUN_METRICS:
+            compare_metric(size, "run", metric, baseline_result.get(metric), result.get(metric), threshold,
+                           regressions)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of ZwaveNetLyzer.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Numbers of packets of the generated traces.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the trace generator.")
+    parser.add_argument("--homes", type=int, default=3, help="Number of homes of the generated traces.")
+    parser.add_argument("--no-tracemalloc", action="store_true",
+                        help="Do not trace memory allocations, which slows the stages down.")
+    parser.add_argument("--option", action="append", metavar="NAME=JSON",
+                        help="Configuration option of the run, with a JSON value. Can be repeated.")
+    parser.add_argument("--history-file", default=DEFAULT_HISTORY_FILE, help="JSON file with the run history.")
+    parser.add_argument("--compare", action="store_true",
+                        help="Compare the latest run of the history with --baseline instead of running.")
+    parser.add_argument("--baseline", type=int, default=-2,
+                        help="Index in the history of the run to compare with. Defaults to the previous run.")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative increase counted as a regression (0.1 is 10%%).")
+    args = parser.parse_args()
+
+    history = load_history(args.history_file)
+    if args.compare:
+        if len(history) < 2:
+            sys.exit("At least two runs are needed in the history to compare.")
+        regressions = compare_runs(history[args.baseline], history[-1], args.threshold)
+        if regressions:
+            print(f">> {len(regressions)} regressions past {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(">> No regressions.")
+        return
+
+    options = {}
+    for option in args.option or []:
+        name, value = option.split("=", 1)
+        options[name] = json.loads(value)
+    history.append(run_benchmarks(args.sizes, args.seed, args.homes, not args.no_tracemalloc, options))
+    with open(args.history_file, "w") as f:
+        json.dump(history, f, indent=2)
+    print(f">> Results appended to {args.history_file}")
+
+
+if __name__ == "__main__":
+    main()
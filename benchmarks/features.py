@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+"""
+Microbenchmark of each Zwave feature.
+
+Times the 'extract' method of every Feature class of ZwaveNetLyzer.features.zwave on canned
+ZwaveFlow fixtures of 1, 10, 1k and 100k packets, both unidirectional and balanced, ranks the
+features by cost and checks that their time grows linearly with the number of packets. Each
+timing is the best of several repeats, and the exponent k of time ~ n^k is fitted over all the
+sizes by least squares on log t against log n, so that the noise of one timing does not decide
+it. A feature whose exponent is above max_exponent, such as an O(n^2) implementation, is
+flagged and makes the script exit with a non-zero status. So does a feature that raises an
+exception, which is reported with its traceback.
+
+Usage:
+    python benchmarks/features.py
+    python benchmarks/features.py --sizes 1 10 1000 10000 --feature mode_speed --feature mode_rssi
+"""
+
+import argparse
+import inspect
+import json
+import math
+import os
+import random
+import sys
+import time
+import traceback
+import warnings
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from ZwaveNetLyzer.features import Feature
+from ZwaveNetLyzer.features.zwave import header_related, len_related, rate_related, time_related
+from ZwaveNetLyzer.flow_capturer.flows import ZwaveFlow
+from ZwaveNetLyzer.flow_capturer.packets import ZwavePacket
+
+FEATURE_MODULES = [header_related, len_related, rate_related, time_related]
+SHAPES = ["unidirectional", "balanced"]
+
+
+def create_flow(number_of_packets: int, shape: str, seed: int = 0) -> ZwaveFlow:
+    """
+    Creates a ZwaveFlow fixture with the given number of packets.
+
+    Args:
+        number_of_packets (int): The number of packets of the flow.
+        shape (str): "unidirectional" for packets from node 01 to node 02 only, "balanced" for
+            packets alternating between both directions.
+        seed (int): The seed of the random packet contents.
+
+    Returns:
+        ZwaveFlow: The flow fixture.
+    """
+    rng = random.Random(seed)
+    timestamp = datetime(2024, 1, 1)
+    flow = None
+    for index in range(number_of_packets):
+        timestamp += timedelta(microseconds=rng.randint(1000, 2_000_000))
+        source, destination = ("01", "02") if shape == "unidirectional" or index % 2 == 0 else ("02", "01")
+        payload = "".join(f"{rng.getrandbits(8):02X}" for _ in range(rng.randint(0, 6)))
+        packet = ZwavePacket(packet_info={
+            "Date": timestamp.strftime("%Y-%m-%d"),
+            "Time": timestamp.strftime("%H:%M:%S.%f"),
+            "Speed": rng.choice(["9.6K", "40K", "100K"]),
+            "Channel": str(rng.randint(0, 2)),
+            "Rssi": str(rng.randint(-95, -40)),
+            "HomeId": "C0FFEE01",
+            "Source": source,
+            "Destination": destination,
+            "Data": rng.choice(["SINGLECAST", "TRANSFER_ACKNOWLEDGE", "BROADCAST", "MULTICAST"]),
+            "Class": rng.choice(["BASIC", "SWITCH_BINARY", "METER", "BATTERY"]),
+            "Application": rng.choice(["SET", "GET", "REPORT"]),
+            "Hex Data": f"C0FFEE01{source}4101{10 + len(payload) // 2:02X}{destination}{payload}7F",
+            "Payload": " ".join(payload[i:i + 2] for i in range(0, len(payload), 2)),
+            "IsAck": rng.choice(["True", "False"]),
+            "IsCrcOk": "True",
+            "IsLow": "False",
+            "IsSubstituted": "False",
+            "IsUnknownHeader": "False",
+            "IsWakeupBeam": "False",
+        })
+        if flow is None:
+            flow = ZwaveFlow(zwave_packet=packet, activity_timeout=10 ** 9, max_duration=10 ** 9)
+        else:
+            flow.add_packet(packet)
+    return flow
+
+
+def collect_features() -> list:
+    """Collects an instance of every Feature class defined in the Zwave feature modules."""
+    features = {}
+    for module in FEATURE_MODULES:
+        for _, feature_class in inspect.getmembers(module, inspect.isclass):
+            if issubclass(feature_class, Feature) and feature_class.__module__ == module.__name__:
+                feature = feature_class()
+                feature.set_floating_point_unit(".4f")
+                features[feature.name] = feature
+    return list(features.values())
+
+
+def time_feature(feature: Feature, flow: ZwaveFlow, min_time: float, repeats: int = 5) -> float:
+    """
+    Times the extraction of a feature 'repeats' times, each time repeating it until 'min_time'
+    seconds have passed.
+
+    Returns:
+        float: The best mean time of one extraction in seconds.
+
+    Raises:
+        Exception: Any exception raised by the extraction.
+    """
+    best = None
+    for _ in range(repeats):
+        runs, elapsed = 0, 0.0
+        start = time.perf_counter()
+        while elapsed < min_time or runs == 0:
+            feature.extract(flow)
+            runs += 1
+            elapsed = time.perf_counter() - start
+        best = elapsed / runs if best is None else min(best, elapsed / runs)
+    return best
+
+
+def scaling_exponent(sizes: list, timings: dict) -> float:
+    """Gets the exponent k of time ~ n^k, the least squares slope of log t against log n over all the sizes."""
+    points = [(math.log(size), math.log(timings[size])) for size in sizes
+              if timings.get(size) is not None and timings[size] > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmark of each Zwave feature.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 1000, 100000],
+                        help="Numbers of packets of the flow fixtures.")
+    parser.add_argument("--shape", choices=SHAPES, action="append", help="Flow shapes to benchmark.")
+    parser.add_argument("--feature", action="append", help="Only benchmark the features with these names.")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Minimum timing duration of each measurement.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of measurements of which the best is kept.")
+    parser.add_argument("--max-exponent", type=float, default=1.3,
+                        help="Largest accepted exponent of time ~ n^k, fitted over all the sizes.")
+    parser.add_argument("--top", type=int, default=25, help="Number of the most expensive features to print.")
+    parser.add_argument("--json", help="Write all the timings to this JSON file.")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    sizes = sorted(args.sizes)
+    shapes = args.shape or SHAPES
+    features = [feature for feature in collect_features() if not args.feature or feature.name in args.feature]
+    results = {}
+    superlinear = []
+    failures = []
+    for shape in shapes:
+        flows = {size: create_flow(size, shape) for size in sizes}
+        results[shape] = {}
+        for feature in features:
+            timings, errors = {}, {}
+            for size in sizes:
+                try:
+                    timings[size] = time_feature(feature, flows[size], args.min_time, args.repeats)
+                except Exception as error:
+                    timings[size] = None
+                    errors[size] = repr(error)
+                    failures.append((shape, feature.name, size, traceback.format_exc()))
+            exponent = scaling_exponent(sizes, timings) if len(sizes) > 1 else None
+            results[shape][feature.name] = {"timings": timings, "exponent": exponent, "errors": errors}
+            if exponent is not None and exponent > args.max_exponent:
+                superlinear.append((shape, feature.name, exponent))
+
+        largest = sizes[-1]
+        ranking = sorted(results[shape].items(), key=lambda item: -(item[1]["timings"][largest] or 0))
+        print(f"\n>> {shape} flows, ranked by the time of a {largest} packets flow:")
+        print(f"{'feature':<52}" + "".join(f"{size:>12}" for size in sizes) + f"{'exponent':>10}")
+        for name, result in ranking[:args.top]:
+            cells = "".join(f"{result['timings'][size] * 1e6:>10.1f}us" if result["timings"][size] is not None
+                            else f"{'error':>12}" for size in sizes)
+            exponent = f"{result['exponent']:>10.2f}" if result["exponent"] is not None else f"{'-':>10}"
+            print(f"{name:<52}{cells}{exponent}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    for shape, name, size, formatted_traceback in failures:
+        print(f"\n>> {name} failed on the {size} packets {shape} flow:\n{formatted_traceback}", end="")
+    if superlinear:
+        print(f"\n>> {len(superlinear)} features grow faster than n^{args.max_exponent}:")
+        for shape, name, exponent in sorted(superlinear, key=lambda item: -item[2]):
+            print(f"   {name} ({shape}): n^{exponent:.2f}")
+    if failures:
+        print(f"\n>> {len(failures)} feature extractions failed.")
+    if superlinear or failures:
+        sys.exit(1)
+    print("\n>> Every feature scales linearly.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Startup-time budget check of the ZwaveNetLyzer command line.
+
+Imports ZwaveNetLyzer.__main__ in fresh interpreters with '-X importtime' and fails if the
+cumulative import time exceeds the budget, or if a module that should only be imported on
+first use (scipy, numpy, the feature families) is imported at startup. The slowest imports
+are printed to show where the time goes.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget-ms 100 --runs 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPOSITORY_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+ENTRY_MODULE = "ZwaveNetLyzer.__main__"
+DEFERRED_MODULES = ["scipy", "numpy", "concurrent.futures.process", "ZwaveNetLyzer.features.zwave.header_related",
+                    "ZwaveNetLyzer.features.zwave.len_related", "ZwaveNetLyzer.features.zwave.rate_related",
+                    "ZwaveNetLyzer.features.zwave.time_related"]
+
+
+def measure_imports() -> dict:
+    """
+    Imports the entry module in a fresh interpreter with '-X importtime'.
+
+    Returns:
+        dict: The cumulative import time in microseconds of each imported module.
+    """
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPOSITORY_DIRECTORY,
+                                                                         os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {ENTRY_MODULE}"],
+                               capture_output=True, text=True, env=environment, check=True)
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        imports[module.strip()] = int(cumulative)
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup-time budget check of the ZwaveNetLyzer command line.")
+    parser.add_argument("--budget-ms", type=float, default=150.0,
+                        help="Largest accepted import time of the command line, in milliseconds.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of interpreters; the fastest run is kept.")
+    parser.add_argument("--top", type=int, default=10, help="Number of the slowest imports to print.")
+    args = parser.parse_args()
+
+    runs = [measure_imports() for _ in range(args.runs)]
+    fastest = min(runs, key=lambda imports: imports[ENTRY_MODULE])
+    startup_ms = fastest[ENTRY_MODULE] / 1000
+    print(f">> {ENTRY_MODULE} imports in {startup_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    for module, cumulative in sorted(fastest.items(), key=lambda item: -item[1])[1:args.top + 1]:
+        print(f"   {cumulative / 1000:>8.1f} ms  {module}")
+
+    failures = []
+    if startup_ms > args.budget_ms:
+        failures.append(f"the import time {startup_ms:.1f} ms exceeds the budget of {args.budget_ms:.1f} ms")
+    for module in DEFERRED_MODULES:
+        if module in fastest:
+            failures.append(f"{module} is imported at startup")
+    if failures:
+        for failure in failures:
+            print(f">> Failure: {failure}")
+        sys.exit(1)
+    print(">> Startup is within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ setuptools.setup(
     ],
     python_requires='>=3.6',
     entry_points={
-        "console_scripts": ["zwave-netlyzer = ZwaveNetLyzer.__main__:main"]
+        "console_scripts": ["zwave-netlyzer = ZwaveNetLyzer.__main__:main",
+                            "zwave-netlyzer-generate = ZwaveNetLyzer.trace_generator:main"]
     },
 )